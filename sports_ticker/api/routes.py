@@ -68,16 +68,20 @@ def register_routes(app: Flask, application: BackendApplication) -> None:
                 for name, item in scheduler_health.items()
             }
         degraded = any(not item["healthy"] for item in providers.values())
-        return jsonify(
-            {
-                "api_version": "v2",
-                "status": "degraded" if degraded else "ok",
-                "scheduler": {
-                    "enabled": scheduler_health is not None,
-                    "providers": providers,
-                },
+        body = {
+            "api_version": "v2",
+            "status": "degraded" if degraded else "ok",
+            "scheduler": {
+                "enabled": scheduler_health is not None,
+                "providers": providers,
+            },
+        }
+        http_health = application.http_health()
+        if http_health is not None:
+            body["http"] = {
+                str(name): dict(stats) for name, stats in http_health.items()
             }
-        )
+        return jsonify(body)
 
     @app.get("/api/v2/catalog/leagues")
     def catalog_leagues():
@@ -1,19 +1,23 @@
 """Application services for the canonical ticker backend."""
 
 from .composition import BackendApplication
+from .intervals import LivenessIntervalPolicy
 from .refresh import RefreshOutcome, RefreshService, refresh_ticker
 from .runtime import BackendRuntime, WaitStop, WaitStopPrimitive
 from .scheduler import RefreshScheduler, SchedulerHealth
 from .state_store import SnapshotStore
+from .ticker_cache import TickerRecordCache
 
 __all__ = [
     "BackendApplication",
     "BackendRuntime",
+    "LivenessIntervalPolicy",
     "RefreshOutcome",
     "RefreshScheduler",
     "RefreshService",
     "SchedulerHealth",
     "SnapshotStore",
+    "TickerRecordCache",
     "WaitStop",
     "WaitStopPrimitive",
     "refresh_ticker",
@@ -21,6 +21,7 @@ from sports_ticker.projections import project_data_v2, select_display_content
 from .events import EventService, event_to_mapping
 from .scheduler import RefreshScheduler, SchedulerHealth
 from .state_store import SnapshotStore
+from .ticker_cache import TickerRecordCache
 
 
 class BackendApplication:
@@ -35,17 +36,24 @@ class BackendApplication:
         runtime: object | None = None,
         spotify_service: object | None = None,
         catalog: object | None = None,
+        http_transport: object | None = None,
+        http_cache: object | None = None,
+        caches: Mapping[str, object] | None = None,
         clock: Callable[[], float] = time.time,
         pairing_code_ttl_seconds: float = 600.0,
     ) -> None:
         """Capture infrastructure through dependency injection."""
 
         self.repository = repository
+        self.ticker_cache = TickerRecordCache(repository)
         self.snapshot_store = snapshot_store
         self.scheduler = scheduler
         self.runtime = runtime
         self.spotify_service = spotify_service
         self.catalog = catalog
+        self.http_transport = http_transport
+        self.http_cache = http_cache
+        self.caches = dict(caches or {})
         self._clock = clock
         if pairing_code_ttl_seconds <= 0:
             raise ValueError("pairing_code_ttl_seconds must be positive")
@@ -88,7 +96,7 @@ class BackendApplication:
     def get_ticker(self, ticker_id: str) -> TickerRecord | None:
         """Return one configured ticker."""
 
-        return self.repository.get_ticker(ticker_id)
+        return self.ticker_cache.get(ticker_id)
 
     def register_device(
         self,
@@ -107,7 +115,7 @@ class BackendApplication:
         profile_mapping = profile.to_mapping() if isinstance(profile, TickerProfile) else profile
         device_profile = TickerProfile.from_mapping(profile_mapping, metadata=device_metadata)
         device_metadata["profile"] = device_profile.to_mapping()
-        current = self.repository.get_ticker(identifier)
+        current = self.ticker_cache.get(identifier)
         created = False
         if current is None:
             try:
@@ -122,7 +130,7 @@ class BackendApplication:
             except ValueError as error:
                 if str(error) != f"ticker already exists: {identifier}":
                     raise
-                current = self.repository.get_ticker(identifier)
+                current = self.ticker_cache.get(identifier)
         if current is None:
             raise KeyError(identifier)
 
@@ -135,7 +143,7 @@ class BackendApplication:
             expires_at = pairing.pairing_code_expires_at if pairing is not None else None
             if not pairing_code or (expires_at is not None and self._clock() >= float(expires_at)):
                 pairing_code = self.issue_pairing_code(identifier)
-                current = self.repository.get_ticker(identifier)
+                current = self.ticker_cache.get(identifier)
                 if current is None:
                     raise KeyError(identifier)
         return current, pairing_code, created
@@ -177,14 +185,17 @@ class BackendApplication:
         group_secret = supplied_group_secret or (f"cgs_{secrets.token_urlsafe(32)}" if new_group else None)
         token = f"ctk_{secrets.token_urlsafe(32)}"
         token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
-        ticker = self.repository.exchange_pairing_code(
-            normalized_code,
-            token_hash,
-            now=self._clock(),
-            controller_group_id=group_id,
-            controller_group_secret_hash=hashlib.sha256(group_secret.encode("utf-8")).hexdigest() if group_secret else None,
+        ticker = self.ticker_cache.put(
+            self.repository.exchange_pairing_code(
+                normalized_code,
+                token_hash,
+                now=self._clock(),
+                controller_group_id=group_id,
+                controller_group_secret_hash=hashlib.sha256(group_secret.encode("utf-8")).hexdigest() if group_secret else None,
+            )
         )
         self._register_scheduler_ticker(ticker.ticker_id)
+        self._notify_ticker_changed(ticker.ticker_id)
         returned_group_id = (
             ticker.pairing.controller_group_id
             if ticker.pairing is not None and (new_group or supplied_group_id is not None)
@@ -204,6 +215,7 @@ class BackendApplication:
                     code,
                     expires_at=self._clock() + self._pairing_code_ttl_seconds,
                 )
+                self.ticker_cache.invalidate(identifier)
                 return code
             except ValueError as error:
                 if str(error) != "pairing code is already in use":
@@ -222,7 +234,7 @@ class BackendApplication:
                     code,
                     expires_at=self._clock() + self._pairing_code_ttl_seconds,
                 )
-                return result, code
+                return self.ticker_cache.put(result), code
             except ValueError as error:
                 if str(error) != "pairing code is already in use":
                     raise
@@ -247,12 +259,14 @@ class BackendApplication:
     ) -> TickerRecord:
         """Create one configured ticker."""
 
-        ticker = self.repository.create_ticker(
-            ticker_id,
-            display_settings=display_settings,
-            name=name,
-            pairing=pairing,
-            device=device,
+        ticker = self.ticker_cache.put(
+            self.repository.create_ticker(
+                ticker_id,
+                display_settings=display_settings,
+                name=name,
+                pairing=pairing,
+                device=device,
+            )
         )
         self._register_scheduler_ticker(ticker.ticker_id)
         return ticker
@@ -260,12 +274,16 @@ class BackendApplication:
     def update_ticker(self, ticker_id: str, **changes: object) -> TickerRecord:
         """Apply one validated partial ticker update."""
 
-        return self.repository.update_ticker(ticker_id, **changes)
+        ticker = self.ticker_cache.put(self.repository.update_ticker(ticker_id, **changes))
+        if "display_settings" in changes or "settings" in changes:
+            self._notify_ticker_changed(ticker.ticker_id)
+        return ticker
 
     def delete_ticker(self, ticker_id: str) -> bool:
         """Delete one configured ticker."""
 
         deleted = self.repository.delete_ticker(ticker_id)
+        self.ticker_cache.invalidate(ticker_id)
         if deleted and self.scheduler is not None:
             self.scheduler.unregister_ticker(ticker_id)
         return deleted
@@ -275,12 +293,26 @@ class BackendApplication:
 
         if self.scheduler is None or self.scheduler.has_ticker(ticker_id):
             return
-        self.scheduler.register_ticker(ticker_id, self._resolve_ticker_settings)
+        self.scheduler.register_ticker(
+            ticker_id,
+            self._resolve_ticker_settings,
+            version=self.ticker_cache.version,
+        )
+        self._notify_ticker_changed(ticker_id)
+
+    def _notify_ticker_changed(self, ticker_id: str) -> None:
+        """Have the scheduler re-read one ticker and wake the runtime for it."""
+
+        if self.scheduler is not None:
+            self.scheduler.invalidate_ticker(ticker_id)
+        wake = getattr(self.runtime, "wake", None)
+        if callable(wake):
+            wake()
 
     def _resolve_ticker_settings(self, ticker_id: str) -> DisplaySettings:
         """Read the current isolated display settings for one scheduler refresh."""
 
-        ticker = self.repository.get_ticker(ticker_id)
+        ticker = self.ticker_cache.get(ticker_id)
         if ticker is None:
             raise KeyError(f"ticker not found: {ticker_id}")
         return ticker.display_settings
@@ -303,7 +335,7 @@ class BackendApplication:
         snapshot = self.get_snapshot(identifier)
         if snapshot is None:
             raise KeyError(f"ticker snapshot not found: {identifier}")
-        ticker = self.repository.get_ticker(identifier)
+        ticker = self.ticker_cache.get(identifier)
         if ticker is None:
             raise KeyError(f"ticker not found: {identifier}")
         delayed = bool(ticker.display_settings.live_delay_mode)
@@ -387,7 +419,7 @@ class BackendApplication:
     def heartbeat(self, ticker_id: str, payload: Mapping[str, Any]) -> TickerRecord:
         """Persist one device heartbeat and return the updated ticker."""
 
-        current = self.repository.get_ticker(ticker_id)
+        current = self.ticker_cache.get(ticker_id)
         if current is None:
             raise KeyError(str(ticker_id).strip())
 
@@ -412,29 +444,31 @@ class BackendApplication:
         raw_last_seen = payload.get("last_seen_at", payload.get("last_seen"))
         last_seen = self._clock() if raw_last_seen is None else _finite_timestamp(raw_last_seen)
         device = DeviceMetadata(last_seen_at=last_seen, metadata=metadata)
-        return self.repository.update_ticker(ticker_id, device=device)
+        return self.ticker_cache.put(self.repository.update_ticker(ticker_id, device=device))
 
     def request_update(self, ticker_id: str, version: str) -> TickerRecord:
         """Persist one pending controller update for the target ticker."""
 
         identifier = str(ticker_id).strip()
-        current = self.repository.get_ticker(identifier)
+        current = self.ticker_cache.get(identifier)
         if current is None:
             raise KeyError(identifier)
         release = str(version).strip()
         if not release:
             raise ValueError("update version must not be empty")
         metadata = self._queue_command_metadata(current, "update", {"version": release})
-        return self.repository.update_ticker(
-            identifier,
-            device=DeviceMetadata(last_seen_at=current.device.last_seen_at, metadata=metadata),
+        return self.ticker_cache.put(
+            self.repository.update_ticker(
+                identifier,
+                device=DeviceMetadata(last_seen_at=current.device.last_seen_at, metadata=metadata),
+            )
         )
 
     def acknowledge_update(self, ticker_id: str, version: str) -> bool:
         """Clear the matching pending update before the Pi restarts itself."""
 
         identifier = str(ticker_id).strip()
-        current = self.repository.get_ticker(identifier)
+        current = self.ticker_cache.get(identifier)
         if current is None:
             raise KeyError(identifier)
         metadata = dict(current.device.metadata)
@@ -442,9 +476,11 @@ class BackendApplication:
         if command is None:
             return False
         self._remove_command(metadata, command["id"])
-        self.repository.update_ticker(
-            identifier,
-            device=DeviceMetadata(last_seen_at=current.device.last_seen_at, metadata=metadata),
+        self.ticker_cache.put(
+            self.repository.update_ticker(
+                identifier,
+                device=DeviceMetadata(last_seen_at=current.device.last_seen_at, metadata=metadata),
+            )
         )
         return True
 
@@ -452,20 +488,22 @@ class BackendApplication:
         """Persist one reboot command for the target controller."""
 
         identifier = str(ticker_id).strip()
-        current = self.repository.get_ticker(identifier)
+        current = self.ticker_cache.get(identifier)
         if current is None:
             raise KeyError(identifier)
         metadata = self._queue_command_metadata(current, "reboot", {})
-        return self.repository.update_ticker(
-            identifier,
-            device=DeviceMetadata(last_seen_at=current.device.last_seen_at, metadata=metadata),
+        return self.ticker_cache.put(
+            self.repository.update_ticker(
+                identifier,
+                device=DeviceMetadata(last_seen_at=current.device.last_seen_at, metadata=metadata),
+            )
         )
 
     def acknowledge_reboot(self, ticker_id: str, command_id: str) -> bool:
         """Clear one matching reboot command before the controller restarts."""
 
         identifier = str(ticker_id).strip()
-        current = self.repository.get_ticker(identifier)
+        current = self.ticker_cache.get(identifier)
         if current is None:
             raise KeyError(identifier)
         received = str(command_id).strip()
@@ -474,9 +512,11 @@ class BackendApplication:
         if command is None:
             return False
         self._remove_command(metadata, received)
-        self.repository.update_ticker(
-            identifier,
-            device=DeviceMetadata(last_seen_at=current.device.last_seen_at, metadata=metadata),
+        self.ticker_cache.put(
+            self.repository.update_ticker(
+                identifier,
+                device=DeviceMetadata(last_seen_at=current.device.last_seen_at, metadata=metadata),
+            )
         )
         return True
 
@@ -613,6 +653,20 @@ class BackendApplication:
             return None
         return self.scheduler.health
 
+    def http_health(self) -> Mapping[str, Mapping[str, int]] | None:
+        """Return shared HTTP connection, response-cache, and named cache counters."""
+
+        health = {}
+        for name, component in (
+            ("connections", self.http_transport),
+            ("responses", self.http_cache),
+            *self.caches.items(),
+        ):
+            stats = getattr(component, "stats", None)
+            if callable(stats):
+                health[name] = stats()
+        return health or None
+
     def provider_health(self) -> ProviderHealth:
         """Summarize scheduler errors for the data projection."""
 
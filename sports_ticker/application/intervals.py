@@ -0,0 +1,97 @@
+"""Choose provider refresh intervals from the liveness of their last results."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sports_ticker.providers import ProviderResult
+
+
+_LIVE_STATES = frozenset(("in", "half", "crit"))
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass(frozen=True, slots=True)
+class LivenessIntervalPolicy:
+    """Poll at ``live`` cadence during live content and back off otherwise.
+
+    The policy returns ``live`` while any item is live, starts within
+    ``lead`` seconds, or is still scheduled up to ``near_window`` seconds
+    after its start time, since feeds flip a game to live only after
+    kickoff. It returns ``near`` while the next start is within
+    ``near_window`` seconds and ``idle`` beyond that, but never sleeps past
+    the moment the next start enters the ``lead`` window. The scheduler
+    passes only successful results; a pass with none keeps the provider's
+    registered interval.
+    """
+
+    live: float
+    near: float
+    idle: float
+    lead: float = 600.0
+    near_window: float = 3 * 3600.0
+    clock: Callable[[], datetime] = _utc_now
+
+    def __post_init__(self) -> None:
+        """Reject intervals the scheduler cannot use."""
+
+        for name in ("live", "near", "idle", "lead", "near_window"):
+            value = float(getattr(self, name))
+            if not math.isfinite(value) or value <= 0:
+                raise ValueError(f"{name} must be finite and positive")
+            object.__setattr__(self, name, value)
+        if not self.live <= self.near <= self.idle:
+            raise ValueError("intervals must satisfy live <= near <= idle")
+
+    def __call__(self, results: Sequence[object]) -> float | None:
+        """Return seconds until the next refresh for one pass's results."""
+
+        if not results:
+            return None
+        now = self.clock()
+        next_start: datetime | None = None
+        for result in results:
+            if not isinstance(result, ProviderResult):
+                return self.live
+            for item in result.content:
+                state = str(item.data.get("state") or "").strip().lower()
+                if state in _LIVE_STATES:
+                    return self.live
+                if state != "pre":
+                    continue
+                starts_at = _start_time(item.data.get("startTimeUTC"))
+                if starts_at is None:
+                    continue
+                until_start = (starts_at - now).total_seconds()
+                if -self.near_window <= until_start <= self.lead:
+                    return self.live
+                if until_start > 0 and (next_start is None or starts_at < next_start):
+                    next_start = starts_at
+        if next_start is None:
+            return self.idle
+        until_start = (next_start - now).total_seconds()
+        cadence = self.near if until_start <= self.near_window else self.idle
+        return min(cadence, max(self.live, until_start - self.lead))
+
+
+def _start_time(value: object) -> datetime | None:
+    """Read one ISO start time as an aware UTC datetime."""
+
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+__all__ = ["LivenessIntervalPolicy"]
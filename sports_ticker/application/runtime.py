@@ -1,4 +1,4 @@
-"""Run scheduler passes and event cleanup on an externally owned cadence."""
+"""Run scheduler passes and event cleanup until the next scheduler deadline."""
 
 from __future__ import annotations
 
@@ -24,7 +24,11 @@ MonotonicClock: TypeAlias = Callable[[], float]
 
 
 class BackendRuntime:
-    """Own the blocking cadence around one loop-free refresh scheduler."""
+    """Own the blocking cadence around one loop-free refresh scheduler.
+
+    The runtime sleeps until the scheduler's earliest deadline, never longer
+    than ``poll_interval``, and ``wake()`` ends the current sleep early.
+    """
 
     def __init__(
         self,
@@ -54,7 +58,8 @@ class BackendRuntime:
         self.poll_interval = interval
         self._monotonic = monotonic
         self._stop_event = Event()
-        self._wait = wait or self._stop_event
+        self._wake_event = Event()
+        self._wait = wait
 
     def run_once(self) -> tuple[str, ...]:
         """Run one scheduler pass and remove expired durable events."""
@@ -76,12 +81,32 @@ class BackendRuntime:
         """Request shutdown when the runtime uses its default wait primitive."""
 
         self._stop_event.set()
+        self._wake_event.set()
+
+    def wake(self) -> None:
+        """Run the next pass now because settings or pairings changed."""
+
+        self._wake_event.set()
+
+    def next_wait(self) -> float:
+        """Return the sleep before the scheduler's earliest pending deadline."""
+
+        next_due = getattr(self.scheduler, "next_due", None)
+        deadline = next_due() if callable(next_due) else None
+        if deadline is None:
+            return self.poll_interval
+        return min(self.poll_interval, max(0.0, deadline - self._monotonic()))
 
     def _wait_for_next_pass(self) -> bool:
+        timeout = self.next_wait()
         wait = self._wait
+        if wait is None:
+            self._wake_event.wait(timeout)
+            self._wake_event.clear()
+            return self._stop_event.is_set()
         if callable(wait):
-            return bool(wait(self.poll_interval))
-        return bool(wait.wait(self.poll_interval))
+            return bool(wait(timeout))
+        return bool(wait.wait(timeout))
 
 
 __all__ = ["BackendRuntime", "MonotonicClock", "WaitStop", "WaitStopPrimitive"]
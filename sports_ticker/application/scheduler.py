@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import heapq
 import math
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from inspect import Parameter, signature
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass, field, replace
+from threading import Lock
 from datetime import datetime, timedelta, timezone
 from types import MappingProxyType
 from typing import Any, Protocol, TypeAlias
@@ -20,8 +24,11 @@ WallClock: TypeAlias = Callable[[], datetime]
 SettingsResolver: TypeAlias = Callable[
     [str], DisplaySettings | Mapping[str, object] | None
 ]
+SettingsVersion: TypeAlias = Callable[[str], object]
 ProviderSettingsKey: TypeAlias = Callable[[DisplaySettings], object]
 ProviderRefresh: TypeAlias = Callable[..., object]
+ProviderFinalize: TypeAlias = Callable[[str, DisplaySettings, object], object]
+IntervalPolicy: TypeAlias = Callable[[tuple[object, ...]], float | None]
 SnapshotRefreshCallable: TypeAlias = Callable[
     [str, DisplaySettings, Mapping[str, object]], object
 ]
@@ -56,6 +63,11 @@ class _ProviderJob:
     refresh: ProviderRefresh
     settings_key: ProviderSettingsKey
     next_due: float
+    ticker_scoped: bool = False
+    finalize: ProviderFinalize | None = None
+    timeout: float | None = None
+    concurrency: int = 1
+    interval_policy: IntervalPolicy | None = None
     data_by_ticker: Mapping[str, "_CachedProviderData"] = field(
         default_factory=dict
     )
@@ -66,14 +78,46 @@ class _ProviderJob:
 class _Ticker:
     ticker_id: str
     settings: SettingsResolver
+    version: SettingsVersion | None = None
 
 
 @dataclass(frozen=True, slots=True)
 class _CachedProviderData:
-    """Keep one provider result with the exact settings that produced it."""
+    """Keep one provider result with the exact settings that produced it.
+
+    Finalized values also keep the ticker settings and the shared value they
+    were derived from, so a per-ticker settings change can finalize again
+    without refetching.
+    """
 
     settings_key: object
     value: object
+    settings: DisplaySettings | None = None
+    shared: object = None
+
+
+@dataclass(slots=True)
+class _JobPass:
+    """Collect one due job's group outcomes until its pass completes."""
+
+    job: _ProviderJob
+    wall_due: datetime
+    groups: tuple[list[tuple[str, DisplaySettings]], ...]
+    remaining: int
+    started: float | None = None
+    errors: list[str] = field(default_factory=list)
+    success_count: int = 0
+    values: list[object] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class _GroupOutcome:
+    """Carry one shared provider call's value or failure back to the pass."""
+
+    name: str
+    members: list[tuple[str, DisplaySettings]]
+    value: object = None
+    error: Exception | None = None
 
 
 def _utc_now() -> datetime:
@@ -136,14 +180,31 @@ class RefreshScheduler:
         *,
         monotonic: MonotonicClock = time.monotonic,
         wall_clock: WallClock = _utc_now,
+        max_workers: int = 0,
     ) -> None:
-        """Capture refresh and clock ports without starting background work."""
+        """Capture refresh and clock ports without starting background work.
 
+        ``max_workers`` bounds the provider worker pool. Zero keeps every
+        provider refresh on the calling thread.
+        """
+
+        if int(max_workers) < 0:
+            raise ValueError("max_workers must not be negative")
         self._refresh_service = refresh_service
         self._monotonic = monotonic
         self._wall_clock = wall_clock
         self._providers: dict[str, _ProviderJob] = {}
         self._tickers: dict[str, _Ticker] = {}
+        self._max_workers = int(max_workers)
+        self._executor: ThreadPoolExecutor | None = None
+        self._inflight: dict[str, set[Future]] = {}
+        self._inflight_lock = Lock()
+        self._due_heap: list[tuple[float, str]] = []
+        self._dirty: set[str] = set()
+        self._expedited: set[str] = set()
+        self._dirty_lock = Lock()
+        self._settings_cache: dict[str, tuple[object, DisplaySettings]] = {}
+        self._published: dict[str, tuple[DisplaySettings, dict[str, object]]] = {}
 
     def register_provider(
         self,
@@ -152,8 +213,22 @@ class RefreshScheduler:
         refresh: ProviderRefresh,
         *,
         settings_key: ProviderSettingsKey | None = None,
+        finalize: ProviderFinalize | None = None,
+        timeout: float | None = None,
+        concurrency: int = 1,
+        interval_policy: IntervalPolicy | None = None,
     ) -> None:
-        """Register one named settings-aware provider refresh job."""
+        """Register one named settings-aware provider refresh job.
+
+        A refresh that accepts only settings runs once per distinct settings
+        key and its result is shared by every ticker with that key. The
+        optional ``finalize(ticker_id, settings, result)`` port then derives
+        each ticker's own value from the shared result. ``timeout`` bounds
+        one pass of this provider and ``concurrency`` caps its calls in flight.
+        ``interval_policy`` receives the shared results of each scheduled pass
+        and returns the seconds until the next one, or ``None`` for
+        ``interval``.
+        """
 
         provider_name = str(name).strip()
         if not provider_name:
@@ -166,6 +241,14 @@ class RefreshScheduler:
             raise TypeError("provider refresh must be callable")
         if settings_key is not None and not callable(settings_key):
             raise TypeError("settings_key must be callable")
+        if finalize is not None and not callable(finalize):
+            raise TypeError("finalize must be callable")
+        if timeout is not None and (not math.isfinite(timeout) or timeout <= 0):
+            raise ValueError("provider timeout must be finite and positive")
+        if int(concurrency) < 1:
+            raise ValueError("provider concurrency must be at least one")
+        if interval_policy is not None and not callable(interval_policy):
+            raise TypeError("interval_policy must be callable")
 
         now = self._monotonic()
         wall_now = self._wall_clock()
@@ -175,11 +258,30 @@ class RefreshScheduler:
             refresh=refresh,
             settings_key=settings_key or _all_settings_key,
             next_due=now,
+            ticker_scoped=_accepts_ticker_id(refresh),
+            finalize=finalize,
+            timeout=None if timeout is None else float(timeout),
+            concurrency=int(concurrency),
+            interval_policy=interval_policy,
             health=SchedulerHealth(next_due=wall_now),
         )
+        self._inflight[provider_name] = set()
+        heapq.heappush(self._due_heap, (now, provider_name))
+
+    def register_ticker(
+        self,
+        ticker_id: str,
+        settings: SettingsResolver,
+        *,
+        version: SettingsVersion | None = None,
+    ) -> None:
+        """Register one ticker and its effective-settings resolver.
 
-    def register_ticker(self, ticker_id: str, settings: SettingsResolver) -> None:
-        """Register one ticker and its effective-settings resolver."""
+        When ``version(ticker_id)`` is given, passes reuse the last normalized
+        settings while it returns the same value instead of resolving again,
+        and every pass treats a ticker whose version moved as invalidated.
+        Without it, callers must ``invalidate_ticker`` after each change.
+        """
 
         identifier = str(ticker_id).strip()
         if not identifier:
@@ -188,7 +290,38 @@ class RefreshScheduler:
             raise ValueError(f"ticker already registered: {identifier}")
         if not callable(settings):
             raise TypeError("ticker settings resolver must be callable")
-        self._tickers[identifier] = _Ticker(identifier, settings)
+        if version is not None and not callable(version):
+            raise TypeError("ticker settings version must be callable")
+        self._tickers[identifier] = _Ticker(identifier, settings, version)
+        self.invalidate_ticker(identifier)
+
+    def invalidate_ticker(self, ticker_id: str) -> None:
+        """Re-read one ticker's settings on the next pass instead of waiting."""
+
+        identifier = str(ticker_id).strip()
+        with self._dirty_lock:
+            self._dirty.add(identifier)
+            self._settings_cache.pop(identifier, None)
+
+    def expedite_provider(self, name: str) -> None:
+        """Run one provider on the next pass instead of at its deadline.
+
+        Safe to call from any thread, such as a source reacting to pushed data.
+        """
+
+        with self._dirty_lock:
+            self._expedited.add(str(name).strip())
+
+    def next_due(self) -> float | None:
+        """Return the monotonic time of the earliest pending pass, if any."""
+
+        with self._dirty_lock:
+            if self._dirty or self._expedited:
+                return self._monotonic()
+        heap = self._due_heap
+        while heap and not self._is_current_entry(*heap[0]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
 
     def unregister_ticker(self, ticker_id: str) -> bool:
         """Remove one ticker and every provider result scoped to that ticker."""
@@ -197,6 +330,9 @@ class RefreshScheduler:
         if identifier not in self._tickers:
             return False
         del self._tickers[identifier]
+        with self._dirty_lock:
+            self._settings_cache.pop(identifier, None)
+        self._published.pop(identifier, None)
         for name, job in self._providers.items():
             data_by_ticker = dict(job.data_by_ticker)
             data_by_ticker.pop(identifier, None)
@@ -228,116 +364,424 @@ class RefreshScheduler:
         """Run due jobs once and return ticker IDs published in this pass."""
 
         current = self._monotonic() if now is None else float(now)
-        settings_by_ticker: dict[str, DisplaySettings] = {}
-        settings_failures: set[str] = set()
-        for ticker in self._tickers.values():
-            try:
-                settings_by_ticker[ticker.ticker_id] = normalize_settings(
-                    ticker.settings(ticker.ticker_id)
-                )
-            except Exception:
-                settings_failures.add(ticker.ticker_id)
+        due_names: set[str] = set()
+        heap = self._due_heap
+        while heap and heap[0][0] <= current:
+            due_at, name = heapq.heappop(heap)
+            if self._is_current_entry(due_at, name):
+                due_names.add(name)
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+            expedited, self._expedited = self._expedited, set()
+        dirty |= self._moved_tickers(dirty)
+        due_names.update(name for name in expedited if name in self._providers)
+        if not due_names and not dirty:
+            return ()
 
-        due_by_name = {
-            job.name: job
-            for job in self._providers.values()
-            if current >= job.next_due
-        }
-        for job in self._providers.values():
-            for ticker_id, settings in settings_by_ticker.items():
+        settings_by_ticker: dict[str, DisplaySettings] = {}
+        for ticker in tuple(self._tickers.values()):
+            if not due_names and ticker.ticker_id not in dirty:
+                continue
+            settings = self._ticker_settings(ticker)
+            if settings is not None:
+                settings_by_ticker[ticker.ticker_id] = settings
+
+        stale_by_name: dict[str, dict[str, DisplaySettings]] = {}
+        refinalized = False
+        for job in tuple(self._providers.values()):
+            if job.name in due_names:
+                continue
+            for ticker_id in dirty:
+                settings = settings_by_ticker.get(ticker_id)
+                if settings is None:
+                    continue
                 cached = job.data_by_ticker.get(ticker_id)
                 if cached is None and job.health.last_success is not None:
-                    due_by_name[job.name] = job
+                    stale_by_name.setdefault(job.name, {})[ticker_id] = settings
                 elif cached is not None and cached.settings_key != _freeze(job.settings_key(settings)):
-                    due_by_name[job.name] = job
-        due = tuple(due_by_name.values())
-        if not due:
+                    stale_by_name.setdefault(job.name, {})[ticker_id] = settings
+                elif cached is not None and cached.settings != settings and job.finalize is not None:
+                    refinalized |= self._refinalize(job, ticker_id, settings, cached)
+        if not due_names and not stale_by_name and not refinalized:
             return ()
 
         wall_now = self._wall_clock()
-
-        for job in due:
-            advanced = _advance_due(job.next_due, current, job.interval)
-            wall_due = wall_now + timedelta(seconds=advanced - current)
-            updated = replace(
-                job,
-                next_due=advanced,
-                health=replace(job.health, next_due=wall_due),
-            )
-            data_by_ticker = dict(job.data_by_ticker)
-            errors: list[str] = []
-            success_count = 0
-            for ticker_id, settings in settings_by_ticker.items():
-                try:
-                    result = _run_provider_refresh(job.refresh, ticker_id, settings)
-                    ok, error = _refresh_succeeded(result)
-                    if not ok:
-                        raise RuntimeError(error or "provider refresh failed")
-                except Exception as error:
-                    message = _error_text(error)
-                    errors.append(f"{ticker_id}: {message}")
-                else:
-                    data_by_ticker[ticker_id] = _CachedProviderData(
-                        settings_key=_freeze(job.settings_key(settings)),
-                        value=_freeze(result),
-                    )
-                    success_count += 1
-
-            if errors:
-                health = SchedulerHealth(
-                    last_success=wall_now if success_count else job.health.last_success,
-                    last_error="; ".join(errors),
-                    next_due=wall_due,
-                    consecutive_failures=job.health.consecutive_failures + 1,
+        passes: dict[str, _JobPass] = {}
+        for job in tuple(self._providers.values()):
+            if job.name in due_names:
+                advanced = _advance_due(job.next_due, current, job.interval)
+                wall_due = wall_now + timedelta(seconds=advanced - current)
+                updated = replace(
+                    job,
+                    next_due=advanced,
+                    health=replace(job.health, next_due=wall_due),
                 )
+                self._providers[job.name] = updated
+                if advanced != job.next_due:
+                    heapq.heappush(heap, (advanced, job.name))
+                groups = _settings_groups(updated, settings_by_ticker)
+                started: float | None = current
+            elif job.name in stale_by_name:
+                updated = job
+                wall_due = job.health.next_due or wall_now
+                groups = _settings_groups(job, stale_by_name[job.name])
+                started = None
             else:
-                health = SchedulerHealth(
-                    last_success=wall_now,
-                    last_error=None,
-                    next_due=wall_due,
-                    consecutive_failures=0,
-                )
+                continue
+            passes[job.name] = _JobPass(updated, wall_due, groups, len(groups), started)
+        due = tuple(job_pass.job for job_pass in passes.values())
+
+        waiting: dict[str, set[str]] = {}
+        for name, job_pass in passes.items():
+            for members in job_pass.groups:
+                for ticker_id, _ in members:
+                    waiting.setdefault(ticker_id, set()).add(name)
+        published: set[str] = set()
+        snapshot_errors: list[Exception] = []
+        for job_pass in passes.values():
+            if not job_pass.remaining:
+                self._finish_job(job_pass, wall_now)
+        for outcome in self._execute(passes):
+            job_pass = passes[outcome.name]
+            self._apply_outcome(job_pass, outcome)
+            job_pass.remaining -= 1
+            if not job_pass.remaining:
+                self._finish_job(job_pass, wall_now)
+            for ticker_id, settings in outcome.members:
+                pending = waiting[ticker_id]
+                pending.discard(outcome.name)
+                if pending:
+                    continue
+                try:
+                    if self._publish(ticker_id, settings):
+                        published.add(ticker_id)
+                except Exception as error:
+                    snapshot_errors.append(error)
+
+        for ticker_id in dirty:
+            settings = settings_by_ticker.get(ticker_id)
+            if settings is None or ticker_id in waiting:
+                continue
+            try:
+                if self._publish(ticker_id, settings):
+                    published.add(ticker_id)
+            except Exception as error:
+                snapshot_errors.append(error)
+
+        for error in snapshot_errors:
+            self._record_refresh_failure(due, error)
+        return tuple(ticker_id for ticker_id in self._tickers if ticker_id in published)
+
+    def _refinalize(
+        self,
+        job: _ProviderJob,
+        ticker_id: str,
+        settings: DisplaySettings,
+        cached: _CachedProviderData,
+    ) -> bool:
+        """Derive one ticker's value again from its cached shared value."""
+
+        try:
+            data = _finalized_data(job, ticker_id, settings, cached.shared)
+        except Exception as error:
+            current = self._providers[job.name]
             self._providers[job.name] = replace(
-                updated,
-                data_by_ticker=data_by_ticker,
-                health=health,
+                current,
+                health=replace(current.health, last_error=f"{ticker_id}: {_error_text(error)}"),
             )
+            return False
+        current = self._providers[job.name]
+        self._providers[job.name] = replace(
+            current,
+            data_by_ticker={**current.data_by_ticker, ticker_id: data},
+        )
+        return True
 
-        published: list[str] = []
-        for ticker in self._tickers.values():
-            ticker_id = ticker.ticker_id
-            settings = settings_by_ticker.get(ticker_id)
-            if settings is None or ticker_id in settings_failures:
+    def _moved_tickers(self, dirty: set[str]) -> set[str]:
+        """Return versioned tickers whose settings changed since they were read."""
+
+        moved: set[str] = set()
+        for ticker in tuple(self._tickers.values()):
+            if ticker.version is None or ticker.ticker_id in dirty:
+                continue
+            with self._dirty_lock:
+                cached = self._settings_cache.get(ticker.ticker_id)
+            if cached is None:
+                continue
+            try:
+                version = ticker.version(ticker.ticker_id)
+            except Exception:
                 continue
+            if version != cached[0]:
+                moved.add(ticker.ticker_id)
+        return moved
 
-            provider_data: dict[str, object] = {}
-            for name, job in self._providers.items():
-                cached = job.data_by_ticker.get(ticker_id)
-                if cached is None:
+    def _ticker_settings(self, ticker: _Ticker) -> DisplaySettings | None:
+        """Return one ticker's normalized settings, reusing an unchanged version."""
+
+        identifier = ticker.ticker_id
+        version = None
+        if ticker.version is not None:
+            try:
+                version = ticker.version(identifier)
+            except Exception:
+                version = None
+            else:
+                with self._dirty_lock:
+                    cached = self._settings_cache.get(identifier)
+                if cached is not None and cached[0] == version:
+                    return cached[1]
+        try:
+            settings = normalize_settings(ticker.settings(identifier))
+        except Exception:
+            return None
+        if version is not None:
+            with self._dirty_lock:
+                if identifier in self._tickers:
+                    self._settings_cache[identifier] = (version, settings)
+        return settings
+
+    def _is_current_entry(self, due_at: float, name: str) -> bool:
+        """Return whether one heap entry still matches its job's deadline."""
+
+        job = self._providers.get(name)
+        return job is not None and job.next_due == due_at
+
+    def close(self) -> None:
+        """Stop the provider worker pool without waiting for abandoned calls."""
+
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _execute(self, passes: Mapping[str, _JobPass]) -> Iterator[_GroupOutcome]:
+        """Yield each shared provider call's outcome as soon as it is known."""
+
+        if self._max_workers == 0:
+            yield from self._execute_inline(passes)
+        else:
+            yield from self._execute_pooled(passes)
+
+    def _execute_inline(self, passes: Mapping[str, _JobPass]) -> Iterator[_GroupOutcome]:
+        """Run provider calls on the calling thread in registration order."""
+
+        for name, job_pass in passes.items():
+            job = job_pass.job
+            started = time.monotonic()
+            for members in job_pass.groups:
+                if job.timeout is not None and time.monotonic() - started >= job.timeout:
+                    yield _GroupOutcome(name, members, error=_timeout_error(job))
                     continue
-                if cached.settings_key != _freeze(job.settings_key(settings)):
+                try:
+                    value = _run_provider_refresh(job, *members[0])
+                except Exception as error:
+                    yield _GroupOutcome(name, members, error=error)
                     continue
-                provider_data[name] = cached.value
+                if job.timeout is not None and time.monotonic() - started > job.timeout:
+                    yield _GroupOutcome(name, members, error=_timeout_error(job))
+                else:
+                    yield _GroupOutcome(name, members, value=value)
+
+    def _execute_pooled(self, passes: Mapping[str, _JobPass]) -> Iterator[_GroupOutcome]:
+        """Run provider calls on the bounded pool within each job's caps."""
 
-            if not provider_data:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="ticker-provider",
+            )
+        started = time.monotonic()
+        queued = {name: deque(job_pass.groups) for name, job_pass in passes.items()}
+        deadlines = {
+            name: None if job_pass.job.timeout is None else started + job_pass.job.timeout
+            for name, job_pass in passes.items()
+        }
+        running: dict[Future, tuple[str, list[tuple[str, DisplaySettings]]]] = {}
+        while running or any(queued.values()):
+            for name, groups in queued.items():
+                job = passes[name].job
+                while groups and self._free_slots(job) > 0:
+                    members = groups.popleft()
+                    future = self._submit(job, members)
+                    running[future] = (name, members)
+
+            now = time.monotonic()
+            for name, deadline in deadlines.items():
+                if deadline is None or now < deadline:
+                    continue
+                job = passes[name].job
+                for future, (owner, members) in tuple(running.items()):
+                    if owner == name:
+                        del running[future]
+                        yield _GroupOutcome(name, members, error=_timeout_error(job))
+                while queued[name]:
+                    yield _GroupOutcome(name, queued[name].popleft(), error=_timeout_error(job))
+            if not running and not any(queued.values()):
+                return
+
+            watched = set(running)
+            with self._inflight_lock:
+                for name, groups in queued.items():
+                    if groups:
+                        watched.update(self._inflight[name])
+            if not watched:
                 continue
+            open_deadlines = [
+                deadline
+                for name, deadline in deadlines.items()
+                if deadline is not None
+                and (queued[name] or any(owner == name for owner, _ in running.values()))
+            ]
+            timeout = max(0.0, min(open_deadlines) - now) if open_deadlines else None
+            done, _ = wait(watched, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                owner = running.pop(future, None)
+                if owner is None:
+                    continue
+                name, members = owner
+                try:
+                    value = future.result()
+                except Exception as error:
+                    yield _GroupOutcome(name, members, error=error)
+                else:
+                    yield _GroupOutcome(name, members, value=value)
+
+    def _free_slots(self, job: _ProviderJob) -> int:
+        """Return this job's unused concurrency, counting abandoned calls."""
+
+        with self._inflight_lock:
+            return job.concurrency - len(self._inflight[job.name])
+
+    def _submit(
+        self,
+        job: _ProviderJob,
+        members: list[tuple[str, DisplaySettings]],
+    ) -> Future:
+        """Submit one shared provider call and track it until it really ends."""
+
+        assert self._executor is not None
+        future = self._executor.submit(_run_provider_refresh, job, *members[0])
+        inflight = self._inflight[job.name]
+        with self._inflight_lock:
+            inflight.add(future)
+
+        def release(done: Future) -> None:
+            with self._inflight_lock:
+                inflight.discard(done)
+
+        future.add_done_callback(release)
+        return future
 
+    def _apply_outcome(self, job_pass: _JobPass, outcome: _GroupOutcome) -> None:
+        """Fan one shared provider value out to each ticker in its group."""
+
+        job = job_pass.job
+        members = outcome.members
+        try:
+            if outcome.error is not None:
+                raise outcome.error
+            ok, error = _refresh_succeeded(outcome.value)
+            if not ok:
+                raise RuntimeError(error or "provider refresh failed")
+        except Exception as error:
+            message = _error_text(error)
+            ticker_ids = ", ".join(ticker_id for ticker_id, _ in members)
+            job_pass.errors.append(f"{ticker_ids}: {message}")
+            return
+
+        job_pass.values.append(outcome.value)
+        data_by_ticker = dict(self._providers[job.name].data_by_ticker)
+        for ticker_id, settings in members:
             try:
-                result = _run_snapshot_refresh(
-                    self._refresh_service,
-                    ticker_id,
-                    settings,
-                    MappingProxyType(provider_data),
+                data_by_ticker[ticker_id] = _finalized_data(
+                    job, ticker_id, settings, outcome.value
                 )
-                ok, error = _refresh_succeeded(result)
-                if not ok:
-                    raise RuntimeError(error or "snapshot refresh failed")
             except Exception as error:
-                self._record_refresh_failure(due, error)
+                message = _error_text(error)
+                job_pass.errors.append(f"{ticker_id}: {message}")
             else:
-                published.append(ticker_id)
+                job_pass.success_count += 1
+        self._providers[job.name] = replace(
+            self._providers[job.name],
+            data_by_ticker=data_by_ticker,
+        )
+
+    def _finish_job(self, job_pass: _JobPass, wall_now: datetime) -> None:
+        """Record one completed job pass in its immutable health."""
+
+        job = job_pass.job
+        wall_due = self._reschedule(job_pass, wall_now)
+        if job_pass.errors:
+            health = SchedulerHealth(
+                last_success=wall_now if job_pass.success_count else job.health.last_success,
+                last_error="; ".join(job_pass.errors),
+                next_due=wall_due,
+                consecutive_failures=job.health.consecutive_failures + 1,
+            )
+        else:
+            health = SchedulerHealth(
+                last_success=wall_now,
+                last_error=None,
+                next_due=wall_due,
+                consecutive_failures=0,
+            )
+        self._providers[job.name] = replace(self._providers[job.name], health=health)
 
-        return tuple(published)
+    def _reschedule(self, job_pass: _JobPass, wall_now: datetime) -> datetime:
+        """Apply a job's interval policy to the deadline after a scheduled pass."""
+
+        job = job_pass.job
+        if job.interval_policy is None or job_pass.started is None:
+            return job_pass.wall_due
+        try:
+            interval = job.interval_policy(tuple(job_pass.values))
+        except Exception:
+            return job_pass.wall_due
+        if interval is None or not math.isfinite(interval) or interval <= 0:
+            return job_pass.wall_due
+        next_due = job_pass.started + float(interval)
+        self._providers[job.name] = replace(self._providers[job.name], next_due=next_due)
+        heapq.heappush(self._due_heap, (next_due, job.name))
+        return wall_now + timedelta(seconds=float(interval))
+
+    def _publish(self, ticker_id: str, settings: DisplaySettings) -> bool:
+        """Publish one ticker from every compatible cached provider value.
+
+        A ticker whose settings and provider content match what its last
+        published snapshot was built from is skipped, so its revision only
+        advances on a real change.
+        """
+
+        if ticker_id not in self._tickers:
+            return False
+        provider_data: dict[str, object] = {}
+        for name, job in self._providers.items():
+            cached = job.data_by_ticker.get(ticker_id)
+            if cached is None:
+                continue
+            if cached.settings_key != _freeze(job.settings_key(settings)):
+                continue
+            provider_data[name] = cached.value
+
+        if not provider_data:
+            return False
+        sources = {
+            name: _publication_source(value) for name, value in provider_data.items()
+        }
+        if self._published.get(ticker_id) == (settings, sources):
+            return False
+
+        result = _run_snapshot_refresh(
+            self._refresh_service,
+            ticker_id,
+            settings,
+            MappingProxyType(provider_data),
+        )
+        ok, error = _refresh_succeeded(result)
+        if not ok:
+            raise RuntimeError(error or "snapshot refresh failed")
+        self._published[ticker_id] = (settings, sources)
+        return True
 
     def _record_refresh_failure(
         self,
@@ -360,6 +804,41 @@ class RefreshScheduler:
             )
 
 
+def _finalized_data(
+    job: _ProviderJob,
+    ticker_id: str,
+    settings: DisplaySettings,
+    shared: object,
+) -> _CachedProviderData:
+    """Derive and freeze one ticker's value from one shared provider value."""
+
+    if job.finalize is None:
+        result = shared
+    else:
+        result = job.finalize(ticker_id, settings, shared)
+    ok, error = _refresh_succeeded(result)
+    if not ok:
+        raise RuntimeError(error or "provider refresh failed")
+    return _CachedProviderData(
+        settings_key=_freeze(job.settings_key(settings)),
+        value=_freeze(result),
+        settings=None if job.finalize is None else settings,
+        shared=None if job.finalize is None else shared,
+    )
+
+
+def _publication_source(value: object) -> object:
+    """Return the part of one provider value that a published snapshot shows.
+
+    A result's observation time moves on every fetch even when nothing else
+    does, so it is left out of the comparison.
+    """
+
+    if isinstance(value, ProviderResult):
+        return (value.content, value.alerts, value.news, value.health)
+    return value
+
+
 def _advance_due(next_due: float, now: float, interval: float) -> float:
     """Advance a due time beyond the current monotonic reading."""
 
@@ -382,36 +861,77 @@ def _run_snapshot_refresh(
     return service.refresh(ticker_id, settings, provider_data)
 
 
+def _timeout_error(job: _ProviderJob) -> TimeoutError:
+    """Describe one provider pass that missed its deadline."""
+
+    return TimeoutError(f"timed out after {job.timeout:g}s")
+
+
+def _settings_groups(
+    job: _ProviderJob,
+    settings_by_ticker: Mapping[str, DisplaySettings],
+) -> tuple[list[tuple[str, DisplaySettings]], ...]:
+    """Group tickers that can share one provider call for this job."""
+
+    groups: list[tuple[object, list[tuple[str, DisplaySettings]]]] = []
+    hashed: dict[object, list[tuple[str, DisplaySettings]]] = {}
+    for ticker_id, settings in settings_by_ticker.items():
+        scope = ticker_id if job.ticker_scoped else None
+        key = (scope, _freeze(job.settings_key(settings)))
+        try:
+            members = hashed.get(key)
+        except TypeError:
+            members = next((value for other, value in groups if other == key), None)
+        if members is None:
+            members = []
+            groups.append((key, members))
+            try:
+                hashed[key] = members
+            except TypeError:
+                pass
+        members.append((ticker_id, settings))
+    return tuple(members for _, members in groups)
+
+
 def _run_provider_refresh(
-    refresh: ProviderRefresh,
+    job: _ProviderJob,
     ticker_id: str,
     settings: DisplaySettings,
 ) -> object:
-    """Call a ticker-scoped provider when its declared signature accepts one."""
+    """Call a ticker-scoped provider with its ticker and others with settings."""
+
+    if job.ticker_scoped:
+        return job.refresh(ticker_id, settings)
+    return job.refresh(settings)
+
+
+def _accepts_ticker_id(refresh: ProviderRefresh) -> bool:
+    """Return whether a provider's declared signature accepts a ticker ID."""
 
     try:
         parameters = tuple(signature(refresh).parameters.values())
     except (TypeError, ValueError):
-        return refresh(settings)
+        return False
     positional = tuple(
         value
         for value in parameters
         if value.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
     )
     has_variadic = any(value.kind is Parameter.VAR_POSITIONAL for value in parameters)
-    if has_variadic or len(positional) >= 2:
-        return refresh(ticker_id, settings)
-    return refresh(settings)
+    return has_variadic or len(positional) >= 2
 
 
 __all__ = [
+    "IntervalPolicy",
     "MonotonicClock",
+    "ProviderFinalize",
     "ProviderRefresh",
     "ProviderSettingsKey",
     "RefreshScheduler",
     "SchedulerHealth",
     "SnapshotRefreshCallable",
     "SettingsResolver",
+    "SettingsVersion",
     "SnapshotRefreshService",
     "WallClock",
 ]
@@ -0,0 +1,79 @@
+"""Write-through ticker record cache with per-ticker settings versions."""
+
+from __future__ import annotations
+
+from itertools import count
+from threading import Lock
+
+from sports_ticker.fleet import TickerRecord, TickerRepository
+
+
+class TickerRecordCache:
+    """Serve ticker records from memory and version their effective settings.
+
+    Every write made through the owning application must either ``put`` the
+    record the repository returned or ``invalidate`` the ticker. A ticker's
+    version changes whenever its display settings or pairing may have changed,
+    so readers can skip work while the version stays the same.
+    """
+
+    def __init__(self, repository: TickerRepository) -> None:
+        self._repository = repository
+        self._lock = Lock()
+        self._records: dict[str, TickerRecord] = {}
+        self._versions: dict[str, int] = {}
+        self._counter = count(1)
+
+    def get(self, ticker_id: str) -> TickerRecord | None:
+        """Return one ticker, reading the repository only after a miss."""
+
+        identifier = str(ticker_id).strip()
+        with self._lock:
+            cached = self._records.get(identifier)
+            if cached is not None:
+                return cached
+            version = self._versions.get(identifier)
+        record = self._repository.get_ticker(identifier)
+        if record is None:
+            return None
+        with self._lock:
+            if self._versions.get(identifier) == version:
+                self._records[identifier] = record
+                if version is None:
+                    self._versions[identifier] = next(self._counter)
+        return record
+
+    def put(self, record: TickerRecord) -> TickerRecord:
+        """Store one record the repository just wrote and return it."""
+
+        with self._lock:
+            previous = self._records.get(record.ticker_id)
+            self._records[record.ticker_id] = record
+            if (
+                previous is None
+                or previous.display_settings != record.display_settings
+                or previous.pairing != record.pairing
+            ):
+                self._versions[record.ticker_id] = next(self._counter)
+        return record
+
+    def invalidate(self, ticker_id: str) -> None:
+        """Drop one ticker after a write that did not return its record."""
+
+        identifier = str(ticker_id).strip()
+        with self._lock:
+            self._records.pop(identifier, None)
+            self._versions[identifier] = next(self._counter)
+
+    def version(self, ticker_id: str) -> int:
+        """Return the current settings version for one ticker."""
+
+        identifier = str(ticker_id).strip()
+        with self._lock:
+            version = self._versions.get(identifier)
+            if version is None:
+                version = self._versions[identifier] = next(self._counter)
+            return version
+
+
+__all__ = ["TickerRecordCache"]
@@ -9,8 +9,8 @@ import os
 import secrets
 import time
 from collections.abc import Mapping
-from dataclasses import dataclass
-from threading import Lock
+from dataclasses import dataclass, replace
+from threading import Lock, Thread
 from typing import Any, Callable, Protocol
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode, urlparse
@@ -20,12 +20,23 @@ from cryptography.fernet import Fernet, InvalidToken
 
 from sports_ticker.domain import DisplaySettings
 from sports_ticker.fleet import SpotifyConnection, SpotifyOAuthAttempt, TickerRepository
+from sports_ticker.providers.shared_results import SharedResultCache
 
 
 SPOTIFY_AUTHORIZE_URL = "https://accounts.spotify.com/authorize"
 SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
 SPOTIFY_API_URL = "https://api.spotify.com/v1"
 SPOTIFY_SCOPES = ("user-read-playback-state", "user-read-currently-playing")
+_TOKEN_LIFETIME_SECONDS = 3600.0
+_TOKEN_EXPIRY_MARGIN_SECONDS = 60.0
+_TOKEN_REFRESH_AHEAD_SECONDS = 300.0
+_TOKEN_RETRY_SECONDS = 15.0
+_FAST_POLL_SECONDS = 1.0
+_PLAYING_POLL_SECONDS = 5.0
+_PAUSED_POLL_SECONDS = 10.0
+_IDLE_POLL_SECONDS = 30.0
+_TRACK_BOUNDARY_SECONDS = 2.0
+_PLAN_RETENTION_SECONDS = 300.0
 
 
 class SpotifyIntegrationError(RuntimeError):
@@ -65,6 +76,24 @@ class _PlaybackWindow:
     last_record: Mapping[str, Any] | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class _AccessToken:
+    """Keep one access token with the stored refresh token that minted it."""
+
+    value: str
+    refresh_token_ciphertext: str
+    refresh_at: float
+    expires_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class _PollPlan:
+    """Keep one ticker's last playback record and when to ask Spotify again."""
+
+    record: Mapping[str, Any]
+    next_poll_at: float
+
+
 @dataclass(frozen=True, slots=True)
 class SpotifyConfig:
     """Contain deployment-owned Spotify OAuth configuration."""
@@ -217,6 +246,8 @@ class SpotifyIntegrationService:
         *,
         http: SpotifyHttpPort | None = None,
         clock: Callable[[], float] = time.time,
+        playback_share_seconds: float = 0.0,
+        monotonic_clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self._repository = repository
         self._config = config
@@ -225,6 +256,14 @@ class SpotifyIntegrationService:
         self._cipher = Fernet(config.encryption_key.encode("ascii"))
         self._playback_windows: dict[str, _PlaybackWindow] = {}
         self._playback_lock = Lock()
+        self._access_tokens: dict[str, _AccessToken] = {}
+        self._token_refreshes: set[str] = set()
+        self._token_lock = Lock()
+        self._token_refresh_locks: dict[str, Lock] = {}
+        self._shared_playback = SharedResultCache(
+            max_age=playback_share_seconds,
+            clock=monotonic_clock,
+        )
 
     @property
     def callback_uri(self) -> str:
@@ -341,11 +380,16 @@ class SpotifyIntegrationService:
         if spotify_account_id:
             with self._playback_lock:
                 self._playback_windows.pop(f"{group_id}:{spotify_account_id}", None)
+            self._forget_access_token(f"{group_id}:{spotify_account_id}")
         else:
             with self._playback_lock:
                 for key in tuple(self._playback_windows):
                     if key.startswith(f"{group_id}:"):
                         self._playback_windows.pop(key, None)
+            with self._token_lock:
+                for key in tuple(self._access_tokens):
+                    if key.startswith(f"{group_id}:"):
+                        self._access_tokens.pop(key, None)
         return deleted
 
     def set_priority(self, ticker_id: str, spotify_account_id: str | None) -> dict[str, object]:
@@ -355,13 +399,26 @@ class SpotifyIntegrationService:
         return self.status(ticker_id)
 
     def playback(self, ticker_id: str) -> Mapping[str, Any]:
-        """Return the preferred account, or the first account now playing."""
+        """Return the preferred account, or the first account now playing.
+
+        Tickers that resolve to the same linked accounts share one Spotify
+        fetch while it is in flight and for ``playback_share_seconds`` after.
+        """
 
         identifier = _ticker_id(ticker_id)
         group_id = self._group_id(identifier)
         connections = self._repository.list_group_spotify_connections(group_id, fallback_ticker_id=identifier)
         if not connections:
             return _connection_record("reauthorization_required")
+        record = self._shared_playback.get(
+            (connections[0].ticker_id, connections),
+            lambda: self._select_playback(connections),
+        )
+        return dict(record)
+
+    def _select_playback(self, connections: tuple[SpotifyConnection, ...]) -> Mapping[str, Any]:
+        """Fetch the priority account, or the first linked account now playing."""
+
         preferred = next((item for item in connections if item.priority), None)
         if preferred is not None:
             return self._playback_for_connection(preferred)
@@ -381,14 +438,83 @@ class SpotifyIntegrationService:
 
         if connection.status != "connected":
             return _connection_record("reauthorization_required", connection)
+        group_id = connection.ticker_id if connection.ticker_id.startswith("cg_") else self._group_id(connection.ticker_id)
+        token_key = f"{group_id}:{connection.spotify_account_id}"
         try:
-            group_id = connection.ticker_id if connection.ticker_id.startswith("cg_") else self._group_id(connection.ticker_id)
+            access_token = self._access_token(token_key, group_id, connection)
+            try:
+                playback = self._http.get_playback(access_token)
+            except SpotifyIntegrationError as error:
+                if "HTTP 401" not in str(error):
+                    raise
+                self._forget_access_token(token_key)
+                access_token = self._access_token(token_key, group_id, connection)
+                playback = self._http.get_playback(access_token)
+            record = self._windowed_playback(connection, playback, access_token)
+            record["fetch_ts"] = float(self._clock())
+            record["spotify_account_id"] = connection.spotify_account_id
+            record["connection_name"] = connection.display_name
+            record["priority"] = connection.priority
+            return record
+        except SpotifyIntegrationError as error:
+            if _authorization_revoked(error):
+                self._forget_access_token(token_key)
+                self._mark_reauthorization(connection)
+                return _connection_record("reauthorization_required", connection)
+            raise
+        except InvalidToken as error:
+            self._forget_access_token(token_key)
+            self._mark_reauthorization(connection)
+            raise SpotifyIntegrationError("Spotify stored authorization is invalid") from error
+
+    def _access_token(self, key: str, group_id: str, connection: SpotifyConnection) -> str:
+        """Return a cached access token, refreshing it ahead of expiry."""
+
+        now = float(self._clock())
+        with self._token_lock:
+            cached = self._access_tokens.get(key)
+            if cached is not None and cached.refresh_token_ciphertext != connection.refresh_token_ciphertext:
+                cached = None
+            if cached is not None and now < cached.expires_at:
+                if now >= cached.refresh_at and key not in self._token_refreshes:
+                    self._token_refreshes.add(key)
+                    Thread(
+                        target=self._refresh_in_background,
+                        args=(key, group_id, connection),
+                        name="ticker-spotify-token",
+                        daemon=True,
+                    ).start()
+                return cached.value
+        return self._renew_access_token(key, group_id, connection, stale=cached).value
+
+    def _renew_access_token(
+        self,
+        key: str,
+        group_id: str,
+        connection: SpotifyConnection,
+        *,
+        stale: _AccessToken | None,
+    ) -> _AccessToken:
+        """Mint one access token per account, saving a rotated refresh token.
+
+        Refreshes serialize per account so a rotated refresh token is never
+        spent twice, while other accounts refresh concurrently.
+        """
+
+        with self._token_lock:
+            refresh_lock = self._token_refresh_locks.setdefault(key, Lock())
+        with refresh_lock:
+            with self._token_lock:
+                current = self._access_tokens.get(key)
+            if current is not None and current is not stale and float(self._clock()) < current.refresh_at:
+                return current
             refresh_token = self._decrypt(connection.refresh_token_ciphertext)
             tokens = self._http.refresh_access_token(refresh_token, self._config)
             access_token = _required_text(tokens, "access_token")
             next_refresh = str(tokens.get("refresh_token") or refresh_token).strip()
+            ciphertext = connection.refresh_token_ciphertext
             if next_refresh != refresh_token:
-                now = float(self._clock())
+                ciphertext = self._encrypt(next_refresh)
                 self._repository.save_group_spotify_connection(
                     group_id,
                     SpotifyConnection(
@@ -396,28 +522,57 @@ class SpotifyIntegrationService:
                         spotify_account_id=connection.spotify_account_id,
                         display_name=connection.display_name,
                         scopes=connection.scopes,
-                        refresh_token_ciphertext=self._encrypt(next_refresh),
+                        refresh_token_ciphertext=ciphertext,
                         status="connected",
                         priority=connection.priority,
                         connected_at=connection.connected_at,
-                        updated_at=now,
+                        updated_at=float(self._clock()),
                     )
                 )
-            playback = self._http.get_playback(access_token)
-            record = self._windowed_playback(connection, playback, access_token)
-            record["fetch_ts"] = float(self._clock())
-            record["spotify_account_id"] = connection.spotify_account_id
-            record["connection_name"] = connection.display_name
-            record["priority"] = connection.priority
-            return record
+            del refresh_token, next_refresh
+            now = float(self._clock())
+            expires_at = now + max(0.0, _token_lifetime(tokens) - _TOKEN_EXPIRY_MARGIN_SECONDS)
+            token = _AccessToken(
+                value=access_token,
+                refresh_token_ciphertext=ciphertext,
+                refresh_at=max(now, expires_at - _TOKEN_REFRESH_AHEAD_SECONDS),
+                expires_at=expires_at,
+            )
+            with self._token_lock:
+                self._access_tokens[key] = token
+            return token
+
+    def _refresh_in_background(self, key: str, group_id: str, connection: SpotifyConnection) -> None:
+        """Replace a token nearing expiry while polls keep using the current one."""
+
+        try:
+            with self._token_lock:
+                stale = self._access_tokens.get(key)
+            self._renew_access_token(key, group_id, connection, stale=stale)
         except SpotifyIntegrationError as error:
-            if "invalid_grant" in str(error).lower() or "unauthorized" in str(error).lower():
+            if _authorization_revoked(error):
+                self._forget_access_token(key)
                 self._mark_reauthorization(connection)
-                return _connection_record("reauthorization_required", connection)
-            raise
-        except InvalidToken as error:
-            self._mark_reauthorization(connection)
-            raise SpotifyIntegrationError("Spotify stored authorization is invalid") from error
+            else:
+                self._delay_token_refresh(key)
+        except Exception:
+            self._delay_token_refresh(key)
+        finally:
+            with self._token_lock:
+                self._token_refreshes.discard(key)
+
+    def _delay_token_refresh(self, key: str) -> None:
+        """Wait before retrying a failed proactive refresh of a still-valid token."""
+
+        retry_at = float(self._clock()) + _TOKEN_RETRY_SECONDS
+        with self._token_lock:
+            cached = self._access_tokens.get(key)
+            if cached is not None:
+                self._access_tokens[key] = replace(cached, refresh_at=min(retry_at, cached.expires_at))
+
+    def _forget_access_token(self, key: str) -> None:
+        with self._token_lock:
+            self._access_tokens.pop(key, None)
 
     def _mark_reauthorization(self, connection: SpotifyConnection) -> None:
         now = float(self._clock())
@@ -521,17 +676,55 @@ class SpotifyIntegrationService:
 
 
 class SpotifyMusicSource:
-    """Expose server-owned Spotify playback through the v2 music source port."""
+    """Expose server-owned Spotify playback through the v2 music source port.
 
-    def __init__(self, service: SpotifyIntegrationService) -> None:
+    Spotify is asked again only when the last record says something may have
+    changed: quickly near a predicted track boundary or right after a change,
+    at a relaxed cadence mid-track, and slowly while paused or idle. Between
+    polls the last record is returned unchanged; renderers advance progress
+    from its ``fetch_ts``. Plans for tickers that stop polling are dropped.
+    """
+
+    def __init__(
+        self,
+        service: SpotifyIntegrationService,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._service = service
+        self._clock = clock
+        self._plans: dict[str, _PollPlan] = {}
+        self._plans_lock = Lock()
 
     def fetch_for_ticker(self, ticker_id: str, settings: DisplaySettings) -> Mapping[str, Any]:
         """Return music content for the requested ticker only."""
 
         if not isinstance(settings, DisplaySettings):
             raise TypeError("settings must be DisplaySettings")
-        return {"content": [self._service.playback(ticker_id)]}
+        identifier = _ticker_id(ticker_id)
+        now = float(self._clock())
+        with self._plans_lock:
+            plan = self._plans.get(identifier)
+        if plan is not None and now < plan.next_poll_at:
+            return {"content": [plan.record]}
+        record = self._service.playback(identifier)
+        fetched_at = float(self._clock())
+        delay = _next_poll_delay(plan.record if plan is not None else None, record)
+        with self._plans_lock:
+            self._plans[identifier] = _PollPlan(record, fetched_at + delay)
+            self._forget_idle_plans(fetched_at)
+        return {"content": [record]}
+
+    def _forget_idle_plans(self, now: float) -> None:
+        """Drop plans for deleted or regrouped tickers that no longer poll; lock held."""
+
+        idle = [
+            identifier
+            for identifier, plan in self._plans.items()
+            if now - plan.next_poll_at > _PLAN_RETENTION_SECONDS
+        ]
+        for identifier in idle:
+            del self._plans[identifier]
 
     def fetch(self, settings: DisplaySettings) -> Mapping[str, Any]:
         """Reject unscoped calls because music accounts belong to tickers."""
@@ -539,6 +732,29 @@ class SpotifyMusicSource:
         raise SpotifyIntegrationError("Spotify music requires a ticker ID")
 
 
+def _next_poll_delay(previous: Mapping[str, Any] | None, record: Mapping[str, Any]) -> float:
+    """Return seconds until Spotify can next report something worth showing."""
+
+    if previous is not None and (
+        previous.get("id") != record.get("id")
+        or bool(previous.get("is_playing")) != bool(record.get("is_playing"))
+    ):
+        return _FAST_POLL_SECONDS
+    if bool(record.get("is_playing")):
+        remaining = _seconds(record.get("duration")) - _seconds(record.get("progress"))
+        return max(_FAST_POLL_SECONDS, min(_PLAYING_POLL_SECONDS, remaining - _TRACK_BOUNDARY_SECONDS))
+    if record.get("status") == "paused":
+        return _PAUSED_POLL_SECONDS
+    return _IDLE_POLL_SECONDS
+
+
+def _seconds(value: object) -> float:
+    try:
+        return float(value or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
 def _extract_track(item: Mapping[str, Any] | None) -> _SpotifyTrack | None:
     """Extract normalized track metadata from one Spotify track mapping."""
 
@@ -730,6 +946,23 @@ def _connection_status_value(connection: SpotifyConnection) -> dict[str, object]
     }
 
 
+def _authorization_revoked(error: SpotifyIntegrationError) -> bool:
+    """Return whether Spotify rejected the stored refresh token itself."""
+
+    text = str(error).lower()
+    return "invalid_grant" in text or "unauthorized" in text
+
+
+def _token_lifetime(tokens: Mapping[str, Any]) -> float:
+    """Return the access token lifetime Spotify reported, in seconds."""
+
+    try:
+        lifetime = float(tokens.get("expires_in") or _TOKEN_LIFETIME_SECONDS)
+    except (TypeError, ValueError):
+        return _TOKEN_LIFETIME_SECONDS
+    return lifetime if lifetime > 0 else 0.0
+
+
 def _playback_window_key(connection: SpotifyConnection) -> str:
     """Return an artwork window key isolated by ticker and Spotify account."""
 
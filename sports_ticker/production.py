@@ -12,22 +12,37 @@ from urllib.parse import urlencode
 from flask import Flask
 
 from sports_ticker.api.app import create_app
-from sports_ticker.application import BackendApplication, BackendRuntime, RefreshScheduler, RefreshService
+from sports_ticker.application import (
+    BackendApplication,
+    BackendRuntime,
+    LivenessIntervalPolicy,
+    RefreshScheduler,
+    RefreshService,
+)
 from sports_ticker.application.state_store import SnapshotStore
 from sports_ticker.domain import DisplaySettings
 from sports_ticker.fleet import PairingState, TickerRepository
 from sports_ticker.integrations import SpotifyConfig, SpotifyIntegrationService, SpotifyMusicSource
 from sports_ticker.leagues import ESPN_SCOREBOARD_PATHS, FOTMOB_LEAGUES, TEAM_CATALOG_PATHS, league_for
+from sports_ticker.markets import selected_market_groups
 from sports_ticker.providers import (
+    DecodedResponseCache,
     EspnScoreboardProvider,
     EspnTeamCatalog,
     FotMobSoccerProvider,
     FlightsProvider,
     GolfProvider,
+    MatchDetailCache,
     MusicProvider,
     OpenMeteoWeatherProvider,
+    PooledHttpTransport,
+    PooledJsonHttpClient,
+    PooledTextHttpClient,
     RacingProvider,
+    SignalRTimingFeed,
+    SingleFlightJsonHttpClient,
     StockProvider,
+    StreamingRacingSource,
 )
 from sports_ticker.providers.live_sources import (
     ClockProvider,
@@ -36,6 +51,7 @@ from sports_ticker.providers.live_sources import (
     FlightRadarSource,
 )
 from sports_ticker.providers.racing_live import LiveRacingSource
+from sports_ticker.providers.weather import weather_bucket
 
 
 _ESPN_BASE: Final = "https://site.api.espn.com/apis/site/v2/sports"
@@ -50,6 +66,32 @@ _INTERVALS: Final = {
     "music": 0.6,
     "clock": 3600.0,
 }
+_DEADLINES: Final = {
+    "espn": 20.0,
+    "fotmob": 20.0,
+    "weather": 20.0,
+    "golf": 20.0,
+    "racing": 20.0,
+    "stock": 60.0,
+    "flights": 30.0,
+    "music": 3.0,
+    "clock": 2.0,
+}
+_INTERVAL_POLICIES: Final = {
+    "espn": LivenessIntervalPolicy(live=5.0, near=60.0, idle=300.0),
+    "fotmob": LivenessIntervalPolicy(live=5.0, near=60.0, idle=300.0),
+    "golf": LivenessIntervalPolicy(live=30.0, near=120.0, idle=900.0),
+    "racing": LivenessIntervalPolicy(live=15.0, near=60.0, idle=600.0),
+}
+_CONCURRENCY: Final = {
+    "espn": 2,
+    "fotmob": 2,
+    "weather": 4,
+    "music": 4,
+}
+# Scoreboard URLs are shared across settings variants for this long; it is
+# shorter than the scoreboard intervals so every pass reads fresh slices.
+_SCOREBOARD_SHARE_SECONDS: Final = 3.0
 
 
 def create_production_application(
@@ -61,29 +103,63 @@ def create_production_application(
     path.parent.mkdir(parents=True, exist_ok=True)
     repository = TickerRepository(path)
     _provision_initial_ticker(repository)
-    spotify = SpotifyIntegrationService(repository, SpotifyConfig.from_environment())
-    providers = _providers(spotify)
+    spotify = SpotifyIntegrationService(
+        repository,
+        SpotifyConfig.from_environment(),
+        playback_share_seconds=_INTERVALS["music"],
+    )
+    transport = PooledHttpTransport(
+        max_per_host=_positive_int("TICKER_HTTP_CONNECTIONS_PER_HOST", "4"),
+    )
+    response_cache = DecodedResponseCache(
+        max_entries=_positive_int("TICKER_HTTP_CACHE_ENTRIES", "512"),
+    )
+    detail_cache = MatchDetailCache(
+        os.environ.get("TICKER_FOTMOB_DETAIL_CACHE_PATH", path.parent / "fotmob-details.sqlite3"),
+        max_entries=_positive_int("TICKER_FOTMOB_DETAIL_CACHE_ENTRIES", "512"),
+    )
+    providers = _providers(spotify, transport, response_cache, detail_cache)
     snapshots = SnapshotStore()
     refresh = RefreshService(providers.values(), snapshots)
-    scheduler = RefreshScheduler(refresh)
+    scheduler = RefreshScheduler(
+        refresh,
+        max_workers=_positive_int("TICKER_PROVIDER_WORKERS", "8"),
+    )
     for name, provider in providers.items():
         scheduler.register_provider(
             name,
             _INTERVALS[name],
             _provider_fetch(provider),
             settings_key=_provider_settings_key(name),
+            finalize=_provider_finalize(provider),
+            timeout=_DEADLINES[name],
+            concurrency=_CONCURRENCY.get(name, 1),
+            interval_policy=_INTERVAL_POLICIES.get(name),
         )
     application = BackendApplication(
         repository,
         snapshots,
         scheduler=scheduler,
         spotify_service=spotify,
-        catalog=EspnTeamCatalog(TEAM_CATALOG_PATHS),
+        catalog=EspnTeamCatalog(
+            TEAM_CATALOG_PATHS,
+            SingleFlightJsonHttpClient(PooledJsonHttpClient(transport)),
+        ),
+        http_transport=transport,
+        http_cache=response_cache,
+        caches={
+            "match_details": detail_cache,
+            **{
+                f"{name}_results": provider.result_cache
+                for name, provider in providers.items()
+                if hasattr(provider, "result_cache")
+            },
+        },
     )
     runtime = BackendRuntime(
         scheduler,
         application.event_service,
-        poll_interval=_positive_float(os.environ.get("TICKER_REFRESH_TICK_SECONDS", "0.2")),
+        poll_interval=_positive_float("TICKER_REFRESH_TICK_SECONDS", "30"),
     )
     application.runtime = runtime
     app = create_app(application)
@@ -92,6 +168,8 @@ def create_production_application(
     app.extensions["sports_ticker.snapshot_store"] = snapshots
     app.extensions["sports_ticker.scheduler"] = scheduler
     app.extensions["sports_ticker.runtime"] = runtime
+    app.extensions["sports_ticker.http_transport"] = transport
+    app.extensions["sports_ticker.providers"] = providers
     app.config["DASHBOARD_ASSET_CACHE"] = Path(
         os.environ.get("TICKER_DASHBOARD_ASSET_CACHE", path.parent / "rewrite_assets")
     )
@@ -107,6 +185,11 @@ def start_runtime(app: Flask) -> Callable[[], None]:
 
     thread = Thread(target=runtime.run, name="ticker-v2-refresh", daemon=True)
     thread.start()
+    scheduler = app.extensions["sports_ticker.scheduler"]
+    for name, provider in app.extensions["sports_ticker.providers"].items():
+        start_provider = getattr(provider, "start", None)
+        if callable(start_provider):
+            start_provider(on_change=_expedite(scheduler, runtime, name))
 
     def stop() -> None:
         runtime.stop()
@@ -120,31 +203,83 @@ def start_runtime(app: Flask) -> Callable[[], None]:
         if callable(close_preview_assets):
             close_preview_assets()
         app.extensions["sports_ticker.backend_application"].close()
+        for provider in app.extensions["sports_ticker.providers"].values():
+            close_provider = getattr(provider, "close", None)
+            if callable(close_provider):
+                close_provider()
+        app.extensions["sports_ticker.http_transport"].close()
 
     return stop
 
 
-def _providers(spotify: SpotifyIntegrationService) -> dict[str, object]:
+def _providers(
+    spotify: SpotifyIntegrationService,
+    transport: PooledHttpTransport,
+    cache: DecodedResponseCache,
+    detail_cache: MatchDetailCache,
+) -> dict[str, object]:
     scoreboard_urls = {
         league: _scoreboard_url(league, path)
         for league, path in ESPN_SCOREBOARD_PATHS.items()
     }
+    share_seconds = float(os.environ.get("TICKER_HTTP_SHARE_SECONDS", "1"))
+    client = SingleFlightJsonHttpClient(
+        PooledJsonHttpClient(transport, cache=cache),
+        ttl_seconds=share_seconds,
+    )
+    scoreboard_share_seconds = max(share_seconds, _SCOREBOARD_SHARE_SECONDS)
     return {
-        "espn": EspnScoreboardProvider(scoreboard_urls),
-        "fotmob": FotMobSoccerProvider(FOTMOB_LEAGUES),
-        "weather": OpenMeteoWeatherProvider(),
-        "golf": GolfProvider(EspnGolfSource()),
-        "racing": RacingProvider(LiveRacingSource()),
-        "stock": StockProvider(FinnhubStockSource()),
+        "espn": EspnScoreboardProvider(
+            scoreboard_urls,
+            SingleFlightJsonHttpClient(
+                PooledJsonHttpClient(transport, cache=cache),
+                ttl_seconds=scoreboard_share_seconds,
+            ),
+        ),
+        "fotmob": FotMobSoccerProvider(
+            FOTMOB_LEAGUES,
+            SingleFlightJsonHttpClient(
+                PooledJsonHttpClient(transport, user_agent="Mozilla/5.0", cache=cache),
+                ttl_seconds=scoreboard_share_seconds,
+            ),
+            detail_cache=detail_cache,
+        ),
+        "weather": OpenMeteoWeatherProvider(PooledJsonHttpClient(transport, cache=cache)),
+        "golf": GolfProvider(EspnGolfSource(client)),
+        "racing": RacingProvider(_racing_source(client, transport)),
+        "stock": StockProvider(FinnhubStockSource(client)),
         "flights": FlightsProvider(FlightRadarSource()),
         "music": MusicProvider(SpotifyMusicSource(spotify)),
         "clock": ClockProvider(),
     }
 
 
+def _expedite(scheduler: RefreshScheduler, runtime: BackendRuntime, name: str) -> Callable[[], None]:
+    """Return a callback that refreshes one provider on the next pass."""
+
+    def expedite() -> None:
+        scheduler.expedite_provider(name)
+        runtime.wake()
+
+    return expedite
+
+
+def _racing_source(client, transport: PooledHttpTransport):
+    """Poll racing feeds, streaming F1 timing when the SignalR proxy is set."""
+
+    source = LiveRacingSource(client, PooledTextHttpClient(transport))
+    proxy_host = os.environ.get("F1_SIGNALR_PROXY_HOST", "").strip()
+    if not proxy_host:
+        return source
+    return StreamingRacingSource(source, SignalRTimingFeed(proxy_host))
+
+
 def _provider_fetch(provider: object):
-    """Expose ticker-scoped music while retaining ordinary provider ports."""
+    """Expose shared, ticker-scoped, or ordinary provider fetch ports."""
 
+    shared = getattr(provider, "fetch_shared", None)
+    if callable(shared) and callable(_provider_finalize(provider)):
+        return shared
     scoped = getattr(provider, "fetch_for_ticker", None)
     if callable(scoped):
         return scoped
@@ -154,31 +289,30 @@ def _provider_fetch(provider: object):
     return fetch
 
 
+def _provider_finalize(provider: object):
+    """Return the per-ticker step that follows one shared provider fetch."""
+
+    finalize = getattr(provider, "finalize_for_ticker", None)
+    return finalize if callable(finalize) else None
+
+
 def _provider_settings_key(name: str):
     """Return only the settings that can change one provider result."""
 
     if name == "espn":
-        return lambda settings: _sports_key(settings, ESPN_SCOREBOARD_PATHS) + (
-            settings.my_teams,
-            settings.score_alerts,
-            settings.live_delay_mode,
-            settings.live_delay_seconds,
-        )
+        return lambda settings: _sports_key(settings, ESPN_SCOREBOARD_PATHS)
     if name == "fotmob":
-        return lambda settings: _sports_key(settings, FOTMOB_LEAGUES) + (
-            settings.my_teams,
-            settings.score_alerts,
-            settings.live_delay_mode,
-            settings.live_delay_seconds,
-        )
+        return lambda settings: _sports_key(settings, FOTMOB_LEAGUES)
     if name == "golf":
         return lambda settings: (settings.timezone, settings.active_sports.get("golf", True))
     if name == "racing":
         return lambda settings: _sports_key(settings, ("f1", "indycar"))
     if name == "stock":
-        return lambda settings: ()
+        return lambda settings: tuple(
+            group.id for group in selected_market_groups(settings.active_sports)
+        )
     if name == "weather":
-        return lambda settings: (settings.weather_lat, settings.weather_lon, settings.weather_city)
+        return lambda settings: (weather_bucket(settings), settings.weather_city)
     if name == "flights":
         return lambda settings: (
             settings.airport_code_iata,
@@ -204,10 +338,17 @@ def _sports_key(settings: DisplaySettings, identifiers) -> tuple[object, ...]:
     )
 
 
-def _positive_float(value: object) -> float:
-    result = float(value)
+def _positive_float(name: str, default: str) -> float:
+    result = float(os.environ.get(name, default))
+    if result <= 0:
+        raise ValueError(f"{name} must be positive")
+    return result
+
+
+def _positive_int(name: str, default: str) -> int:
+    result = int(os.environ.get(name, default))
     if result <= 0:
-        raise ValueError("TICKER_REFRESH_TICK_SECONDS must be positive")
+        raise ValueError(f"{name} must be positive")
     return result
 
 
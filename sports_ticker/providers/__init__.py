@@ -2,8 +2,10 @@
 
 from .contracts import Provider, ProviderHealth, ProviderPort, ProviderResult
 from .catalog import EspnTeamCatalog
+from .detail_cache import MatchDetailCache
 from .espn import EspnScoreboardProvider
 from .fotmob import FotMobSoccerProvider
+from .f1_live_timing import ReplayTimingFeed, SignalRTimingFeed, StreamingRacingSource, TimingFeed
 from .features import (
     FeaturePayload,
     FeatureProviders,
@@ -18,8 +20,14 @@ from .features import (
 from .flights import FlightsProvider
 from .golf import GolfProvider
 from .http import (
+    DecodedResponseCache,
+    HttpResponse,
     JsonHttpClient,
     JsonHttpError,
+    PooledHttpTransport,
+    PooledJsonHttpClient,
+    PooledTextHttpClient,
+    SingleFlightJsonHttpClient,
     TextHttpClient,
     UrllibJsonHttpClient,
     UrllibTextHttpClient,
@@ -41,6 +49,7 @@ __all__ = [
     "EspnScoreboardProvider",
     "FotMobSoccerProvider",
     "EspnTeamCatalog",
+    "DecodedResponseCache",
     "FeaturePayload",
     "FeatureProviders",
     "FeatureSource",
@@ -48,20 +57,30 @@ __all__ = [
     "FlightsSource",
     "GolfProvider",
     "GolfSource",
+    "HttpResponse",
     "JsonHttpClient",
     "JsonHttpError",
     "LiveRacingSource",
+    "MatchDetailCache",
     "MusicProvider",
     "MusicSource",
     "NewsProvider",
     "NewsSource",
     "OpenMeteoWeatherProvider",
+    "PooledHttpTransport",
+    "PooledJsonHttpClient",
+    "PooledTextHttpClient",
     "RacingProvider",
     "RacingSource",
+    "ReplayTimingFeed",
     "ScoreAlertTracker",
+    "SignalRTimingFeed",
+    "SingleFlightJsonHttpClient",
     "StockProvider",
     "StockSource",
+    "StreamingRacingSource",
     "TextHttpClient",
+    "TimingFeed",
     "UrllibJsonHttpClient",
     "UrllibTextHttpClient",
     "normalize_content",
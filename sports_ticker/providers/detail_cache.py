@@ -0,0 +1,218 @@
+"""Bounded match-detail cache with state-aware freshness and optional storage."""
+
+from __future__ import annotations
+
+import json
+import math
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from time import time
+from types import MappingProxyType
+from typing import Any
+
+
+_LIVE_STATES = frozenset({"in", "half"})
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    """Store one detail payload with the match state it was fetched in."""
+
+    fetched_at: float
+    state: str
+    payload: Mapping[str, Any]
+
+
+class MatchDetailCache:
+    """Keep recent match details in a bounded LRU with per-state freshness.
+
+    A payload stays fresh while its match is in the state it was fetched in
+    and younger than that state's lifetime: ``finished_seconds`` for final
+    matches, ``scheduled_seconds`` before kickoff, and ``live_seconds``
+    during play. At most ``max_entries`` matches are kept, evicting the
+    least recently used. When ``path`` is given, finished and scheduled
+    details are also kept in a SQLite file so a restart does not refetch
+    them; live details go stale within seconds and stay in memory. Writes
+    are queued under the cache lock and applied to the file outside it, in
+    order, so readers never wait on storage.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        max_entries: int = 512,
+        finished_seconds: float = 86_400.0,
+        scheduled_seconds: float = 1_800.0,
+        live_seconds: float = 5.0,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        if int(max_entries) < 1:
+            raise ValueError("max_entries must be at least one")
+        lifetimes = (float(finished_seconds), float(scheduled_seconds), float(live_seconds))
+        if any(not math.isfinite(value) or value < 0 for value in lifetimes):
+            raise ValueError("detail lifetimes must be finite non-negative numbers")
+        finished, scheduled, live = lifetimes
+        self._max_entries = int(max_entries)
+        self._lifetimes = {"post": finished, "pre": scheduled, "in": live, "half": live}
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._counts = {"hits": 0, "misses": 0, "evictions": 0, "restored": 0}
+        self._lock = threading.Lock()
+        self._store_lock = threading.Lock()
+        self._pending: list[tuple[list[str], tuple[str, float, str, str] | None]] = []
+        self._database = self._open(path) if path is not None else None
+
+    def get(self, match_id: str, state: str) -> Mapping[str, Any] | None:
+        """Return the fresh payload for a match in ``state``, if one is cached."""
+
+        with self._lock:
+            entry = self._entries.get(match_id)
+            if entry is None or not self._fresh(entry, state):
+                self._counts["misses"] += 1
+                return None
+            self._entries.move_to_end(match_id)
+            self._counts["hits"] += 1
+            return entry.payload
+
+    def latest(self, match_id: str) -> Mapping[str, Any] | None:
+        """Return the last payload for a match regardless of its freshness."""
+
+        with self._lock:
+            entry = self._entries.get(match_id)
+            return None if entry is None else entry.payload
+
+    def set(self, match_id: str, state: str, payload: Mapping[str, Any]) -> None:
+        """Replace one match payload and evict the least recently used beyond capacity."""
+
+        entry = _Entry(self._clock(), state, payload)
+        row = None
+        if self._database is not None and _persisted(entry):
+            try:
+                row = (
+                    match_id,
+                    entry.fetched_at,
+                    state,
+                    json.dumps(payload, separators=(",", ":")),
+                )
+            except (TypeError, ValueError):
+                row = None
+        with self._lock:
+            previous = self._entries.get(match_id)
+            self._entries[match_id] = entry
+            self._entries.move_to_end(match_id)
+            deleted = []
+            while len(self._entries) > self._max_entries:
+                evicted_id, evicted = self._entries.popitem(last=False)
+                self._counts["evictions"] += 1
+                if _persisted(evicted):
+                    deleted.append(evicted_id)
+            if row is None and previous is not None and _persisted(previous):
+                deleted.append(match_id)
+            if self._database is None or (row is None and not deleted):
+                return
+            self._pending.append((deleted, row))
+        self._store()
+
+    def stats(self) -> Mapping[str, int]:
+        """Return size, hit, miss, eviction, and restored-entry counts."""
+
+        with self._lock:
+            counts = dict(self._counts)
+            counts["entries"] = len(self._entries)
+        return MappingProxyType(counts)
+
+    def close(self) -> None:
+        """Close the optional SQLite store; the memory cache keeps working."""
+
+        with self._store_lock:
+            with self._lock:
+                database, self._database = self._database, None
+                self._pending.clear()
+            if database is not None:
+                database.close()
+
+    def _fresh(self, entry: _Entry, state: str) -> bool:
+        if state in _LIVE_STATES:
+            same_state = entry.state in _LIVE_STATES
+        else:
+            same_state = entry.state == state
+        lifetime = self._lifetimes.get(state, 0.0)
+        return same_state and self._clock() - entry.fetched_at < lifetime
+
+    def _open(self, path: str | Path) -> sqlite3.Connection | None:
+        """Open the store and restore unexpired details, or run memory-only."""
+
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            database = sqlite3.connect(str(path), check_same_thread=False)
+            with database:
+                database.execute(
+                    "CREATE TABLE IF NOT EXISTS match_details ("
+                    "match_id TEXT PRIMARY KEY, fetched_at REAL NOT NULL, "
+                    "state TEXT NOT NULL, payload TEXT NOT NULL)"
+                )
+                now = self._clock()
+                for state in ("pre", "post"):
+                    database.execute(
+                        "DELETE FROM match_details WHERE state = ? AND fetched_at <= ?",
+                        (state, now - self._lifetimes[state]),
+                    )
+                database.execute(
+                    "DELETE FROM match_details WHERE state NOT IN ('pre', 'post')"
+                )
+                rows = database.execute(
+                    "SELECT match_id, fetched_at, state, payload FROM match_details "
+                    "ORDER BY fetched_at DESC LIMIT ?",
+                    (self._max_entries,),
+                ).fetchall()
+        except (OSError, sqlite3.Error):
+            return None
+        for match_id, fetched_at, state, payload in reversed(rows):
+            try:
+                value = json.loads(payload)
+            except ValueError:
+                continue
+            if isinstance(value, Mapping):
+                self._entries[str(match_id)] = _Entry(float(fetched_at), str(state), value)
+        self._counts["restored"] = len(self._entries)
+        return database
+
+    def _store(self) -> None:
+        """Apply queued writes to the store in order, outside the cache lock."""
+
+        with self._store_lock:
+            with self._lock:
+                database = self._database
+                pending, self._pending = self._pending, []
+            if database is None or not pending:
+                return
+            try:
+                with database:
+                    for deleted, row in pending:
+                        if deleted:
+                            database.executemany(
+                                "DELETE FROM match_details WHERE match_id = ?",
+                                [(value,) for value in deleted],
+                            )
+                        if row is not None:
+                            database.execute(
+                                "INSERT OR REPLACE INTO match_details "
+                                "(match_id, fetched_at, state, payload) VALUES (?, ?, ?, ?)",
+                                row,
+                            )
+            except sqlite3.Error:
+                return
+
+
+def _persisted(entry: _Entry) -> bool:
+    """Return whether an entry's state is mirrored into the store."""
+
+    return entry.state not in _LIVE_STATES
+
+
+__all__ = ["MatchDetailCache"]
@@ -5,8 +5,11 @@ from __future__ import annotations
 from collections.abc import Callable, Mapping, Sequence
 from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
+import hashlib
+import json
 from math import isfinite
 import re
+from threading import Lock
 from types import MappingProxyType
 from typing import Any
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
@@ -17,7 +20,7 @@ from sports_ticker.domain import ContentItem, DisplaySettings
 from .contracts import ProviderHealth, ProviderResult
 from .http import JsonHttpClient, UrllibJsonHttpClient
 from .logo_overrides import corrected_logo
-from .score_alerts import ScoreAlertTracker, alerts_for_settings
+from .score_alerts import ScoreAlertTracker, score_games, with_score_alerts
 from .sports_display import (
     SportsDisplayProjector,
     assign_active_team,
@@ -29,6 +32,8 @@ from .stale_cache import SettingsResultCache
 
 
 _DETAIL_LEAGUES = frozenset(("mlb", "nhl"))
+_STALE_SECONDS = 6 * 3600.0
+_SLICE_RETENTION = timedelta(hours=1)
 _MLB_PITCH_LABELS = {
     "four seam fastball": "4S Fastball",
     "two seam fastball": "2S Fastball",
@@ -69,6 +74,7 @@ class EspnScoreboardProvider:
         *,
         timeout: float = 10.0,
         now: Callable[[], datetime] | None = None,
+        max_workers: int = 8,
     ) -> None:
         if not isinstance(scoreboard_urls, Mapping):
             raise TypeError("scoreboard_urls must be a mapping")
@@ -87,45 +93,85 @@ class EspnScoreboardProvider:
         self.timeout = float(timeout)
         if not isfinite(self.timeout) or self.timeout <= 0:
             raise ValueError("timeout must be a finite positive number")
-        self._stale_cache = SettingsResultCache()
+        if int(max_workers) < 1:
+            raise ValueError("max_workers must be at least one")
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(max_workers),
+            thread_name_prefix="ticker-espn",
+        )
+        self._stale_cache = SettingsResultCache(self._settings_key, max_age=_STALE_SECONDS)
         self._display = SportsDisplayProjector()
+        self._projection_lock = Lock()
+        self._projections: dict[tuple[str, str], tuple[bytes, ContentItem]] = {}
+        self._slices: dict[tuple[str, tuple[date, ...]], tuple[datetime, frozenset[str]]] = {}
         self._score_alerts = ScoreAlertTracker()
-        self._score_alerts_by_ticker: dict[str, ScoreAlertTracker] = {}
         self._now = now or (lambda: datetime.now(timezone.utc))
 
+    @property
+    def result_cache(self) -> SettingsResultCache:
+        """Return the stale-result cache so its counters can be reported."""
+
+        return self._stale_cache
+
     def fetch(self, settings: DisplaySettings) -> ProviderResult:
         """Fetch current scoreboard events from each configured active league."""
 
-        return self._fetch(settings, self._score_alerts)
+        return with_score_alerts(self.fetch_shared(settings), settings, self._score_alerts)
 
     def fetch_for_ticker(self, ticker_id: str, settings: DisplaySettings) -> ProviderResult:
-        """Fetch one ticker scoreboard with score memory isolated to that ticker."""
+        """Fetch one ticker scoreboard with that ticker's score alerts."""
+
+        return self.finalize_for_ticker(ticker_id, settings, self.fetch_shared(settings))
+
+    def fetch_shared(self, settings: DisplaySettings) -> ProviderResult:
+        """Fetch scoreboard content shared by every ticker with these leagues."""
+
+        return self._fetch(settings)
+
+    def finalize_for_ticker(
+        self, ticker_id: str, settings: DisplaySettings, result: ProviderResult
+    ) -> ProviderResult:
+        """Attach one ticker's score alerts to a shared scoreboard result."""
+
+        del ticker_id
+        return with_score_alerts(result, settings, self._score_alerts)
 
-        identifier = str(ticker_id).strip()
-        tracker = self._score_alerts_by_ticker.setdefault(identifier, ScoreAlertTracker())
-        return self._fetch(settings, tracker)
+    def close(self) -> None:
+        """Stop the owned request pool without waiting for abandoned calls."""
 
-    def _fetch(self, settings: DisplaySettings, score_alerts: ScoreAlertTracker) -> ProviderResult:
-        """Fetch scoreboard content and emit only alerts allowed by ticker settings."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch(self, settings: DisplaySettings) -> ProviderResult:
+        """Fetch scoreboard content without ticker-scoped score alerts."""
 
         if not isinstance(settings, DisplaySettings):
             raise TypeError("settings must be DisplaySettings")
 
         items: list[ContentItem] = []
         errors: list[str] = []
-        active_sources = 0
         failed_sources = 0
         current = self._now()
         dates = _scoreboard_dates(settings.timezone, now=current)
         seen_events: set[tuple[str, str]] = set()
-        for league, url in self.scoreboard_urls.items():
-            if not settings.active_sports.get(league, True):
-                continue
-            active_sources += 1
-            request_url = _scoreboard_url_for_dates(url, dates)
+        requests = [
+            (
+                league,
+                self._executor.submit(
+                    self.client.get_json,
+                    _scoreboard_url_for_dates(url, dates),
+                    timeout=self.timeout,
+                ),
+            )
+            for league, url in self.scoreboard_urls.items()
+            if settings.active_sports.get(league, True)
+        ]
+        active_sources = len(requests)
+        for league, request in requests:
             try:
-                payload = self.client.get_json(request_url, timeout=self.timeout)
-                for event in _events(payload):
+                payload = request.result()
+                events = _events(payload)
+                self._forget_projections(league, dates, events, current)
+                for event in events:
                     event_id = str(event.get("id") or "").strip()
                     if event_id and (league, event_id) in seen_events:
                         continue
@@ -138,8 +184,7 @@ class EspnScoreboardProvider:
                     ):
                         continue
                     try:
-                        item = self._display.project(_content_item(league, event), event)
-                        items.append(item)
+                        items.append(self._project(league, event))
                     except (KeyError, TypeError, ValueError) as exc:
                         errors.append(f"{league} event: {exc}")
             except Exception as exc:
@@ -147,14 +192,7 @@ class EspnScoreboardProvider:
                 errors.append(f"{league}: {exc}")
 
         items = self._enrich_live_items(items)
-        score_games = [{"kind": item.kind, "id": item.id, **dict(item.data)} for item in items]
-        score_alerts.ingest(score_games)
-        alerts = alerts_for_settings(
-            score_alerts.recent(
-                delay=settings.live_delay_seconds if settings.live_delay_mode else 0.0,
-            ),
-            settings,
-        )
+        self._score_alerts.ingest(score_games(items))
         health = ProviderHealth(
             healthy=not errors,
             provider="espn",
@@ -162,7 +200,6 @@ class EspnScoreboardProvider:
         )
         result = ProviderResult(
             content=tuple(sorted(items, key=sports_content_sort_key)),
-            alerts=alerts,
             observed_at=datetime.now(timezone.utc),
             health=health,
         )
@@ -173,6 +210,61 @@ class EspnScoreboardProvider:
             return self._stale_result(settings, health.error or "all sources failed")
         return result
 
+    def _settings_key(self, settings: DisplaySettings) -> tuple[object, ...]:
+        """Return the settings that can change one scoreboard result."""
+
+        return (
+            settings.timezone,
+            tuple(settings.active_sports.get(league, True) for league in self.scoreboard_urls),
+        )
+
+    def _project(self, league: str, event: Mapping[str, Any]) -> ContentItem:
+        """Project one event, reusing the last item while its facts are unchanged."""
+
+        key = (league, str(event.get("id") or "").strip())
+        fingerprint = _event_fingerprint(event)
+        with self._projection_lock:
+            cached = self._projections.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1]
+            item = self._display.project(_content_item(league, event), event)
+            self._projections[key] = (fingerprint, item)
+        return item
+
+    def _forget_projections(
+        self,
+        league: str,
+        dates: tuple[date, ...],
+        events: Sequence[Mapping[str, Any]],
+        now: datetime,
+    ) -> None:
+        """Drop projections that no recently fetched scoreboard slice lists.
+
+        Settings variants in different time zones read different date slices
+        of one league, so each slice records the events it referenced and a
+        projection lives while any slice fetched within ``_SLICE_RETENTION``
+        still references it.
+        """
+
+        listed = frozenset(str(event.get("id") or "").strip() for event in events)
+        with self._projection_lock:
+            self._slices[(league, dates)] = (now, listed)
+            for key in [
+                key
+                for key, (fetched_at, _) in self._slices.items()
+                if now - fetched_at >= _SLICE_RETENTION
+            ]:
+                del self._slices[key]
+            referenced = set().union(
+                *(ids for (slice_league, _), (_, ids) in self._slices.items() if slice_league == league)
+            )
+            for key in [
+                key
+                for key in self._projections
+                if key[0] == league and key[1] not in referenced
+            ]:
+                del self._projections[key]
+
     def _stale_result(self, settings: DisplaySettings, error: str) -> ProviderResult:
         """Return last successful content with an unhealthy stale status."""
 
@@ -251,17 +343,17 @@ class EspnScoreboardProvider:
         if not targets:
             return list(items)
         enriched = list(items)
-        workers = min(8, len(targets))
-        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ticker-details") as pool:
-            futures = {
-                pool.submit(self._enrich_live_item, str(item.data.get("sport") or ""), item): index
-                for index, item in targets
-            }
-            for future, index in futures.items():
-                try:
-                    enriched[index] = future.result()
-                except Exception:
-                    continue
+        futures = {
+            self._executor.submit(
+                self._enrich_live_item, str(item.data.get("sport") or ""), item
+            ): index
+            for index, item in targets
+        }
+        for future, index in futures.items():
+            try:
+                enriched[index] = future.result()
+            except Exception:
+                continue
         return enriched
 
 
@@ -285,6 +377,21 @@ def _events(payload: Any) -> tuple[Mapping[str, Any], ...]:
     return tuple(events)
 
 
+def _event_fingerprint(event: Mapping[str, Any]) -> bytes:
+    """Digest the event facts that scoreboard projection reads."""
+
+    competition = _first_mapping(event.get("competitions"))
+    facts = (
+        event.get("id"),
+        event.get("date"),
+        event.get("status"),
+        competition.get("situation"),
+        competition.get("competitors"),
+    )
+    encoded = json.dumps(facts, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
 def _is_current_event(
     event: Mapping[str, Any],
     *,
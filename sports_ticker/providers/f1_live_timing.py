@@ -0,0 +1,494 @@
+"""Stream F1 live timing through the SignalR proxy into one in-memory session."""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import replace
+from http.cookiejar import CookieJar
+from pathlib import Path
+from typing import Any, Protocol
+from urllib.parse import urlencode
+from urllib.request import HTTPCookieProcessor, Request, build_opener
+
+from sports_ticker.domain import DisplaySettings
+
+from .features import RacingSource
+from .f1_teams import f1_car_url, f1_short_event, f1_team_color
+
+
+F1_TIMING_TOPICS = (
+    "Heartbeat",
+    "SessionInfo",
+    "SessionStatus",
+    "TrackStatus",
+    "LapCount",
+    "DriverList",
+    "TimingData",
+)
+_HUB = "Streaming"
+_CONNECTION_DATA = json.dumps([{"name": _HUB}], separators=(",", ":"))
+_TRACK_STATUS_FLAGS = {
+    "1": "GREEN",
+    "2": "YELLOW",
+    "4": "SAFETY CAR",
+    "5": "RED FLAG",
+    "6": "VSC",
+    "7": "VSC",
+}
+_FINISHED_STATUSES = frozenset(("finished", "finalised", "ends"))
+_RUNNING_STATUSES = frozenset(("started", "aborted"))
+
+
+class TimingFeed(Protocol):
+    """Port for one connection to a SignalR live timing feed."""
+
+    def messages(self) -> Iterator[str]:
+        """Yield raw SignalR message texts until the connection ends."""
+
+
+class SignalRTimingFeed:
+    """Read the F1 Streaming hub through the proxy over server-sent events.
+
+    The proxy forwards plain HTTP, so the standard-library client negotiates a
+    connection token, holds one ``serverSentEvents`` stream open, and sends
+    the topic subscription once the stream reports it is initialized.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        topics: tuple[str, ...] = F1_TIMING_TOPICS,
+        timeout: float = 60.0,
+    ) -> None:
+        base = str(host).strip().rstrip("/")
+        if not base:
+            raise ValueError("host must not be empty")
+        if "://" not in base:
+            base = f"https://{base}"
+        if not math.isfinite(timeout) or timeout <= 0:
+            raise ValueError("timeout must be finite and positive")
+        self._base = f"{base}/signalr"
+        self._topics = tuple(topics)
+        self._timeout = float(timeout)
+        self._lock = threading.Lock()
+        self._stream: Any = None
+
+    def messages(self) -> Iterator[str]:
+        """Yield every hub message from one connection, subscription result first."""
+
+        opener = build_opener(HTTPCookieProcessor(CookieJar()))
+        negotiate = self._read_json(
+            opener, Request(f"{self._base}/negotiate?{self._query()}")
+        )
+        token = str(negotiate.get("ConnectionToken") or "")
+        if not token:
+            raise ConnectionError("F1 live timing did not return a connection token")
+        query = self._query(transport="serverSentEvents", connectionToken=token)
+        request = Request(f"{self._base}/connect?{query}", headers={"Accept": "text/event-stream"})
+        with opener.open(request, timeout=self._timeout) as stream:
+            with self._lock:
+                self._stream = stream
+            for raw in stream:
+                line = raw.decode("utf-8", "replace").strip()
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data != "initialized":
+                    yield data
+                    continue
+                self._read_json(opener, Request(f"{self._base}/start?{query}"))
+                subscribed = self._read_json(
+                    opener,
+                    Request(
+                        f"{self._base}/send?{query}",
+                        data=urlencode(
+                            {"data": json.dumps({"H": _HUB, "M": "Subscribe", "A": [list(self._topics)], "I": 1})}
+                        ).encode("utf-8"),
+                        headers={"Content-Type": "application/x-www-form-urlencoded"},
+                        method="POST",
+                    ),
+                )
+                if "R" in subscribed:
+                    yield json.dumps(subscribed)
+
+    def close(self) -> None:
+        """Close the open event stream so a blocked read returns at once."""
+
+        with self._lock:
+            stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.close()
+
+    def _query(self, **values: str) -> str:
+        return urlencode({"clientProtocol": "1.5", **values, "connectionData": _CONNECTION_DATA})
+
+    def _read_json(self, opener: Any, request: Request) -> Mapping[str, Any]:
+        with opener.open(request, timeout=self._timeout) as response:
+            body = response.read()
+        value = json.loads(body) if body.strip() else {}
+        return value if isinstance(value, Mapping) else {}
+
+
+class ReplayTimingFeed:
+    """Replay a recorded feed file holding one raw SignalR message per line.
+
+    A reconnect resumes after the last message handed out, and a finished
+    replay yields nothing more, so stale positions are never sent again.
+    """
+
+    def __init__(self, path: str | Path, *, delay: float = 0.0) -> None:
+        if not math.isfinite(delay) or delay < 0:
+            raise ValueError("delay must be finite and non-negative")
+        self._path = Path(path)
+        self._delay = float(delay)
+        self._consumed = 0
+
+    def messages(self) -> Iterator[str]:
+        """Yield each unsent recorded message, pausing ``delay`` seconds between them."""
+
+        with self._path.open(encoding="utf-8") as recording:
+            index = 0
+            for line in recording:
+                text = line.strip()
+                if not text:
+                    continue
+                index += 1
+                if index <= self._consumed:
+                    continue
+                self._consumed = index
+                yield text
+                if self._delay:
+                    time.sleep(self._delay)
+
+
+class F1TimingSession:
+    """Apply Streaming hub snapshots and deltas to one session's topic state."""
+
+    def __init__(self) -> None:
+        self._topics: dict[str, Any] = {}
+        self._revision = 0
+        self._record: tuple[int, dict[str, Any] | None] = (-1, None)
+
+    def apply_message(self, text: str) -> bool:
+        """Apply one raw hub message and return whether its headline changed.
+
+        The headline is the session state, the track flag, and the leader, so
+        a change to any of them is worth an immediate refresh.
+        """
+
+        try:
+            message = json.loads(text)
+        except (TypeError, ValueError):
+            return False
+        if not isinstance(message, Mapping):
+            return False
+        before = self.headline()
+        snapshot = message.get("R")
+        if isinstance(snapshot, Mapping):
+            for topic, data in snapshot.items():
+                self._topics[str(topic)] = data
+                self._revision += 1
+        for call in message.get("M") or ():
+            if not isinstance(call, Mapping) or call.get("M") != "feed":
+                continue
+            arguments = call.get("A")
+            if not isinstance(arguments, list) or len(arguments) < 2:
+                continue
+            topic = str(arguments[0])
+            self._topics[topic] = _merge(self._topics.get(topic), arguments[1])
+            if topic != "Heartbeat":
+                self._revision += 1
+        return self.headline() != before
+
+    def headline(self) -> tuple[str, str, str]:
+        """Return the session state, the track flag, and the leading car."""
+
+        if not isinstance(self._topics.get("SessionInfo"), Mapping):
+            return ("", "", "")
+        leader = next((line for line in self._ordered_lines() if _integer(line[1].get("Position")) == 1), None)
+        return (self._state(), self._flag(), leader[0] if leader else "")
+
+    def record(self) -> dict[str, Any] | None:
+        """Return the current racing record, rebuilt only after new data."""
+
+        revision, record = self._record
+        if revision == self._revision:
+            return record
+        record = self._build_record()
+        self._record = (self._revision, record)
+        return record
+
+    def _build_record(self) -> dict[str, Any] | None:
+        info = self._topics.get("SessionInfo")
+        if not isinstance(info, Mapping):
+            return None
+        meeting = info.get("Meeting") if isinstance(info.get("Meeting"), Mapping) else {}
+        circuit = meeting.get("Circuit") if isinstance(meeting.get("Circuit"), Mapping) else {}
+        laps = self._topics.get("LapCount") if isinstance(self._topics.get("LapCount"), Mapping) else {}
+        lap = _integer(laps.get("CurrentLap"))
+        total_laps = _integer(laps.get("TotalLaps"))
+        session_name = str(info.get("Name") or info.get("Type") or "Session")
+        event_name = f1_short_event(str(meeting.get("Name") or "Formula 1"))
+        state = self._state()
+        flag = "WHITE" if state == "pre" else "CHECKERED" if state == "post" else self._flag()
+        qualifying = "qual" in session_name.lower()
+        if state == "post":
+            status = "FINAL"
+        elif state == "pre":
+            status = "Scheduled"
+        else:
+            status = f"Lap {lap}/{total_laps}" if lap and total_laps else flag
+        return {
+            "id": f"f1_live_{info.get('Key') or session_name.lower()}",
+            "type": "racing",
+            "sport": "f1",
+            "state": state,
+            "status": status,
+            "is_shown": True,
+            "startTimeUTC": str(info.get("StartDate") or ""),
+            "away_abbr": event_name,
+            "home_abbr": session_name,
+            "away_score": "",
+            "home_score": "",
+            "f1": {
+                "event_name": event_name,
+                "short_name": event_name,
+                "track_name": str(circuit.get("ShortName") or event_name),
+                "session_type": session_name,
+                "session_name": session_name,
+                "lap": lap,
+                "total_laps": total_laps,
+                "laps_remaining": max(0, total_laps - lap),
+                "time_to_go": "",
+                "caution": flag in {"YELLOW", "SAFETY CAR", "VSC", "RED FLAG"},
+                "flag": flag,
+                "drivers": [self._driver(number, line, qualifying) for number, line in self._ordered_lines()],
+                "weather": {},
+            },
+        }
+
+    def _driver(self, number: str, line: Mapping[str, Any], qualifying: bool) -> dict[str, Any]:
+        drivers = self._topics.get("DriverList")
+        info = drivers.get(number) if isinstance(drivers, Mapping) else None
+        info = info if isinstance(info, Mapping) else {}
+        team = str(info.get("TeamName") or "")
+        pos = _integer(line.get("Position"), 999)
+        if qualifying:
+            best = line.get("BestLapTime")
+            gap = str(best.get("Value") or "") if isinstance(best, Mapping) else ""
+        elif pos == 1:
+            gap = "Leader"
+        else:
+            interval = line.get("IntervalToPositionAhead")
+            value = interval.get("Value") if isinstance(interval, Mapping) else line.get("GapToLeader")
+            gap = _gap_text(value)
+        retired = bool(line.get("Retired") or line.get("Stopped"))
+        return {
+            "pos": pos,
+            "name": str(info.get("FullName") or info.get("BroadcastName") or f"Driver {number}").title(),
+            "abbr": str(info.get("Tla") or number)[:3].upper(),
+            "car": number,
+            "team": team,
+            "team_logo": "",
+            "car_illustration": f1_car_url(team),
+            "livery_primary": f"#{info['TeamColour']}" if info.get("TeamColour") else f1_team_color(team),
+            "livery_secondary": "#111111",
+            "gap": gap,
+            "speed": "",
+            "status": "Out" if retired else "Pit" if line.get("InPit") else "Active",
+            "on_track": not retired and not line.get("InPit"),
+        }
+
+    def _ordered_lines(self) -> list[tuple[str, Mapping[str, Any]]]:
+        timing = self._topics.get("TimingData")
+        lines = timing.get("Lines") if isinstance(timing, Mapping) else None
+        if not isinstance(lines, Mapping):
+            return []
+        ordered = [
+            (str(number), line)
+            for number, line in lines.items()
+            if isinstance(line, Mapping) and line.get("Position")
+        ]
+        return sorted(ordered, key=lambda item: _integer(item[1].get("Position"), 999))
+
+    def _state(self) -> str:
+        status = self._topics.get("SessionStatus")
+        value = str(status.get("Status") or "").lower() if isinstance(status, Mapping) else ""
+        if value in _FINISHED_STATUSES:
+            return "post"
+        return "in" if value in _RUNNING_STATUSES else "pre"
+
+    def _flag(self) -> str:
+        status = self._topics.get("TrackStatus")
+        code = str(status.get("Status") or "") if isinstance(status, Mapping) else ""
+        return _TRACK_STATUS_FLAGS.get(code, "GREEN")
+
+
+class StreamingRacingSource:
+    """Serve F1 from a live timing stream and other series from a polling source.
+
+    One daemon thread holds the feed open, applies every message to an
+    in-memory session, and reconnects after ``reconnect_seconds`` when the
+    feed ends or fails. ``fetch`` only reads that session, so F1 costs
+    nothing per pass. The session is left out once no message has arrived
+    for ``stale_after`` seconds, and a feed failure is reported as unhealthy
+    racing health until the next message arrives.
+    """
+
+    streams_f1 = True
+
+    def __init__(
+        self,
+        fallback: RacingSource,
+        feed: TimingFeed,
+        *,
+        stale_after: float = 300.0,
+        reconnect_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not callable(getattr(fallback, "fetch", None)):
+            raise TypeError("fallback must provide fetch(settings)")
+        if not callable(getattr(feed, "messages", None)):
+            raise TypeError("feed must provide messages()")
+        for name, value in (("stale_after", stale_after), ("reconnect_seconds", reconnect_seconds)):
+            if not math.isfinite(value) or value <= 0:
+                raise ValueError(f"{name} must be finite and positive")
+        self._fallback = fallback
+        self._feed = feed
+        self._on_change: Callable[[], object] | None = None
+        self._stale_after = float(stale_after)
+        self._reconnect_seconds = float(reconnect_seconds)
+        self._clock = clock
+        self._session = F1TimingSession()
+        self._received_at: float | None = None
+        self._error: str | None = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, on_change: Callable[[], object] | None = None) -> None:
+        """Open the feed on a daemon thread once.
+
+        ``on_change`` runs after a flag, leader, or session state change.
+        """
+
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._on_change = on_change
+            self._thread = threading.Thread(target=self._run, name="ticker-f1-timing", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop reconnecting and close the feed's open connection."""
+
+        self._stopped.set()
+        close = getattr(self._feed, "close", None)
+        if callable(close):
+            close()
+
+    def fetch(self, settings: DisplaySettings) -> Mapping[str, object]:
+        """Return polled IndyCar and NASCAR content plus the streamed F1 session."""
+
+        if not isinstance(settings, DisplaySettings):
+            raise TypeError("settings must be DisplaySettings")
+        show_f1 = settings.active_sports.get("f1", True)
+        active_sports = dict(settings.active_sports)
+        active_sports["f1"] = False
+        payload = self._fallback.fetch(replace(settings, active_sports=active_sports))
+        result = dict(payload) if isinstance(payload, Mapping) else {"content": list(payload)}
+        record = self.session_record() if show_f1 else None
+        if record is not None:
+            result["content"] = [*result.get("content", ()), record]
+        with self._lock:
+            error = self._error
+        if show_f1 and error is not None:
+            health = result.get("health")
+            previous = health.get("error") if isinstance(health, Mapping) else None
+            result["health"] = {
+                "provider": "racing",
+                "healthy": False,
+                "error": "; ".join(filter(None, (previous, f"f1: {error}"))),
+            }
+        return result
+
+    def session_record(self) -> dict[str, Any] | None:
+        """Return the streamed session record while the feed is current."""
+
+        with self._lock:
+            if self._received_at is None or self._clock() - self._received_at >= self._stale_after:
+                return None
+            return self._session.record()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                for text in self._feed.messages():
+                    if self._stopped.is_set():
+                        return
+                    with self._lock:
+                        self._received_at = self._clock()
+                        self._error = None
+                        changed = self._session.apply_message(text)
+                    if changed and self._on_change is not None:
+                        try:
+                            self._on_change()
+                        except Exception:
+                            pass
+            except Exception as error:
+                if self._stopped.is_set():
+                    return
+                with self._lock:
+                    self._error = str(error) or type(error).__name__
+            self._stopped.wait(self._reconnect_seconds)
+
+
+def _merge(current: Any, delta: Any) -> Any:
+    """Apply one Streaming hub delta, where list updates arrive keyed by index."""
+
+    if isinstance(delta, Mapping) and isinstance(current, list):
+        merged_list = list(current)
+        for key, value in delta.items():
+            index = _integer(key, -1)
+            if 0 <= index < len(merged_list):
+                merged_list[index] = _merge(merged_list[index], value)
+            elif index == len(merged_list):
+                merged_list.append(value)
+        return merged_list
+    if not isinstance(delta, Mapping) or not isinstance(current, Mapping):
+        return delta
+    merged = dict(current)
+    for key, value in delta.items():
+        merged[key] = _merge(merged.get(key), value)
+    return merged
+
+
+def _integer(value: object, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _gap_text(value: object) -> str:
+    """Show a timing gap in seconds, leaving lapped gaps as sent."""
+
+    text = str(value or "").strip()
+    if not text or text.endswith("s") or "L" in text.upper():
+        return text
+    return f"{text}s"
+
+
+__all__ = [
+    "F1_TIMING_TOPICS",
+    "F1TimingSession",
+    "ReplayTimingFeed",
+    "SignalRTimingFeed",
+    "StreamingRacingSource",
+    "TimingFeed",
+]
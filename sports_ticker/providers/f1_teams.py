@@ -0,0 +1,68 @@
+"""Share F1 team liveries and event labels between the polled and streamed feeds."""
+
+from __future__ import annotations
+
+import re
+
+
+_TEAM_SLUGS = {
+    "mclaren": "mclaren",
+    "mercedes": "mercedes",
+    "ferrari": "ferrari",
+    "red bull": "redbullracing",
+    "racing bulls": "racingbulls",
+    "aston martin": "astonmartin",
+    "alpine": "alpine",
+    "williams": "williams",
+    "haas": "haasf1team",
+    "audi": "audi",
+    "sauber": "audi",
+    "cadillac": "cadillac",
+}
+_TEAM_COLORS = {
+    "mclaren": "#FF8000",
+    "mercedes": "#27F4D2",
+    "ferrari": "#E8002D",
+    "red bull": "#3671C6",
+    "racing bulls": "#6692FF",
+    "aston martin": "#229971",
+    "alpine": "#FF87BC",
+    "williams": "#64C4FF",
+    "haas": "#B6BABD",
+    "sauber": "#BB0000",
+    "audi": "#BB0000",
+    "cadillac": "#9CA3AF",
+}
+
+
+def f1_short_event(value: str) -> str:
+    """Shorten an F1 meeting name to its ``<Country> GP`` label."""
+
+    text = re.sub(r"^.*?\s+([A-Za-zÀ-ÿ -]+?)\s+Grand Prix.*$", r"\1 GP", value, flags=re.IGNORECASE)
+    text = text.replace("FORMULA 1", "").strip()
+    return " ".join(text.split()).title() or "Formula 1"
+
+
+def _team_match(value: object) -> str:
+    lower = str(value or "").strip().lower()
+    return next((key for key in sorted(_TEAM_SLUGS, key=len, reverse=True) if key in lower), "")
+
+
+def f1_team_color(value: object) -> str:
+    """Return the livery color for a team name, grey when unknown."""
+
+    return _TEAM_COLORS.get(_team_match(value), "#888888")
+
+
+def f1_car_url(value: object) -> str:
+    """Return the car illustration URL for a team name, empty when unknown."""
+
+    slug = _TEAM_SLUGS.get(_team_match(value))
+    return (
+        f"https://media.formula1.com/image/upload/c_lfill,h_224/q_auto/v1740000001/common/f1/2026/{slug}/2026{slug}carright.webp"
+        if slug
+        else ""
+    )
+
+
+__all__ = ["f1_car_url", "f1_short_event", "f1_team_color"]
@@ -59,6 +59,12 @@ class _FeatureProvider:
         self._source = source
         self._stale_cache = SettingsResultCache()
 
+    @property
+    def result_cache(self) -> SettingsResultCache:
+        """Return the stale-result cache so its counters can be reported."""
+
+        return self._stale_cache
+
     def _fetch_normalized(
         self,
         settings: DisplaySettings,
@@ -4,25 +4,23 @@ from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from threading import Lock
-from time import monotonic
 from typing import Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from sports_ticker.domain import ContentItem, DisplaySettings
 
 from .contracts import ProviderHealth, ProviderResult
+from .detail_cache import MatchDetailCache
 from .http import JsonHttpClient, UrllibJsonHttpClient
-from .score_alerts import ScoreAlertTracker, alerts_for_settings
+from .score_alerts import ScoreAlertTracker, score_games, with_score_alerts
 from .stale_cache import SettingsResultCache
 from .sports_display import normalize_soccer_clock, soccer_event
 
 
 _MATCHES_URL = "https://www.fotmob.com/api/data/matches"
 _DETAIL_URL = "https://www.fotmob.com/api/data/matchDetails?matchId={match_id}"
-_LIVE_DETAIL_SECONDS = 5.0
+_STALE_SECONDS = 6 * 3600.0
 _SOCCER_ABBREVIATIONS = {
     # Premier League
     "Arsenal": "ARS", "Aston Villa": "AVL", "Bournemouth": "BOU", "Brentford": "BRE",
@@ -53,15 +51,6 @@ _SOCCER_ABBREVIATIONS = {
 }
 
 
-@dataclass(frozen=True, slots=True)
-class _DetailCacheEntry:
-    """Store one detail payload with its terminal-state certainty."""
-
-    fetched_at: float
-    state: str
-    payload: Mapping[str, Any]
-
-
 class FotMobSoccerProvider:
     """Publish FotMob soccer scoreboards and live match facts."""
 
@@ -74,6 +63,7 @@ class FotMobSoccerProvider:
         *,
         timeout: float = 10.0,
         cache_seconds: float = 86_400.0,
+        detail_cache: MatchDetailCache | None = None,
     ) -> None:
         self._leagues = {
             str(identifier).strip().lower(): int(league_id)
@@ -82,26 +72,45 @@ class FotMobSoccerProvider:
         }
         self._client = client or UrllibJsonHttpClient(user_agent="Mozilla/5.0")
         self._timeout = float(timeout)
-        self._cache_seconds = float(cache_seconds)
-        self._details: dict[str, _DetailCacheEntry] = {}
-        self._details_lock = Lock()
-        self._stale_cache = SettingsResultCache()
+        self._detail_cache = detail_cache or MatchDetailCache(finished_seconds=cache_seconds)
+        self._stale_cache = SettingsResultCache(self._settings_key, max_age=_STALE_SECONDS)
         self._score_alerts = ScoreAlertTracker()
-        self._score_alerts_by_ticker: dict[str, ScoreAlertTracker] = {}
+
+    @property
+    def result_cache(self) -> SettingsResultCache:
+        """Return the stale-result cache so its counters can be reported."""
+
+        return self._stale_cache
 
     def fetch(self, settings: DisplaySettings) -> ProviderResult:
         """Fetch current scoreboard events from each configured active league."""
 
-        return self._fetch(settings, self._score_alerts)
+        return with_score_alerts(self.fetch_shared(settings), settings, self._score_alerts)
 
     def fetch_for_ticker(self, ticker_id: str, settings: DisplaySettings) -> ProviderResult:
-        """Fetch one ticker scoreboard with score memory isolated to that ticker."""
+        """Fetch one ticker scoreboard with that ticker's score alerts."""
+
+        return self.finalize_for_ticker(ticker_id, settings, self.fetch_shared(settings))
+
+    def fetch_shared(self, settings: DisplaySettings) -> ProviderResult:
+        """Fetch soccer content shared by every ticker with these leagues."""
+
+        return self._fetch(settings)
 
-        identifier = str(ticker_id).strip()
-        tracker = self._score_alerts_by_ticker.setdefault(identifier, ScoreAlertTracker())
-        return self._fetch(settings, tracker)
+    def finalize_for_ticker(
+        self, ticker_id: str, settings: DisplaySettings, result: ProviderResult
+    ) -> ProviderResult:
+        """Attach one ticker's score alerts to a shared soccer result."""
 
-    def _fetch(self, settings: DisplaySettings, score_alerts: ScoreAlertTracker) -> ProviderResult:
+        del ticker_id
+        return with_score_alerts(result, settings, self._score_alerts)
+
+    def close(self) -> None:
+        """Close the match-detail store."""
+
+        self._detail_cache.close()
+
+    def _fetch(self, settings: DisplaySettings) -> ProviderResult:
         """Fetch all enabled soccer leagues inside the local display window."""
 
         if not isinstance(settings, DisplaySettings):
@@ -136,17 +145,7 @@ class FotMobSoccerProvider:
             )
             for identifier, match in selected
         )
-        score_games = [
-            {"kind": item.kind, "id": item.id, **dict(item.data)}
-            for item in content
-        ]
-        score_alerts.ingest(score_games)
-        alerts = alerts_for_settings(
-            score_alerts.recent(
-                delay=settings.live_delay_seconds if settings.live_delay_mode else 0.0
-            ),
-            settings,
-        )
+        self._score_alerts.ingest(score_games(content))
         health = ProviderHealth(
             healthy=not errors,
             provider=self.provider_name,
@@ -154,7 +153,6 @@ class FotMobSoccerProvider:
         )
         result = ProviderResult(
             content=tuple(sorted(content, key=_sort_key)),
-            alerts=alerts,
             observed_at=datetime.now(timezone.utc),
             health=health,
         )
@@ -163,6 +161,14 @@ class FotMobSoccerProvider:
             return result
         return result if successes else self._stale_result(settings, health.error or "FotMob request failed")
 
+    def _settings_key(self, settings: DisplaySettings) -> tuple[object, ...]:
+        """Return the settings that can change one soccer result."""
+
+        return (
+            settings.timezone,
+            tuple(settings.active_sports.get(league, True) for league in self._leagues),
+        )
+
     def _fetch_details(
         self, records: Sequence[tuple[str, Mapping[str, Any]]]
     ) -> dict[str, Mapping[str, Any]]:
@@ -188,27 +194,18 @@ class FotMobSoccerProvider:
         match_id = str(match.get("id") or "").strip()
         if not match_id:
             return None
-        now = monotonic()
         state = _match_state(match)
-        fallback: Mapping[str, Any] | None = None
-        with self._details_lock:
-            cached = self._details.get(match_id)
-            if cached is not None:
-                fallback = cached.payload
-                age = now - cached.fetched_at
-                if state in {"pre", "post"} and cached.state == state and age < self._cache_seconds:
-                    return cached.payload
-                if state in {"in", "half"} and cached.state in {"in", "half"} and age < _LIVE_DETAIL_SECONDS:
-                    return cached.payload
+        cached = self._detail_cache.get(match_id, state)
+        if cached is not None:
+            return cached
         try:
             payload = self._client.get_json(_DETAIL_URL.format(match_id=match_id), timeout=self._timeout)
         except Exception:
-            return fallback
+            return self._detail_cache.latest(match_id)
         if not isinstance(payload, Mapping):
-            return fallback
+            return self._detail_cache.latest(match_id)
         detail = dict(payload)
-        with self._details_lock:
-            self._details[match_id] = _DetailCacheEntry(now, state, detail)
+        self._detail_cache.set(match_id, state, detail)
         return detail
 
     def _stale_result(self, settings: DisplaySettings, error: str) -> ProviderResult:
@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import math
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, replace
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from ssl import SSLContext, create_default_context
+from threading import Condition, Lock
+from time import monotonic
+from types import MappingProxyType
 from typing import Any, Protocol, runtime_checkable
 from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
 from urllib.request import Request, urlopen
 
+from .shared_results import SharedResultCache
+
 
 class JsonHttpError(RuntimeError):
     """Describe an HTTP, decoding, or JSON response failure."""
@@ -38,13 +50,7 @@ class UrllibJsonHttpClient:
     def get_json(self, url: str, *, timeout: float) -> Any:
         """Fetch and decode JSON with a required finite positive timeout."""
 
-        target = str(url).strip()
-        if not target:
-            raise ValueError("url must not be empty")
-        request_timeout = float(timeout)
-        if not math.isfinite(request_timeout) or request_timeout <= 0:
-            raise ValueError("timeout must be a finite positive number")
-
+        target, request_timeout = _request_target(url, timeout)
         request = Request(
             target,
             headers={"Accept": "application/json", "User-Agent": self._user_agent},
@@ -65,17 +71,7 @@ class UrllibJsonHttpClient:
             raise JsonHttpError(f"request timed out for {target}") from exc
         except OSError as exc:
             raise JsonHttpError(f"request failed for {target}: {exc}") from exc
-
-        try:
-            text = body.decode("utf-8")
-        except UnicodeDecodeError as exc:
-            raise JsonHttpError(f"response was not UTF-8 for {target}") from exc
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError as exc:
-            raise JsonHttpError(
-                f"invalid JSON for {target} at line {exc.lineno}, column {exc.colno}"
-            ) from exc
+        return _decode_json(body, target)
 
 
 class UrllibTextHttpClient:
@@ -87,12 +83,7 @@ class UrllibTextHttpClient:
     def get_text(self, url: str, *, timeout: float) -> str:
         """Fetch one text response with a required finite positive timeout."""
 
-        target = str(url).strip()
-        if not target:
-            raise ValueError("url must not be empty")
-        request_timeout = float(timeout)
-        if not math.isfinite(request_timeout) or request_timeout <= 0:
-            raise ValueError("timeout must be a finite positive number")
+        target, request_timeout = _request_target(url, timeout)
         request = Request(
             target,
             headers={"Accept": "text/html", "User-Agent": self._user_agent},
@@ -119,9 +110,461 @@ class UrllibTextHttpClient:
             raise JsonHttpError(f"response was not UTF-8 for {target}") from exc
 
 
+@dataclass(frozen=True, slots=True)
+class HttpResponse:
+    """Carry one complete response read from a pooled connection."""
+
+    status: int
+    reason: str = ""
+    headers: Mapping[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def __post_init__(self) -> None:
+        """Freeze response headers under lowercase names."""
+
+        object.__setattr__(
+            self,
+            "headers",
+            MappingProxyType(
+                {str(name).lower(): str(value) for name, value in self.headers.items()}
+            ),
+        )
+
+
+ConnectionFactory = Callable[[str, str, int, float], HTTPConnection]
+_HostKey = tuple[str, str, int]
+_REDIRECT_STATUSES = frozenset((301, 302, 303, 307, 308))
+_MAX_REDIRECTS = 5
+
+
+class PooledHttpTransport:
+    """Reuse keep-alive connections per host across provider threads.
+
+    At most ``max_per_host`` connections to one scheme, host, and port exist
+    at once; callers beyond that wait for a free one until their timeout.
+    Idle connections are closed after ``idle_seconds``. A request that fails
+    on a reused connection the server already dropped is retried once on a
+    fresh connection, since every request here is an idempotent GET.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_per_host: int = 4,
+        idle_seconds: float = 30.0,
+        ssl_context: SSLContext | None = None,
+        connection_factory: ConnectionFactory | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if int(max_per_host) < 1:
+            raise ValueError("max_per_host must be at least one")
+        idle = float(idle_seconds)
+        if not math.isfinite(idle) or idle <= 0:
+            raise ValueError("idle_seconds must be a finite positive number")
+        self._max_per_host = int(max_per_host)
+        self._idle_seconds = idle
+        self._ssl_context = ssl_context
+        self._connection_factory = connection_factory or self._open_connection
+        self._clock = clock
+        self._condition = Condition()
+        self._idle: dict[_HostKey, list[tuple[HTTPConnection, float]]] = {}
+        self._open: dict[_HostKey, int] = {}
+        self._counts = {"requests": 0, "reused": 0, "handshakes": 0, "evicted": 0}
+        self._closed = False
+
+    def request(
+        self,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        timeout: float,
+    ) -> HttpResponse:
+        """Send one GET, following redirects, and return the complete response."""
+
+        target = url
+        for _ in range(_MAX_REDIRECTS + 1):
+            response = self._request_once(target, headers, timeout)
+            location = response.headers.get("location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                return response
+            target = urljoin(target, location)
+        raise HTTPException(f"too many redirects for {url}")
+
+    def stats(self) -> Mapping[str, int]:
+        """Return request, reuse, handshake, and eviction counts."""
+
+        with self._condition:
+            counts = dict(self._counts)
+            counts["idle"] = sum(len(idle) for idle in self._idle.values())
+        return MappingProxyType(counts)
+
+    def close(self) -> None:
+        """Close every idle connection and stop pooling new ones."""
+
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, {}
+            for key, connections in idle.items():
+                self._open[key] = self._open.get(key, 0) - len(connections)
+            self._condition.notify_all()
+        for connections in idle.values():
+            for connection, _ in connections:
+                connection.close()
+
+    def _request_once(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float,
+    ) -> HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"unsupported URL: {url}")
+        key = (scheme, parts.hostname, parts.port or (443 if scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        request_headers = dict(headers)
+        request_headers.setdefault("Connection", "keep-alive")
+
+        with self._condition:
+            self._counts["requests"] += 1
+        retried = False
+        while True:
+            connection, reused = self._acquire(key, timeout)
+            try:
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                connection.request("GET", path, headers=request_headers)
+                raw = connection.getresponse()
+                body = raw.read()
+            except (ConnectionError, HTTPException):
+                self._discard(key, connection)
+                if reused and not retried:
+                    retried = True
+                    continue
+                raise
+            except BaseException:
+                self._discard(key, connection)
+                raise
+            if raw.will_close:
+                self._discard(key, connection)
+            else:
+                self._release(key, connection)
+            return HttpResponse(raw.status, raw.reason, dict(raw.getheaders()), body)
+
+    def _acquire(self, key: _HostKey, timeout: float) -> tuple[HTTPConnection, bool]:
+        deadline = self._clock() + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise ConnectionError("HTTP transport is closed")
+                self._evict_idle()
+                idle = self._idle.get(key)
+                if idle:
+                    connection, _ = idle.pop()
+                    self._counts["reused"] += 1
+                    return connection, True
+                if self._open.get(key, 0) < self._max_per_host:
+                    self._open[key] = self._open.get(key, 0) + 1
+                    self._counts["handshakes"] += 1
+                    break
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    raise TimeoutError(f"no free connection to {key[1]}")
+                self._condition.wait(remaining)
+        try:
+            return self._connection_factory(key[0], key[1], key[2], timeout), False
+        except BaseException:
+            self._forget(key)
+            raise
+
+    def _release(self, key: _HostKey, connection: HTTPConnection) -> None:
+        with self._condition:
+            if not self._closed:
+                self._idle.setdefault(key, []).append((connection, self._clock()))
+                self._condition.notify()
+                return
+        self._discard(key, connection)
+
+    def _discard(self, key: _HostKey, connection: HTTPConnection) -> None:
+        connection.close()
+        self._forget(key)
+
+    def _forget(self, key: _HostKey) -> None:
+        with self._condition:
+            self._open[key] = max(0, self._open.get(key, 0) - 1)
+            self._condition.notify()
+
+    def _evict_idle(self) -> None:
+        """Close idle connections past their keep-alive window; lock held."""
+
+        cutoff = self._clock() - self._idle_seconds
+        for key, idle in self._idle.items():
+            while idle and idle[0][1] < cutoff:
+                connection, _ = idle.pop(0)
+                connection.close()
+                self._open[key] = max(0, self._open.get(key, 0) - 1)
+                self._counts["evicted"] += 1
+
+    def _open_connection(
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        timeout: float,
+    ) -> HTTPConnection:
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = create_default_context()
+            return HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context)
+        return HTTPConnection(host, port, timeout=timeout)
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedResponse:
+    etag: str | None
+    last_modified: str | None
+    digest: bytes
+    value: Any
+
+
+class DecodedResponseCache:
+    """Keep the decoded JSON of recent responses with their validators.
+
+    Entries are evicted least recently used beyond ``max_entries``. Values
+    are shared between callers, which must treat them as read-only.
+    """
+
+    def __init__(self, *, max_entries: int = 256) -> None:
+        if int(max_entries) < 1:
+            raise ValueError("max_entries must be at least one")
+        self._max_entries = int(max_entries)
+        self._lock = Lock()
+        self._entries: OrderedDict[str, _CachedResponse] = OrderedDict()
+        self._counts = {"hits": 0, "not_modified": 0, "misses": 0, "evictions": 0}
+
+    def stats(self) -> Mapping[str, int]:
+        """Return hit, conditional-hit, miss, and eviction counts."""
+
+        with self._lock:
+            counts = dict(self._counts)
+            counts["entries"] = len(self._entries)
+        return MappingProxyType(counts)
+
+    def _get(self, url: str) -> _CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def _store(self, url: str, entry: _CachedResponse, outcome: str) -> None:
+        with self._lock:
+            self._counts[outcome] += 1
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._counts["evictions"] += 1
+
+
+class PooledJsonHttpClient:
+    """Implement the JSON HTTP port over a shared keep-alive transport.
+
+    With a ``cache``, requests carry the last ETag and Last-Modified
+    validators, and a 304 or a byte-identical body returns the previously
+    decoded value instead of parsing again.
+    """
+
+    def __init__(
+        self,
+        transport: PooledHttpTransport | None = None,
+        *,
+        user_agent: str = "SportsTickerBackend/8",
+        cache: DecodedResponseCache | None = None,
+    ) -> None:
+        self.transport = transport or PooledHttpTransport()
+        self.cache = cache
+        self._user_agent = str(user_agent).strip() or "SportsTickerBackend/8"
+
+    def get_json(self, url: str, *, timeout: float) -> Any:
+        """Fetch and decode JSON with a required finite positive timeout."""
+
+        target, request_timeout = _request_target(url, timeout)
+        headers = {"Accept": "application/json", "User-Agent": self._user_agent}
+        if self.cache is None:
+            body = _pooled_body(self.transport, target, headers, request_timeout)
+            return _decode_json(body, target)
+
+        cached = self.cache._get(target)
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        response = _pooled_response(self.transport, target, headers, request_timeout)
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if response.status == 304 and cached is not None:
+            self.cache._store(
+                target,
+                replace(
+                    cached,
+                    etag=etag or cached.etag,
+                    last_modified=last_modified or cached.last_modified,
+                ),
+                "not_modified",
+            )
+            return cached.value
+        if not 200 <= response.status < 300:
+            raise JsonHttpError(f"HTTP {response.status} for {target}: {response.reason}")
+        digest = hashlib.blake2b(response.body, digest_size=16).digest()
+        if cached is not None and cached.digest == digest:
+            value, outcome = cached.value, "hits"
+        else:
+            value, outcome = _decode_json(response.body, target), "misses"
+        self.cache._store(
+            target,
+            _CachedResponse(etag, last_modified, digest, value),
+            outcome,
+        )
+        return value
+
+
+class PooledTextHttpClient:
+    """Implement the text HTTP port over a shared keep-alive transport."""
+
+    def __init__(
+        self,
+        transport: PooledHttpTransport | None = None,
+        *,
+        user_agent: str = "SportsTickerBackend/8",
+    ) -> None:
+        self.transport = transport or PooledHttpTransport()
+        self._user_agent = str(user_agent).strip() or "SportsTickerBackend/8"
+
+    def get_text(self, url: str, *, timeout: float) -> str:
+        """Fetch one text response with a required finite positive timeout."""
+
+        target, request_timeout = _request_target(url, timeout)
+        body = _pooled_body(
+            self.transport,
+            target,
+            {"Accept": "text/html", "User-Agent": self._user_agent},
+            request_timeout,
+        )
+        try:
+            return body.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            raise JsonHttpError(f"response was not UTF-8 for {target}") from exc
+
+
+class SingleFlightJsonHttpClient:
+    """Share one in-flight request per URL between concurrent callers.
+
+    Callers that ask for a URL while a request for it is running wait for
+    that request's result or error instead of sending their own. A
+    successful result is also reused for ``ttl_seconds`` after it arrives;
+    the default of zero shares only in-flight requests.
+    """
+
+    def __init__(
+        self,
+        client: JsonHttpClient,
+        *,
+        ttl_seconds: float = 0.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        ttl = float(ttl_seconds)
+        if not math.isfinite(ttl) or ttl < 0:
+            raise ValueError("ttl_seconds must be a finite non-negative number")
+        self._client = client
+        self._results = SharedResultCache(max_age=ttl, clock=clock)
+
+    def get_json(self, url: str, *, timeout: float) -> Any:
+        """Return one shared decoded response for ``url``."""
+
+        target, request_timeout = _request_target(url, timeout)
+        leader = False
+
+        def load() -> Any:
+            nonlocal leader
+            leader = True
+            return self._client.get_json(target, timeout=request_timeout)
+
+        try:
+            return self._results.get(target, load, timeout=request_timeout)
+        except TimeoutError as exc:
+            if leader:
+                raise
+            raise JsonHttpError(f"request timed out for {target}") from exc
+
+
+def _request_target(url: str, timeout: float) -> tuple[str, float]:
+    target = str(url).strip()
+    if not target:
+        raise ValueError("url must not be empty")
+    request_timeout = float(timeout)
+    if not math.isfinite(request_timeout) or request_timeout <= 0:
+        raise ValueError("timeout must be a finite positive number")
+    return target, request_timeout
+
+
+def _pooled_response(
+    transport: PooledHttpTransport,
+    target: str,
+    headers: Mapping[str, str],
+    timeout: float,
+) -> HttpResponse:
+    """Return one pooled response or raise JsonHttpError for transport failures."""
+
+    try:
+        return transport.request(target, headers=headers, timeout=timeout)
+    except TimeoutError as exc:
+        raise JsonHttpError(f"request timed out for {target}") from exc
+    except (HTTPException, OSError) as exc:
+        raise JsonHttpError(f"request failed for {target}: {exc}") from exc
+
+
+def _pooled_body(
+    transport: PooledHttpTransport,
+    target: str,
+    headers: Mapping[str, str],
+    timeout: float,
+) -> bytes:
+    """Return one successful pooled response body or raise JsonHttpError."""
+
+    response = _pooled_response(transport, target, headers, timeout)
+    if not 200 <= response.status < 300:
+        raise JsonHttpError(f"HTTP {response.status} for {target}: {response.reason}")
+    return response.body
+
+
+def _decode_json(body: bytes, target: str) -> Any:
+    try:
+        text = body.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise JsonHttpError(f"response was not UTF-8 for {target}") from exc
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise JsonHttpError(
+            f"invalid JSON for {target} at line {exc.lineno}, column {exc.colno}"
+        ) from exc
+
+
 __all__ = [
+    "DecodedResponseCache",
+    "HttpResponse",
     "JsonHttpClient",
     "JsonHttpError",
+    "PooledHttpTransport",
+    "PooledJsonHttpClient",
+    "PooledTextHttpClient",
+    "SingleFlightJsonHttpClient",
     "TextHttpClient",
     "UrllibJsonHttpClient",
     "UrllibTextHttpClient",
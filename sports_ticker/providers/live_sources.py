@@ -7,6 +7,8 @@ import re
 import json
 import hashlib
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from math import atan2, cos, isfinite, radians, sin, sqrt
 from pathlib import Path
@@ -14,17 +16,25 @@ from threading import Lock, Thread
 from time import monotonic, sleep, time
 from typing import Any, Callable
 from urllib.parse import urlencode
+from zoneinfo import ZoneInfo
 
 from sports_ticker.domain import DisplaySettings
-from sports_ticker.markets import MARKET_GROUPS
+from sports_ticker.markets import MARKET_GROUPS, selected_market_groups
 
 from .espn import _display_timezone, _event_time
 from .http import JsonHttpClient, UrllibJsonHttpClient
+from .shared_results import SharedResultCache
 
 
 ESPN_GOLF_URL = "https://site.api.espn.com/apis/site/v2/sports/golf/pga/scoreboard"
 FINNHUB_QUOTE_URL = "https://finnhub.io/api/v1/quote"
 FINNHUB_CANDLE_URL = "https://finnhub.io/api/v1/stock/candle"
+_FINNHUB_CALLS_PER_MINUTE = 60.0
+_STOCK_DEMAND_SECONDS = 300.0
+_STOCK_UNDISPLAYED_FACTOR = 10
+_STOCK_CLOSED_REFRESH_SECONDS = 900.0
+_STOCK_VOLATILE_PERCENT = 2.0
+_US_MARKET_TIMEZONE = ZoneInfo("America/New_York")
 _ETF_LOGO_DOMAINS = {
     "QQQ": "invesco.com",
     "SPY": "spdrs.com",
@@ -123,7 +133,15 @@ class EspnGolfSource:
 
 
 class FinnhubStockSource:
-    """Read selected market quotes with rate limits and durable last-known values."""
+    """Read selected market quotes with rate limits and durable last-known values.
+
+    Each configured key gets its own token bucket sized from the account
+    quota, so requests are spread evenly instead of bursting. Refresh passes
+    fetch the most overdue quotes first: displayed groups during market hours
+    refresh every ``refresh_seconds`` (twice as often while volatile), groups
+    no ticker shows fall back to a slower cadence, and closed markets are
+    polled rarely.
+    """
 
     def __init__(
         self,
@@ -135,6 +153,7 @@ class FinnhubStockSource:
         monotonic_clock: callable = monotonic,
         sleeper: callable = sleep,
         refresh_seconds: float = 30.0,
+        calls_per_minute: float | None = None,
     ) -> None:
         self._client = client or UrllibJsonHttpClient()
         self._timeout = _timeout(timeout)
@@ -153,9 +172,19 @@ class FinnhubStockSource:
             cache_path or os.environ.get("TICKER_STOCK_CACHE_PATH", "ticker_data/stocks.json")
         )
         self._quotes = self._load_cache()
-        self._next_key = 0
-        self._request_interval = 1.1 / len(self._keys) if self._keys else 0.0
-        self._last_request = float("-inf")
+        self._fetched_at: dict[str, float] = {}
+        self._demand: dict[str, float] = {}
+        if calls_per_minute is not None:
+            quota = _positive_rate("calls_per_minute", calls_per_minute)
+        else:
+            quota = _positive_rate(
+                "FINNHUB_CALLS_PER_MINUTE",
+                os.environ.get("FINNHUB_CALLS_PER_MINUTE", _FINNHUB_CALLS_PER_MINUTE),
+            )
+        started = self._monotonic()
+        self._buckets = tuple(
+            _TokenBucket(key, quota / 60.0, started) for key in self._keys
+        )
         self._refresh_seconds = _timeout(refresh_seconds)
         self._last_refresh = float("-inf")
         self._request_lock = Lock()
@@ -164,6 +193,10 @@ class FinnhubStockSource:
         self._refreshing = False
 
     def fetch(self, settings: DisplaySettings) -> Mapping[str, object]:
+        now = self._monotonic()
+        with self._quote_lock:
+            for group in selected_market_groups(settings.active_sports):
+                self._demand[group.id] = now
         self._start_all_market_refresh()
         records: list[dict[str, object]] = []
         for group in MARKET_GROUPS:
@@ -182,18 +215,19 @@ class FinnhubStockSource:
         Thread(target=self._refresh_all_markets, name="ticker-stock-refresh", daemon=True).start()
 
     def _refresh_all_markets(self) -> None:
-        """Refresh every quote in the source-owned market cache."""
+        """Refresh the most overdue quotes until one refresh interval has passed."""
 
         changed = False
         try:
-            symbols = tuple(
-                dict.fromkeys(symbol for group in MARKET_GROUPS for symbol in group.symbols)
-            )
-            for symbol in symbols:
-                quote = self._fetch_quote(symbol) if self._keys else None
+            started = self._monotonic()
+            for symbol in self._due_symbols(started) if self._keys else ():
+                if self._monotonic() - started >= self._refresh_seconds:
+                    break
+                quote = self._fetch_quote(symbol)
                 if quote is not None:
                     with self._quote_lock:
                         self._quotes[symbol] = quote
+                        self._fetched_at[symbol] = self._monotonic()
                     changed = True
             if changed:
                 self._save_cache()
@@ -201,6 +235,40 @@ class FinnhubStockSource:
             with self._refresh_lock:
                 self._refreshing = False
 
+    def _due_symbols(self, now: float) -> list[str]:
+        """Return stale symbols ordered by how far past their freshness target they are."""
+
+        with self._quote_lock:
+            demanded = {
+                group_id
+                for group_id, seen_at in self._demand.items()
+                if now - seen_at < _STOCK_DEMAND_SECONDS
+            }
+            fetched_at = dict(self._fetched_at)
+            quotes = dict(self._quotes)
+        market_open = _us_market_open(datetime.fromtimestamp(self._clock(), timezone.utc))
+        displayed = {
+            symbol
+            for group in MARKET_GROUPS
+            if group.id in demanded
+            for symbol in group.symbols
+        }
+        symbols = dict.fromkeys(symbol for group in MARKET_GROUPS for symbol in group.symbols)
+        ranked: list[tuple[float, bool, int, str]] = []
+        for order, symbol in enumerate(symbols):
+            if not market_open:
+                target = _STOCK_CLOSED_REFRESH_SECONDS
+            elif symbol not in displayed:
+                target = self._refresh_seconds * _STOCK_UNDISPLAYED_FACTOR
+            elif _volatile(quotes.get(symbol)):
+                target = self._refresh_seconds / 2
+            else:
+                target = self._refresh_seconds
+            age = now - fetched_at.get(symbol, float("-inf"))
+            if age >= target:
+                ranked.append((-age / target, symbol not in displayed, order, symbol))
+        return [symbol for *_, symbol in sorted(ranked)]
+
     def _group_records(
         self,
         group_id: str,
@@ -238,11 +306,8 @@ class FinnhubStockSource:
     def _fetch_quote(self, symbol: str) -> dict[str, str] | None:
         """Fetch one quote, with a close-price fallback after market data ages."""
 
-        key = self._next_api_key()
-        if not key:
-            return None
         try:
-            quote = self._get_json(FINNHUB_QUOTE_URL, symbol=symbol, token=key)
+            quote = self._get_json(FINNHUB_QUOTE_URL, symbol=symbol)
             if not isinstance(quote, Mapping) or not _positive(quote.get("c")):
                 return None
             price = _number(quote.get("c"))
@@ -252,7 +317,7 @@ class FinnhubStockSource:
             if timestamp > 0 and self._clock() - timestamp > 30:
                 try:
                     candle = self._latest_candle(
-                        symbol, key, previous_close=_number(quote.get("pc"))
+                        symbol, previous_close=_number(quote.get("pc"))
                     )
                 except Exception:
                     candle = None
@@ -267,7 +332,7 @@ class FinnhubStockSource:
             return None
 
     def _latest_candle(
-        self, symbol: str, key: str, *, previous_close: float
+        self, symbol: str, *, previous_close: float
     ) -> tuple[float, float, float] | None:
         """Use the latest one-minute close when the quote timestamp is stale."""
 
@@ -276,7 +341,7 @@ class FinnhubStockSource:
             FINNHUB_CANDLE_URL,
             symbol=symbol,
             resolution="1",
-            **{"from": now - 1800, "to": now, "token": key},
+            **{"from": now - 1800, "to": now},
         )
         closes = candle.get("c") if isinstance(candle, Mapping) else None
         if not isinstance(closes, Sequence) or isinstance(closes, (str, bytes)) or not closes:
@@ -288,21 +353,22 @@ class FinnhubStockSource:
         change = latest - reference
         return latest, change, (change / reference) * 100 if reference else 0.0
 
-    def _next_api_key(self) -> str:
-        """Rotate configured keys in stable order."""
-
-        key = self._keys[self._next_key % len(self._keys)]
-        self._next_key += 1
-        return key
-
-    def _get_json(self, endpoint: str, **query: object) -> Mapping[str, object]:
-        """Make one paced Finnhub request through the injected JSON client."""
+    def _acquire_api_key(self) -> str:
+        """Wait for the key whose bucket refills first and spend one of its tokens."""
 
         with self._request_lock:
-            delay = self._request_interval - (self._monotonic() - self._last_request)
+            now = self._monotonic()
+            bucket = min(self._buckets, key=lambda value: value.wait_seconds(now))
+            delay = bucket.wait_seconds(now)
             if delay > 0:
                 self._sleep(delay)
-            self._last_request = self._monotonic()
+            bucket.take(self._monotonic())
+            return bucket.key
+
+    def _get_json(self, endpoint: str, **query: object) -> Mapping[str, object]:
+        """Make one quota-paced Finnhub request through the injected JSON client."""
+
+        query["token"] = self._acquire_api_key()
         result = self._client.get_json(
             f"{endpoint}?{urlencode(query)}", timeout=self._timeout
         )
@@ -344,6 +410,46 @@ class FinnhubStockSource:
             temporary.unlink(missing_ok=True)
 
 
+@dataclass(slots=True)
+class _TokenBucket:
+    """One API key's call allowance, refilled continuously at its quota rate."""
+
+    key: str
+    rate: float
+    updated_at: float
+    tokens: float = 1.0
+
+    def wait_seconds(self, now: float) -> float:
+        self._refill(now)
+        return 0.0 if self.tokens >= 1.0 else (1.0 - self.tokens) / self.rate
+
+    def take(self, now: float) -> None:
+        self._refill(now)
+        self.tokens -= 1.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(1.0, self.tokens + elapsed * self.rate)
+        self.updated_at = max(self.updated_at, now)
+
+
+def _us_market_open(now: datetime) -> bool:
+    """Return whether the US cash session is open, ignoring exchange holidays."""
+
+    local = now.astimezone(_US_MARKET_TIMEZONE)
+    minutes = local.hour * 60 + local.minute
+    return local.weekday() < 5 and 9 * 60 + 30 <= minutes < 16 * 60
+
+
+def _volatile(quote: Mapping[str, str] | None) -> bool:
+    if quote is None:
+        return False
+    try:
+        return abs(float(str(quote["change_pct"]).rstrip("%"))) >= _STOCK_VOLATILE_PERCENT
+    except (KeyError, ValueError):
+        return False
+
+
 def _stock_logo_url(symbol: str) -> str:
     """Return one stable stock logo URL that the Pi caches by URL and size."""
 
@@ -355,11 +461,24 @@ def _stock_logo_url(symbol: str) -> str:
 
 
 class FlightRadarSource:
-    """Read a tracked flight or airport activity through FlightRadar24."""
+    """Read a tracked flight or airport activity through FlightRadar24.
+
+    Airport boards are fetched at most once per airport every
+    ``board_seconds`` and shared by every ticker watching that airport;
+    each ticker's airport record is projected from the shared board.
+    """
 
-    def __init__(self, api: object | None = None, *, clock: Callable[[], float] = time) -> None:
+    def __init__(
+        self,
+        api: object | None = None,
+        *,
+        clock: Callable[[], float] = time,
+        board_seconds: float = 30.0,
+        monotonic_clock: Callable[[], float] = monotonic,
+    ) -> None:
         self._api = api
         self._clock = clock
+        self._boards = SharedResultCache(max_age=board_seconds, clock=monotonic_clock)
 
     def fetch(self, settings: DisplaySettings) -> Mapping[str, object]:
         api = self._client()
@@ -417,11 +536,12 @@ class FlightRadarSource:
         details = getattr(api, "get_airport_details", None)
         if not callable(details):
             return None
-        result = _mapping(details(settings.airport_code_iata, flight_limit=4))
+        code = settings.airport_code_iata
+        result = _mapping(self._boards.get(code, lambda: details(code, flight_limit=4)))
         plugin_data = _mapping(_mapping(result.get("airport")).get("pluginData"))
         schedule = _mapping(plugin_data.get("schedule"))
         return {
-            "id": f"airport:{settings.airport_code_iata}",
+            "id": f"airport:{code}",
             "type": "flight_airport_hud",
             "sport": "airport",
             "weather": _airport_weather(result, settings, plugin_data, now=now),
@@ -441,7 +561,13 @@ class FlightRadarSource:
 
 
 class EspnNewsSource:
-    """Read followed-team ESPN headlines without blocking scoreboard refreshes."""
+    """Read followed-team ESPN headlines without blocking scoreboard refreshes.
+
+    League feeds refresh on a small long-lived pool, at most one request per
+    feed at a time. Each feed's articles are kept in an index keyed by
+    ``league:team`` and deduplicated by article id, so selecting one
+    ticker's headlines only looks up its followed teams.
+    """
 
     def __init__(
         self,
@@ -451,94 +577,172 @@ class EspnNewsSource:
         timeout: float = 10.0,
         refresh_seconds: float = 30.0,
         background: bool = True,
+        max_workers: int = 2,
     ) -> None:
         self._news_urls = dict(news_urls)
         self._client = client or UrllibJsonHttpClient()
         self._timeout = _timeout(timeout)
         self._refresh_seconds = _timeout(refresh_seconds)
         self._background = bool(background)
-        self._cache: dict[tuple[str, ...], tuple[dict[str, object], ...]] = {}
-        self._last_started: dict[tuple[str, ...], float] = {}
-        self._refreshing: set[tuple[str, ...]] = set()
+        if int(max_workers) < 1:
+            raise ValueError("max_workers must be at least one")
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(max_workers),
+            thread_name_prefix="ticker-news",
+        )
+        self._feeds: dict[str, dict[str, _NewsArticle]] = {}
+        self._team_index: dict[str, dict[str, _NewsArticle]] = {}
+        self._last_started: dict[str, float] = {}
+        self._refreshing: set[str] = set()
         self._lock = Lock()
 
     def fetch(self, settings: DisplaySettings) -> Mapping[str, object]:
-        """Return cached followed-team headlines and refresh them outside polling."""
+        """Return indexed followed-team headlines and refresh them outside polling."""
 
         if settings.mode != "sports" or not settings.my_teams:
             return {"news": []}
         followed = tuple(sorted({str(value).strip().lower() for value in settings.my_teams if str(value).strip()}))
         if not followed:
             return {"news": []}
-        if self._background:
-            self._start_refresh(followed)
-            with self._lock:
-                return {"news": list(self._cache.get(followed, ())) }
-        return {"news": list(self._fetch_news(followed))}
-
-    def _start_refresh(self, followed: tuple[str, ...]) -> None:
+        leagues = [
+            league
+            for league in self._news_urls
+            if any(value.startswith(f"{league}:") for value in followed)
+        ]
+        for league in leagues:
+            if self._background:
+                self._start_refresh(league)
+            else:
+                self._refresh(league)
+        return {"news": list(self._select(leagues, followed))}
+
+    def close(self) -> None:
+        """Stop the owned feed pool without waiting for abandoned calls."""
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _start_refresh(self, league: str) -> None:
         now = monotonic()
         with self._lock:
-            if followed in self._refreshing or now - self._last_started.get(followed, float("-inf")) < self._refresh_seconds:
+            if league in self._refreshing or now - self._last_started.get(league, float("-inf")) < self._refresh_seconds:
                 return
-            self._last_started[followed] = now
-            self._refreshing.add(followed)
-        Thread(target=self._refresh, args=(followed,), name="ticker-news-refresh", daemon=True).start()
-
-    def _refresh(self, followed: tuple[str, ...]) -> None:
+            self._last_started[league] = now
+            self._refreshing.add(league)
         try:
-            records = self._fetch_news(followed)
+            self._executor.submit(self._refresh, league)
+        except RuntimeError:
             with self._lock:
-                self._cache[followed] = records
+                self._refreshing.discard(league)
+
+    def _refresh(self, league: str) -> None:
+        try:
+            articles = self._fetch_feed(league)
+            if articles is not None:
+                self._index_feed(league, articles)
         finally:
             with self._lock:
-                self._refreshing.discard(followed)
+                self._refreshing.discard(league)
 
-    def _fetch_news(self, followed: tuple[str, ...]) -> tuple[dict[str, object], ...]:
-        followed_set = set(followed)
-        records: list[dict[str, object]] = []
-        for league, url in self._news_urls.items():
-            if not any(value.startswith(f"{league}:") for value in followed_set):
-                continue
-            try:
-                payload = self._client.get_json(url, timeout=self._timeout)
-            except Exception:
+    def _fetch_feed(self, league: str) -> list[_NewsArticle] | None:
+        """Read one league feed into team-tagged articles, or ``None`` on failure."""
+
+        try:
+            payload = self._client.get_json(self._news_urls[league], timeout=self._timeout)
+        except Exception:
+            return None
+        articles = payload.get("articles", ()) if isinstance(payload, Mapping) else ()
+        if not isinstance(articles, Sequence) or isinstance(articles, (str, bytes)):
+            return None
+        result: list[_NewsArticle] = []
+        for article in articles:
+            if not isinstance(article, Mapping):
                 continue
-            articles = payload.get("articles", ()) if isinstance(payload, Mapping) else ()
-            if not isinstance(articles, Sequence) or isinstance(articles, (str, bytes)):
+            headline = str(article.get("headline") or article.get("title") or "").strip()
+            teams = _article_abbreviations(article)
+            if not headline or not teams:
                 continue
-            for article in articles:
-                if not isinstance(article, Mapping):
-                    continue
-                headline = str(article.get("headline") or article.get("title") or "").strip()
-                if not headline:
-                    continue
-                teams = tuple(
-                    team
-                    for team in _article_abbreviations(article)
-                    if f"{league}:{team.lower()}" in followed_set
+            article_id = str(article.get("id") or article.get("link") or headline)
+            result.append(
+                _NewsArticle(
+                    identifier=hashlib.sha1(f"{league}:{article_id}".encode()).hexdigest()[:20],
+                    league=league,
+                    headline=headline,
+                    teams=teams,
+                    position=len(result),
                 )
-                if not teams:
+            )
+        return result
+
+    def _index_feed(self, league: str, articles: Sequence[_NewsArticle]) -> None:
+        """Replace one league's indexed articles, touching only those that changed."""
+
+        current: dict[str, _NewsArticle] = {}
+        for article in articles:
+            current.setdefault(article.identifier, article)
+        with self._lock:
+            previous = self._feeds.get(league, {})
+            for identifier, article in previous.items():
+                if current.get(identifier) == article:
                     continue
-                article_id = str(article.get("id") or article.get("link") or headline)
-                identifier = hashlib.sha1(f"{league}:{article_id}".encode()).hexdigest()[:20]
-                records.append(
-                    {
-                        "id": identifier,
-                        "kind": "NEWS",
-                        "domain": "sports",
-                        "sport": league,
-                        "from_abbr": teams[0],
-                        "to_abbr": "",
-                        "from_color": "#8B93A3",
-                        "to_color": "#8B93A3",
-                        "text": headline,
-                        "teams": list(teams),
-                    }
-                )
+                for team in article.teams:
+                    key = f"{league}:{team.lower()}"
+                    bucket = self._team_index.get(key)
+                    if bucket is not None:
+                        bucket.pop(identifier, None)
+                        if not bucket:
+                            del self._team_index[key]
+            for identifier, article in current.items():
+                if previous.get(identifier) == article:
+                    continue
+                for team in article.teams:
+                    self._team_index.setdefault(f"{league}:{team.lower()}", {})[identifier] = article
+            self._feeds[league] = current
+
+    def _select(
+        self, leagues: Sequence[str], followed: tuple[str, ...]
+    ) -> tuple[dict[str, object], ...]:
+        """Build followed-team records from the index in feed order."""
+
+        followed_set = set(followed)
+        records: list[dict[str, object]] = []
+        with self._lock:
+            for league in leagues:
+                matches: dict[str, _NewsArticle] = {}
+                for value in followed:
+                    if value.startswith(f"{league}:"):
+                        matches.update(self._team_index.get(value, {}))
+                for article in sorted(matches.values(), key=lambda item: item.position):
+                    teams = tuple(
+                        team for team in article.teams if f"{league}:{team.lower()}" in followed_set
+                    )
+                    records.append(
+                        {
+                            "id": article.identifier,
+                            "kind": "NEWS",
+                            "domain": "sports",
+                            "sport": league,
+                            "from_abbr": teams[0],
+                            "to_abbr": "",
+                            "from_color": "#8B93A3",
+                            "to_color": "#8B93A3",
+                            "text": article.headline,
+                            "teams": list(teams),
+                        }
+                    )
         return tuple(records[:24])
 
 
+@dataclass(frozen=True, slots=True)
+class _NewsArticle:
+    """One headline from a league feed with every team it names."""
+
+    identifier: str
+    league: str
+    headline: str
+    teams: tuple[str, ...]
+    position: int
+
+
 def _article_abbreviations(article: Mapping[str, object]) -> tuple[str, ...]:
     """Collect explicit ESPN team abbreviations without guessing from prose."""
 
@@ -1828,6 +2032,16 @@ def _timeout(value: float) -> float:
     return result
 
 
+def _positive_rate(name: str, value: object) -> float:
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        result = float("nan")
+    if not isfinite(result) or result <= 0:
+        raise ValueError(f"{name} must be a finite positive rate")
+    return result
+
+
 def _symbols(values: Sequence[str]) -> tuple[str, ...]:
     return tuple(value.upper() for raw in values if (value := str(raw).strip().upper()))
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import replace
 from typing import Any
 
@@ -25,15 +26,32 @@ class RacingProvider(_FeatureProvider):
 
         # TEMPORARY: disable the F1/OpenF1 path until the live timing endpoint
         # is reliable again. Leave IndyCar and NASCAR settings untouched.
-        active_sports = dict(settings.active_sports)
-        active_sports["f1"] = False
-        safe_settings = replace(settings, active_sports=active_sports)
+        # Sources that stream F1 timing instead of polling OpenF1 keep it.
+        safe_settings = settings
+        if not getattr(self._source, "streams_f1", False):
+            active_sports = dict(settings.active_sports)
+            active_sports["f1"] = False
+            safe_settings = replace(settings, active_sports=active_sports)
 
         return self._fetch_normalized(
             safe_settings,
             lambda payload: _content_payload(payload, self.family, _racing_kind),
         )
 
+    def start(self, on_change: Callable[[], object] | None = None) -> None:
+        """Start a source that holds a live timing connection."""
+
+        start = getattr(self._source, "start", None)
+        if callable(start):
+            start(on_change=on_change)
+
+    def close(self) -> None:
+        """Close a source that holds a live timing connection."""
+
+        close = getattr(self._source, "close", None)
+        if callable(close):
+            close()
+
 
 def _racing_kind(record: dict[str, Any], group: str | None) -> str:
     candidates = (
@@ -5,13 +5,15 @@ from __future__ import annotations
 import re
 import time
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable
-from urllib.parse import urlencode
+from urllib.parse import quote, urlencode
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from sports_ticker.domain import DisplaySettings
 
+from .f1_teams import f1_car_url, f1_short_event, f1_team_color
 from .http import JsonHttpClient, TextHttpClient, UrllibJsonHttpClient, UrllibTextHttpClient
 
 
@@ -22,6 +24,7 @@ _NASCAR_LIVE_URL = "https://cf.nascar.com/live/feeds/live-feed.json"
 _OPENF1_BASE = "https://api.openf1.org/v1"
 _JOLPICA_BASE = "https://api.jolpi.ca/ergast/f1"
 _INDYCAR_BLOB_BASE = "https://indycar.blob.core.windows.net/racecontrol"
+_OPENF1_LAP_OVERLAP = timedelta(minutes=5)
 _IMS_LAT = 39.7950
 _IMS_LON = -86.2340
 
@@ -43,34 +46,6 @@ _F1_ESPN_ABBREVIATIONS = {
     "QUAL": "Qualifying",
     "RACE": "Race",
 }
-_F1_TEAM_SLUGS = {
-    "mclaren": "mclaren",
-    "mercedes": "mercedes",
-    "ferrari": "ferrari",
-    "red bull": "redbullracing",
-    "racing bulls": "racingbulls",
-    "aston martin": "astonmartin",
-    "alpine": "alpine",
-    "williams": "williams",
-    "haas": "haasf1team",
-    "audi": "audi",
-    "sauber": "audi",
-    "cadillac": "cadillac",
-}
-_F1_TEAM_COLORS = {
-    "mclaren": "#FF8000",
-    "mercedes": "#27F4D2",
-    "ferrari": "#E8002D",
-    "red bull": "#3671C6",
-    "racing bulls": "#6692FF",
-    "aston martin": "#229971",
-    "alpine": "#FF87BC",
-    "williams": "#64C4FF",
-    "haas": "#B6BABD",
-    "sauber": "#BB0000",
-    "audi": "#BB0000",
-    "cadillac": "#9CA3AF",
-}
 _INDYCAR_LIVERIES = {
     "ganassi": ("#E31937", "#002D62"),
     "andretti": ("#112A5A", "#FFFFFF"),
@@ -120,6 +95,30 @@ _INDYCAR_SLUG_MAP = {
 }
 
 
+@dataclass(slots=True)
+class _OpenF1Timing:
+    """Accumulate one OpenF1 session from rows newer than each stream's cursor.
+
+    Positions, intervals, and race control messages are only ever appended,
+    so each keeps the latest row date it has seen. Lap rows gain their
+    duration once a lap completes, so laps are re-read from a short overlap
+    before the newest lap start.
+    """
+
+    session_key: object
+    drivers: dict[str, Mapping[str, Any]] = field(default_factory=dict)
+    unlisted_drivers: frozenset[str] = frozenset()
+    positions: dict[str, Mapping[str, Any]] = field(default_factory=dict)
+    position_cursor: str = ""
+    intervals: dict[str, Mapping[str, Any]] = field(default_factory=dict)
+    interval_cursor: str = ""
+    best_laps: dict[str, float] = field(default_factory=dict)
+    latest_laps: dict[str, int] = field(default_factory=dict)
+    lap_cursor: datetime | None = None
+    flag: str = "GREEN"
+    race_control_cursor: str = ""
+
+
 class LiveRacingSource:
     """Fetch F1 and IndyCar sessions from their authoritative timing feeds."""
 
@@ -142,6 +141,7 @@ class LiveRacingSource:
         self._f1_schedule: tuple[float, list[dict[str, Any]]] = (0.0, [])
         self._f1_games: dict[str, dict[str, Any]] = {}
         self._f1_results: tuple[float, list[Mapping[str, Any]]] = (0.0, [])
+        self._openf1: _OpenF1Timing | None = None
         self._indy_schedule: tuple[float, list[dict[str, Any]]] = (0.0, [])
         self._indy_games: dict[str, dict[str, Any]] = {}
         self._indy_timing: tuple[float, dict[str, Any] | None] = (0.0, None)
@@ -150,6 +150,8 @@ class LiveRacingSource:
         self._nascar_schedule: tuple[float, list[dict[str, Any]]] = (0.0, [])
         self._nascar_games: dict[str, dict[str, Any]] = {}
         self._nascar_timing: tuple[float, dict[str, Any] | None] = (0.0, None)
+        self._indy_driver_tables: dict[str, dict[str, tuple[object, dict[str, Any] | None]]] = {}
+        self._nascar_driver_tables: dict[str, dict[str, tuple[object, dict[str, Any] | None]]] = {}
 
     def fetch(self, settings: DisplaySettings) -> Mapping[str, object]:
         """Return current F1, IndyCar, and NASCAR content for one ticker settings view."""
@@ -255,7 +257,7 @@ class LiveRacingSource:
             status = f"Lap {lap}/{total_laps}" if lap and total_laps else flag
         else:
             status = _format_local_time(start, timezone_name)
-        event_name = _f1_short_event(str(race.get("race_name") or "Formula 1"))
+        event_name = f1_short_event(str(race.get("race_name") or "Formula 1"))
         track = str(race.get("track") or race.get("location") or event_name)
         return {
             "id": identifier,
@@ -304,64 +306,30 @@ class LiveRacingSource:
         if session_key is None:
             return [], False, "", 0, 0
         ended = _session_ended(session, self._now().astimezone(timezone.utc))
-        drivers_raw = _sequence(
-            self._client.get_json(
-                f"{_OPENF1_BASE}/drivers?session_key={session_key}",
-                timeout=self._timeout,
-            )
-        )
-        driver_info = {
-            str(item.get("driver_number")): item
-            for item in drivers_raw
-            if _mapping(item).get("driver_number") is not None
-        }
-        positions_raw = _sequence(
-            self._client.get_json(
-                f"{_OPENF1_BASE}/position?session_key={session_key}",
-                timeout=self._timeout,
-            )
-        )
-        latest_positions: dict[str, Mapping[str, Any]] = {}
-        for position in positions_raw:
-            key = str(position.get("driver_number") or "")
-            if key and (
-                key not in latest_positions
-                or str(position.get("date", "")) > str(latest_positions[key].get("date", ""))
-            ):
-                latest_positions[key] = position
+        timing = self._openf1
+        if timing is None or timing.session_key != session_key:
+            timing = self._openf1 = _OpenF1Timing(session_key)
         session_name = str(session.get("session_name") or "").lower()
         qualifying = "qual" in session_name
-        best_laps: dict[str, float] = {}
-        latest_laps: dict[str, int] = {}
-        lap_rows = _sequence(
-            self._client.get_json(
-                f"{_OPENF1_BASE}/laps?session_key={session_key}",
-                timeout=self._timeout,
-            )
-        )
-        for lap in lap_rows:
-            key = str(lap.get("driver_number") or "")
-            duration = _number(lap.get("lap_duration"))
-            if duration and (key not in best_laps or duration < best_laps[key]):
-                best_laps[key] = duration
-            lap_number = _integer(lap.get("lap_number"))
-            if key and lap_number > latest_laps.get(key, 0):
-                latest_laps[key] = lap_number
-        intervals: dict[str, Mapping[str, Any]] = {}
+        self._update_openf1_positions(timing)
+        if not timing.drivers or any(
+            key not in timing.drivers and key not in timing.unlisted_drivers
+            for key in timing.positions
+        ):
+            timing.drivers = {
+                str(item.get("driver_number")): item
+                for item in self._openf1_rows("drivers", session_key)
+                if item.get("driver_number") is not None
+            }
+            timing.unlisted_drivers = frozenset(timing.positions).difference(timing.drivers)
+        self._update_openf1_laps(timing)
         if not qualifying:
-            interval_rows = _sequence(
-                self._client.get_json(
-                    f"{_OPENF1_BASE}/intervals?session_key={session_key}",
-                    timeout=self._timeout,
-                )
-            )
-            for interval in interval_rows:
-                key = str(interval.get("driver_number") or "")
-                if key and (
-                    key not in intervals
-                    or str(interval.get("date", "")) > str(intervals[key].get("date", ""))
-                ):
-                    intervals[key] = interval
+            self._update_openf1_intervals(timing)
+        driver_info = timing.drivers
+        latest_positions = timing.positions
+        best_laps = timing.best_laps
+        latest_laps = timing.latest_laps
+        intervals = timing.intervals
         positions = sorted(
             latest_positions.values(),
             key=lambda value: _integer(value.get("position"), 999),
@@ -410,15 +378,15 @@ class LiveRacingSource:
                 "car": key,
                 "team": team,
                 "team_logo": "",
-                "car_illustration": _f1_car_url(team),
-                "livery_primary": _f1_team_color(team),
+                "car_illustration": f1_car_url(team),
+                "livery_primary": f1_team_color(team),
                 "livery_secondary": "#111111",
                 "gap": gap,
                 "speed": "",
                 "status": "Active",
                 "on_track": True,
             })
-        flag = self._openf1_flag(session_key) if state == "in" else ""
+        flag = self._openf1_flag(timing) if state == "in" else ""
         lap = max(latest_laps.values(), default=0)
         total_laps = _integer(session.get("total_laps"))
         return drivers, ended, flag, lap, total_laps
@@ -450,22 +418,65 @@ class LiveRacingSource:
             ),
         )
 
-    def _openf1_flag(self, session_key: object) -> str:
+    def _openf1_rows(
+        self,
+        endpoint: str,
+        session_key: object,
+        cursor_field: str = "",
+        cursor: str = "",
+    ) -> tuple[Mapping[str, Any], ...]:
+        """Read one session stream, only past ``cursor`` once one is known."""
+
+        url = f"{_OPENF1_BASE}/{endpoint}?session_key={session_key}"
+        if cursor:
+            url += f"&{cursor_field}>{quote(cursor, safe=':')}"
+        return _sequence(self._client.get_json(url, timeout=self._timeout))
+
+    def _update_openf1_positions(self, timing: _OpenF1Timing) -> None:
+        rows = self._openf1_rows("position", timing.session_key, "date", timing.position_cursor)
+        timing.position_cursor = _merge_latest_rows(timing.positions, rows, timing.position_cursor)
+
+    def _update_openf1_intervals(self, timing: _OpenF1Timing) -> None:
+        rows = self._openf1_rows("intervals", timing.session_key, "date", timing.interval_cursor)
+        timing.interval_cursor = _merge_latest_rows(timing.intervals, rows, timing.interval_cursor)
+
+    def _update_openf1_laps(self, timing: _OpenF1Timing) -> None:
+        cursor = timing.lap_cursor
+        rows = self._openf1_rows(
+            "laps",
+            timing.session_key,
+            "date_start",
+            (cursor - _OPENF1_LAP_OVERLAP).isoformat() if cursor is not None else "",
+        )
+        for lap in rows:
+            key = str(lap.get("driver_number") or "")
+            duration = _number(lap.get("lap_duration"))
+            if duration and (key not in timing.best_laps or duration < timing.best_laps[key]):
+                timing.best_laps[key] = duration
+            lap_number = _integer(lap.get("lap_number"))
+            if key and lap_number > timing.latest_laps.get(key, 0):
+                timing.latest_laps[key] = lap_number
+            started = _parse_datetime(lap.get("date_start"))
+            if started is not None and (cursor is None or started > cursor):
+                cursor = started
+        timing.lap_cursor = cursor
+
+    def _openf1_flag(self, timing: _OpenF1Timing) -> str:
         try:
-            rows = _sequence(
-                self._client.get_json(
-                    f"{_OPENF1_BASE}/race_control?session_key={session_key}",
-                    timeout=self._timeout,
-                )
+            rows = self._openf1_rows(
+                "race_control", timing.session_key, "date", timing.race_control_cursor
             )
         except Exception:
-            return "GREEN"
-        for row in reversed(rows):
+            return timing.flag
+        for row in rows:
             message = str(row.get("message") or row.get("flag") or "").upper()
             flag = _normalize_racing_flag(message)
             if flag != "GREEN":
-                return flag
-        return "GREEN"
+                timing.flag = flag
+            date = str(row.get("date") or "")
+            if date > timing.race_control_cursor:
+                timing.race_control_cursor = date
+        return timing.flag
 
     def _f1_result_drivers(self) -> list[dict[str, Any]]:
         now = self._clock()
@@ -494,8 +505,8 @@ class LiveRacingSource:
                 "car": str(driver.get("permanentNumber") or result.get("number") or ""),
                 "team": str(constructor.get("name") or ""),
                 "team_logo": "",
-                "car_illustration": _f1_car_url(constructor.get("name")),
-                "livery_primary": _f1_team_color(constructor.get("name")),
+                "car_illustration": f1_car_url(constructor.get("name")),
+                "livery_primary": f1_team_color(constructor.get("name")),
                 "livery_secondary": "#111111",
                 "gap": "Leader" if pos == 1 else str(value or "")[:12],
                 "speed": "",
@@ -553,6 +564,9 @@ class LiveRacingSource:
         for identifier in tuple(self._indy_games):
             if identifier not in active_ids:
                 del self._indy_games[identifier]
+        for identifier in tuple(self._indy_driver_tables):
+            if identifier not in active_ids:
+                del self._indy_driver_tables[identifier]
         return games
 
     def _fetch_indycar_schedule(self) -> list[dict[str, Any]]:
@@ -642,8 +656,13 @@ class LiveRacingSource:
             total_laps = _integer(heartbeat.get("totalLaps") or heartbeat.get("TotalLaps") or heartbeat.get("lapsInEvent"))
             current_lap = max((_integer(item.get("laps")) for item in items), default=0)
             time_to_go = str(heartbeat.get("overallTimeToGo") or "").strip()
-        drivers = [_indycar_driver(item, drivers_index, session_key, track_type) for item in items]
-        drivers = sorted((driver for driver in drivers if driver is not None), key=lambda value: value["pos"] or 999)
+        drivers = _changed_drivers(
+            self._indy_driver_tables.setdefault(identifier, {}),
+            items,
+            lambda item: str(item.get("no") or "").strip(),
+            lambda item, car: (item, drivers_index.get(car), session_key, track_type),
+            lambda item: _indycar_driver(item, drivers_index, session_key, track_type),
+        )
 
         if state == "post":
             status = "FINAL"
@@ -797,6 +816,9 @@ class LiveRacingSource:
         for identifier in tuple(self._nascar_games):
             if identifier not in active_ids:
                 del self._nascar_games[identifier]
+        for identifier in tuple(self._nascar_driver_tables):
+            if identifier not in active_ids:
+                del self._nascar_driver_tables[identifier]
         return games
 
     def _fetch_nascar_schedule(self) -> list[dict[str, Any]]:
@@ -856,8 +878,13 @@ class LiveRacingSource:
         total_laps = _integer(timing.get("laps_in_race"))
         current_lap = _integer(timing.get("lap_number"))
         vehicles = _sequence(timing.get("vehicles")) if is_live_on_feed or state == "post" else ()
-        drivers = [_nascar_driver(v) for v in vehicles]
-        drivers = sorted((d for d in drivers if d is not None), key=lambda value: value["pos"] or 999)
+        drivers = _changed_drivers(
+            self._nascar_driver_tables.setdefault(identifier, {}),
+            vehicles,
+            lambda vehicle: str(vehicle.get("vehicle_number") or "").strip(),
+            lambda vehicle, car: vehicle,
+            _nascar_driver,
+        )
 
         if state == "post":
             status = "FINAL"
@@ -977,30 +1004,6 @@ def _f1_relevant_sessions(
     return []
 
 
-def _f1_short_event(value: str) -> str:
-    text = re.sub(r"^.*?\s+([A-Za-zÀ-ÿ -]+?)\s+Grand Prix.*$", r"\1 GP", value, flags=re.IGNORECASE)
-    text = text.replace("FORMULA 1", "").strip()
-    return " ".join(text.split()).title() or "Formula 1"
-
-
-def _f1_team_match(value: object) -> str:
-    lower = str(value or "").strip().lower()
-    return next((key for key in sorted(_F1_TEAM_SLUGS, key=len, reverse=True) if key in lower), "")
-
-
-def _f1_team_color(value: object) -> str:
-    return _F1_TEAM_COLORS.get(_f1_team_match(value), "#888888")
-
-
-def _f1_car_url(value: object) -> str:
-    slug = _F1_TEAM_SLUGS.get(_f1_team_match(value))
-    return (
-        f"https://media.formula1.com/image/upload/c_lfill,h_224/q_auto/v1740000001/common/f1/2026/{slug}/2026{slug}carright.webp"
-        if slug
-        else ""
-    )
-
-
 def _indycar_event_to_race(event: Mapping[str, Any]) -> dict[str, Any]:
     competitions = _sequence(event.get("competitions"))
     venue = _mapping(competitions[0].get("venue")) if competitions else {}
@@ -1459,6 +1462,52 @@ def _format_qualifying_time(value: float) -> str:
     return f"{int(minutes)}:{seconds:06.3f}" if minutes else f"{seconds:.3f}"
 
 
+def _changed_drivers(
+    table: dict[str, tuple[object, dict[str, Any] | None]],
+    rows: Sequence[Mapping[str, Any]],
+    car_for: Callable[[Mapping[str, Any]], str],
+    inputs_for: Callable[[Mapping[str, Any], str], object],
+    build: Callable[[Mapping[str, Any]], dict[str, Any] | None],
+) -> list[dict[str, Any]]:
+    """Rebuild only drivers whose feed rows changed and order them by position.
+
+    ``table`` keeps each car's last inputs and record between passes, so an
+    unchanged car skips ``build`` and reuses its last record. This only saves
+    rebuild work: the scheduler freezes results into new objects, so callers
+    downstream must not rely on record identity.
+    """
+
+    previous = dict(table)
+    table.clear()
+    drivers: list[dict[str, Any]] = []
+    for index, row in enumerate(rows):
+        car = car_for(row) or f"#{index}"
+        inputs = inputs_for(row, car)
+        cached = previous.get(car)
+        driver = cached[1] if cached is not None and cached[0] == inputs else build(row)
+        table[car] = (inputs, driver)
+        if driver is not None:
+            drivers.append(driver)
+    return sorted(drivers, key=lambda value: value["pos"] or 999)
+
+
+def _merge_latest_rows(
+    latest: dict[str, Mapping[str, Any]],
+    rows: Sequence[Mapping[str, Any]],
+    cursor: str,
+) -> str:
+    """Keep the newest row per driver and return the newest row date seen."""
+
+    for row in rows:
+        key = str(row.get("driver_number") or "")
+        date = str(row.get("date", ""))
+        if key and (key not in latest or date > str(latest[key].get("date", ""))):
+            latest[key] = row
+        if date > cursor:
+            cursor = date
+    return cursor
+
+
 def _session_ended(value: Mapping[str, Any], now: datetime | None = None) -> bool:
     end = _parse_datetime(value.get("date_end"))
     return end is not None and end < (now or datetime.now(timezone.utc))
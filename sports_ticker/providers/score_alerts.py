@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import replace
 from threading import Lock
 from time import time
 from typing import Any, Callable
 
+from sports_ticker.domain import ContentItem
+
+from .contracts import ProviderResult
 from .sports_display import matches_followed_team, sport_family
 
 
@@ -27,8 +32,10 @@ _BIG_KINDS = frozenset(
         "safety",
     )
 )
-_MAX_ALERTS = 64
+_MAX_ALERTS = 1024
 _MAX_AGE = 45.0
+_LOG_SECONDS = 900.0
+_SCORE_MEMORY_SECONDS = 900.0
 
 
 def _number(value: object) -> int | None:
@@ -138,19 +145,28 @@ def _extract_alert_detail(sport: str, game: Mapping[str, Any], side: str) -> str
 
 
 class ScoreAlertTracker:
-    """Keep score memory across scoreboard polls and release recent alerts."""
+    """Detect each score change once and keep a time-indexed alert log.
+
+    One tracker serves every ticker of a provider. Observations may cover any
+    subset of games, so a game's last score is kept until it has not been
+    seen for a while rather than dropped when one observation omits it.
+    Settings variants can observe one game through slices of different ages,
+    so each side's highest seen score is kept and only an advance past it
+    alerts; an older, lower slice never re-arms a goal. The log is ordered
+    by detection time and kept long enough for delayed tickers to look back
+    through it.
+    """
 
     def __init__(self, *, clock: Callable[[], float] = time) -> None:
         self._clock = clock
         self._lock = Lock()
-        self._scores: dict[str, tuple[int, int, str]] = {}
+        self._scores: dict[str, tuple[int, int, str, float]] = {}
         self._alerts: list[dict[str, Any]] = []
 
     def ingest(self, games: Sequence[Mapping[str, Any]]) -> None:
-        """Compare one complete scoreboard observation with the prior poll."""
+        """Compare one scoreboard observation with each game's last score."""
 
         now = float(self._clock())
-        current_ids: set[str] = set()
         with self._lock:
             for game in games:
                 if str(game.get("kind") or game.get("type") or "") != "scoreboard":
@@ -160,10 +176,14 @@ class ScoreAlertTracker:
                 away = _number(game.get("away_score"))
                 if not game_id or home is None or away is None:
                     continue
-                current_ids.add(game_id)
                 status = str(game.get("status") or "")
                 previous = self._scores.get(game_id)
-                self._scores[game_id] = (home, away, status)
+                if previous is None:
+                    self._scores[game_id] = (home, away, status, now)
+                else:
+                    self._scores[game_id] = (
+                        max(home, previous[0]), max(away, previous[1]), status, now
+                    )
                 if previous is None or str(game.get("state") or "").lower() not in _LIVE_STATES:
                     continue
                 sport = str(game.get("sport") or "").lower()
@@ -200,16 +220,37 @@ class ScoreAlertTracker:
                             "status": status,
                         }
                     )
-            self._scores = {key: value for key, value in self._scores.items() if key in current_ids}
-            self._alerts = self._alerts[-_MAX_ALERTS:]
+            score_cutoff = now - _SCORE_MEMORY_SECONDS
+            self._scores = {
+                key: value for key, value in self._scores.items() if value[3] >= score_cutoff
+            }
+            start = bisect_left(self._alerts, now - _LOG_SECONDS, key=_alert_time)
+            self._alerts = self._alerts[max(start, len(self._alerts) - _MAX_ALERTS):]
 
-    def recent(self, *, max_age: float = _MAX_AGE, delay: float = 0.0) -> tuple[dict[str, Any], ...]:
+    def recent(
+        self,
+        *,
+        max_age: float = _MAX_AGE,
+        delay: float = 0.0,
+        game_ids: Iterable[str] | None = None,
+    ) -> tuple[dict[str, Any], ...]:
         """Return alerts visible at the delayed content timestamp."""
 
         now = float(self._clock()) - max(0.0, float(delay or 0.0))
         cutoff = now - max(0.0, float(max_age))
+        games = None if game_ids is None else frozenset(game_ids)
         with self._lock:
-            return tuple(dict(item) for item in self._alerts if cutoff <= item["ts"] <= now)
+            start = bisect_left(self._alerts, cutoff, key=_alert_time)
+            end = bisect_right(self._alerts, now, key=_alert_time)
+            return tuple(
+                dict(item)
+                for item in self._alerts[start:end]
+                if games is None or item["game_id"] in games
+            )
+
+
+def _alert_time(alert: Mapping[str, Any]) -> float:
+    return alert["ts"]
 
 
 def alerts_for_settings(
@@ -231,5 +272,26 @@ def alerts_for_settings(
     )
 
 
-__all__ = ["ScoreAlertTracker", "alerts_for_settings"]
+def score_games(content: Iterable[ContentItem]) -> list[dict[str, Any]]:
+    """Return scoreboard content in the shape the tracker ingests."""
+
+    return [{"kind": item.kind, "id": item.id, **dict(item.data)} for item in content]
+
+
+def with_score_alerts(
+    result: ProviderResult, settings: Any, tracker: ScoreAlertTracker
+) -> ProviderResult:
+    """Attach the tracker's alerts for this result's games and ticker settings."""
+
+    alerts = alerts_for_settings(
+        tracker.recent(
+            delay=settings.live_delay_seconds if settings.live_delay_mode else 0.0,
+            game_ids=[item.id for item in result.content],
+        ),
+        settings,
+    )
+    return replace(result, alerts=alerts)
+
+
+__all__ = ["ScoreAlertTracker", "alerts_for_settings", "score_games", "with_score_alerts"]
 
@@ -0,0 +1,94 @@
+"""Single-flight result sharing with a short freshness window."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+
+@dataclass(slots=True)
+class _Entry:
+    future: Future = field(default_factory=Future)
+    loaded_at: float = 0.0
+
+
+class SharedResultCache:
+    """Share one load per key between concurrent callers and while it is fresh.
+
+    Concurrent callers for one key wait for the first caller's load. A
+    successful result is reused for ``max_age`` seconds after it arrives;
+    zero shares only loads that are still running. Failed loads are never
+    kept, and expired results are dropped whenever a new load starts.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_age: float = 0.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        age = float(max_age)
+        if not math.isfinite(age) or age < 0:
+            raise ValueError("max_age must be a finite non-negative number")
+        self._max_age = age
+        self._clock = clock
+        self._entries: dict[Hashable, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        key: Hashable,
+        load: Callable[[], Any],
+        *,
+        timeout: float | None = None,
+    ) -> Any:
+        """Return the fresh result for ``key``, loading it at most once.
+
+        A caller waiting on another caller's load raises ``TimeoutError``
+        after ``timeout`` seconds.
+        """
+
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is not None and (
+                not entry.future.done() or now - entry.loaded_at < self._max_age
+            ):
+                owner = False
+            else:
+                self._expire(now)
+                entry = self._entries[key] = _Entry()
+                owner = True
+        if not owner:
+            return entry.future.result(timeout)
+
+        try:
+            value = load()
+        except BaseException as error:
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            entry.future.set_exception(error)
+            raise
+        entry.loaded_at = self._clock()
+        entry.future.set_result(value)
+        return value
+
+    def _expire(self, now: float) -> None:
+        """Drop loaded results past their freshness bound; lock held."""
+
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if entry.future.done() and now - entry.loaded_at >= self._max_age
+        ]
+        for key in expired:
+            del self._entries[key]
+
+
+__all__ = ["SharedResultCache"]
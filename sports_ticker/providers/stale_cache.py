@@ -2,38 +2,106 @@
 
 from __future__ import annotations
 
+import math
 import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import fields
+from time import monotonic
+from types import MappingProxyType
 
 from sports_ticker.domain import DisplaySettings
 
 from .contracts import ProviderResult
 
 
+SettingsKey = Callable[[DisplaySettings], Hashable]
+
+
 class SettingsResultCache:
-    """Keep the latest healthy result for every effective settings value."""
+    """Keep the latest healthy result for each distinct provider settings key.
+
+    ``key`` reduces settings to the fields that can change one provider's
+    result; by default every settings field is used. At most
+    ``max_entries`` keys are kept, evicting the least recently used, and
+    results older than ``max_age`` seconds are dropped when one is given.
+    """
 
-    def __init__(self) -> None:
-        self._entries: list[tuple[DisplaySettings, ProviderResult]] = []
+    def __init__(
+        self,
+        key: SettingsKey | None = None,
+        *,
+        max_entries: int = 128,
+        max_age: float | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if int(max_entries) < 1:
+            raise ValueError("max_entries must be at least one")
+        if max_age is not None and (not math.isfinite(max_age) or max_age <= 0):
+            raise ValueError("max_age must be finite and positive")
+        self._key = key or full_settings_key
+        self._max_entries = int(max_entries)
+        self._max_age = None if max_age is None else float(max_age)
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, ProviderResult]] = OrderedDict()
+        self._counts = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
         self._lock = threading.RLock()
 
     def get(self, settings: DisplaySettings) -> ProviderResult | None:
-        """Return the result produced with these exact immutable settings."""
+        """Return the result produced with settings that share this key."""
 
+        key = self._key(settings)
         with self._lock:
-            for cached_settings, result in self._entries:
-                if cached_settings == settings:
-                    return result
-        return None
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0]):
+                del self._entries[key]
+                self._counts["expirations"] += 1
+                entry = None
+            if entry is None:
+                self._counts["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counts["hits"] += 1
+            return entry[1]
 
     def set(self, settings: DisplaySettings, result: ProviderResult) -> None:
-        """Replace the result produced with these exact immutable settings."""
+        """Replace the result produced with settings that share this key."""
+
+        key = self._key(settings)
+        with self._lock:
+            self._entries[key] = (self._clock(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._counts["evictions"] += 1
+
+    def stats(self) -> Mapping[str, int]:
+        """Return size, hit, miss, eviction, and expiration counts."""
 
         with self._lock:
-            for index, (cached_settings, _) in enumerate(self._entries):
-                if cached_settings == settings:
-                    self._entries[index] = (settings, result)
-                    return
-            self._entries.append((settings, result))
+            counts = dict(self._counts)
+            counts["entries"] = len(self._entries)
+        return MappingProxyType(counts)
+
+    def _expired(self, stored_at: float) -> bool:
+        return self._max_age is not None and self._clock() - stored_at >= self._max_age
+
+
+def full_settings_key(settings: DisplaySettings) -> Hashable:
+    """Return every settings field as one hashable key."""
+
+    return tuple(
+        (field.name, _hashable(getattr(settings, field.name)))
+        for field in fields(settings)
+    )
+
+
+def _hashable(value: object) -> Hashable:
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(key), _hashable(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    return value
 
 
-__all__ = ["SettingsResultCache"]
+__all__ = ["SettingsKey", "SettingsResultCache", "full_settings_key"]
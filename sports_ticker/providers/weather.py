@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
 from math import isfinite
+from time import monotonic
 from typing import Any
 from urllib.parse import urlencode
 
@@ -12,27 +14,56 @@ from sports_ticker.domain import ContentItem, DisplaySettings
 
 from .contracts import ProviderHealth, ProviderResult
 from .http import JsonHttpClient, UrllibJsonHttpClient
+from .shared_results import SharedResultCache
 from .stale_cache import SettingsResultCache
 
 
 _FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
 _AIR_QUALITY_URL = "https://air-quality-api.open-meteo.com/v1/air-quality"
+# About 5 km: nearby tickers in one metro area read the same model cell.
+_BUCKET_DEGREES = 0.05
+# Open-Meteo refreshes current conditions every 15 minutes and hourly AQI once an hour.
+_FORECAST_CACHE_SECONDS = 900.0
+_AIR_QUALITY_CACHE_SECONDS = 3600.0
 
 
 class OpenMeteoWeatherProvider:
-    """Fetch current, daily, and air-quality facts for one ticker."""
+    """Fetch current, daily, and air-quality facts for one ticker.
+
+    Responses are requested for the centre of each ticker's coordinate
+    bucket and shared by every ticker in it until Open-Meteo publishes new
+    data. The forecast and air-quality requests for one bucket run together.
+    """
 
     def __init__(
         self,
         client: JsonHttpClient | None = None,
         *,
         timeout: float = 10.0,
+        monotonic_clock: Callable[[], float] = monotonic,
     ) -> None:
         self.client = client or UrllibJsonHttpClient()
         self.timeout = float(timeout)
         if not isfinite(self.timeout) or self.timeout <= 0:
             raise ValueError("timeout must be a finite positive number")
-        self._stale_cache = SettingsResultCache()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ticker-weather")
+        self._forecasts = SharedResultCache(
+            max_age=_FORECAST_CACHE_SECONDS,
+            clock=monotonic_clock,
+        )
+        self._air_quality = SharedResultCache(
+            max_age=_AIR_QUALITY_CACHE_SECONDS,
+            clock=monotonic_clock,
+        )
+        self._stale_cache = SettingsResultCache(
+            lambda settings: (weather_bucket(settings), settings.weather_city)
+        )
+
+    @property
+    def result_cache(self) -> SettingsResultCache:
+        """Return the stale-result cache so its counters can be reported."""
+
+        return self._stale_cache
 
     def fetch(self, settings: DisplaySettings) -> ProviderResult:
         """Return fresh weather content or the provider's immutable stale result."""
@@ -42,10 +73,13 @@ class OpenMeteoWeatherProvider:
         try:
             if not isfinite(settings.weather_lat) or not isfinite(settings.weather_lon):
                 raise ValueError("weather coordinates must be finite")
+            bucket = weather_bucket(settings)
+            aqi_request = self._executor.submit(self._fetch_aqi, bucket)
+            latitude, longitude = bucket
             forecast_url = _query(
                 _FORECAST_URL,
-                latitude=settings.weather_lat,
-                longitude=settings.weather_lon,
+                latitude=latitude,
+                longitude=longitude,
                 current=(
                     "temperature_2m,weather_code,apparent_temperature,"
                     "wind_speed_10m,relative_humidity_2m,is_day,cloud_cover"
@@ -59,8 +93,11 @@ class OpenMeteoWeatherProvider:
                 wind_speed_unit="mph",
                 timezone="auto",
             )
-            weather_payload = self.client.get_json(forecast_url, timeout=self.timeout)
-            aqi, aqi_error = self._fetch_aqi(settings)
+            weather_payload = self._forecasts.get(
+                bucket,
+                lambda: self.client.get_json(forecast_url, timeout=self.timeout),
+            )
+            aqi, aqi_error = aqi_request.result()
             item = _content_item(settings, weather_payload, aqi)
             health = ProviderHealth(
                 healthy=aqi_error is None,
@@ -78,19 +115,26 @@ class OpenMeteoWeatherProvider:
         except Exception as exc:
             return self._stale_result(settings, exc)
 
-    def _fetch_aqi(self, settings: DisplaySettings) -> tuple[Any, str | None]:
+    def close(self) -> None:
+        """Stop the owned air-quality pool without waiting for abandoned calls."""
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_aqi(self, bucket: tuple[float, float]) -> tuple[Any, str | None]:
         """Fetch AQI separately because Open-Meteo exposes it on another host."""
 
+        latitude, longitude = bucket
+        url = _query(
+            _AIR_QUALITY_URL,
+            latitude=latitude,
+            longitude=longitude,
+            current="us_aqi",
+            timezone="auto",
+        )
         try:
-            payload = self.client.get_json(
-                _query(
-                    _AIR_QUALITY_URL,
-                    latitude=settings.weather_lat,
-                    longitude=settings.weather_lon,
-                    current="us_aqi",
-                    timezone="auto",
-                ),
-                timeout=self.timeout,
+            payload = self._air_quality.get(
+                bucket,
+                lambda: self.client.get_json(url, timeout=self.timeout),
             )
             current = _mapping(payload.get("current")) if isinstance(payload, Mapping) else {}
             return current.get("us_aqi"), None
@@ -117,6 +161,22 @@ class OpenMeteoWeatherProvider:
         )
 
 
+def weather_bucket(settings: DisplaySettings) -> tuple[float, float]:
+    """Return the rounded coordinate cell whose weather nearby tickers share.
+
+    Open-Meteo resolves ``timezone=auto`` from the requested coordinates, so
+    the cell centre also fixes the response timezone.
+    """
+
+    return _bucket(settings.weather_lat), _bucket(settings.weather_lon)
+
+
+def _bucket(value: float) -> float:
+    if not isfinite(value):
+        return value
+    return round(round(value / _BUCKET_DEGREES) * _BUCKET_DEGREES, 2)
+
+
 def _content_item(
     settings: DisplaySettings,
     payload: Any,
@@ -286,4 +346,4 @@ def _weather_icon(value: Any) -> str:
     return "cloud"
 
 
-__all__ = ["OpenMeteoWeatherProvider"]
+__all__ = ["OpenMeteoWeatherProvider", "weather_bucket"]
@@ -0,0 +1,40 @@
+"""Verify the backend runtime sleeps until the next scheduler deadline."""
+
+import pytest
+
+from sports_ticker.application.runtime import BackendRuntime
+
+
+pytestmark = pytest.mark.critical
+
+
+class Scheduler:
+    def __init__(self, deadline):
+        self.deadline = deadline
+
+    def run_due(self, now):
+        del now
+        return ()
+
+    def next_due(self):
+        return self.deadline
+
+
+class Events:
+    def remove_expired(self):
+        return 0
+
+
+def test_runtime_waits_for_next_deadline_and_wakes_early() -> None:
+    clock = [10.0]
+    scheduler = Scheduler(12.5)
+    runtime = BackendRuntime(scheduler, Events(), 30.0, monotonic=lambda: clock[0])
+
+    assert runtime.next_wait() == 2.5
+    scheduler.deadline = None
+    assert runtime.next_wait() == 30.0
+
+    runtime.wake()
+    assert runtime._wait_for_next_pass() is False
+    runtime.stop()
+    assert runtime._wait_for_next_pass() is True
@@ -1,10 +1,14 @@
 """Regression tests for provider isolation in the refresh scheduler."""
 
 from datetime import datetime, timezone
+from threading import Event
 
 import pytest
 
+from sports_ticker.application.intervals import LivenessIntervalPolicy
 from sports_ticker.application.scheduler import RefreshScheduler
+from sports_ticker.domain import ContentItem
+from sports_ticker.providers.contracts import ProviderHealth, ProviderResult
 
 
 pytestmark = pytest.mark.critical
@@ -69,7 +73,7 @@ def test_failed_refresh_keeps_compatible_cached_provider_data() -> None:
         monotonic=lambda: clock[0],
         wall_clock=lambda: datetime(2026, 8, 21, 18, 52, tzinfo=timezone.utc),
     )
-    scheduler.register_provider("espn", 5.0, lambda settings: {"scores": 1})
+    scheduler.register_provider("espn", 5.0, lambda settings: {"scores": clock[0]})
     scheduler.register_provider("racing", 15.0, racing_provider)
     scheduler.register_ticker("ticker-1", lambda ticker_id: {})
 
@@ -82,3 +86,317 @@ def test_failed_refresh_keeps_compatible_cached_provider_data() -> None:
     assert scheduler.get_health("racing").last_error == (
         "ticker-1: OpenF1 unavailable"
     )
+
+
+def test_tickers_with_one_settings_key_share_one_provider_call() -> None:
+    """Fan one shared fetch out to every ticker and finalize each ticker."""
+
+    fetched = []
+    finalized = []
+    scoped = []
+
+    def shared_provider(settings):
+        fetched.append(settings.timezone)
+        return {"zone": settings.timezone}
+
+    def finalize(ticker_id, settings, result):
+        del settings
+        finalized.append(ticker_id)
+        return {**result, "ticker": ticker_id}
+
+    def music_provider(ticker_id, settings):
+        del settings
+        scoped.append(ticker_id)
+        return {"account": ticker_id}
+
+    published = {}
+
+    def publish(ticker_id, settings, provider_data):
+        del settings
+        published[ticker_id] = dict(provider_data)
+        return True
+
+    zones = {"ticker-1": "America/New_York", "ticker-2": "America/New_York", "ticker-3": "Europe/London"}
+    scheduler = RefreshScheduler(
+        publish,
+        monotonic=lambda: 0.0,
+        wall_clock=lambda: datetime(2026, 8, 21, 18, 52, tzinfo=timezone.utc),
+    )
+    scheduler.register_provider(
+        "espn",
+        5.0,
+        shared_provider,
+        settings_key=lambda settings: (settings.timezone,),
+        finalize=finalize,
+    )
+    scheduler.register_provider("music", 0.6, music_provider, settings_key=lambda settings: ())
+    for ticker_id in zones:
+        scheduler.register_ticker(ticker_id, lambda ticker_id: {"timezone": zones[ticker_id]})
+
+    assert scheduler.run_due(0.0) == ("ticker-1", "ticker-2", "ticker-3")
+    assert sorted(fetched) == ["America/New_York", "Europe/London"]
+    assert finalized == ["ticker-1", "ticker-2", "ticker-3"]
+    assert scoped == ["ticker-1", "ticker-2", "ticker-3"]
+    assert published["ticker-2"]["espn"] == {"zone": "America/New_York", "ticker": "ticker-2"}
+    assert published["ticker-3"]["music"] == {"account": "ticker-3"}
+
+
+def test_slow_provider_times_out_without_delaying_other_publication() -> None:
+    """Publish fast provider data and record a missed deadline as a failure."""
+
+    release = Event()
+    published = []
+
+    def publish(ticker_id, settings, provider_data):
+        del settings
+        published.append((ticker_id, dict(provider_data)))
+        return True
+
+    def slow_provider(settings):
+        del settings
+        release.wait(5.0)
+        return {"scores": "late"}
+
+    scheduler = RefreshScheduler(
+        publish,
+        monotonic=lambda: 0.0,
+        wall_clock=lambda: datetime(2026, 8, 21, 18, 52, tzinfo=timezone.utc),
+        max_workers=2,
+    )
+    scheduler.register_provider("espn", 5.0, slow_provider, timeout=0.05)
+    scheduler.register_provider("music", 0.6, lambda settings: {"track": "now"}, timeout=1.0)
+    scheduler.register_ticker("ticker-1", lambda ticker_id: {})
+    try:
+        assert scheduler.run_due(0.0) == ("ticker-1",)
+    finally:
+        release.set()
+        scheduler.close()
+
+    assert published == [("ticker-1", {"music": {"track": "now"}})]
+    assert scheduler.get_health("espn").last_error == "ticker-1: timed out after 0.05s"
+    assert scheduler.get_health("espn").consecutive_failures == 1
+    assert scheduler.get_health("music").last_error is None
+
+
+def test_idle_pass_reads_no_settings_and_invalidation_refreshes_one_ticker() -> None:
+    """Sleep between deadlines and refetch only a ticker whose settings changed."""
+
+    reads = []
+    zones = {"ticker-1": "America/New_York", "ticker-2": "America/New_York"}
+    fetched = []
+
+    def resolve(ticker_id):
+        reads.append(ticker_id)
+        return {"timezone": zones[ticker_id]}
+
+    def provider(settings):
+        fetched.append(settings.timezone)
+        return {"zone": settings.timezone}
+
+    scheduler = RefreshScheduler(
+        lambda ticker_id, settings, provider_data: True,
+        monotonic=lambda: 0.0,
+        wall_clock=lambda: datetime(2026, 8, 21, 18, 52, tzinfo=timezone.utc),
+    )
+    scheduler.register_provider("clock", 3600.0, provider, settings_key=lambda settings: (settings.timezone,))
+    scheduler.register_provider("espn", 5.0, lambda settings: {"scores": 1})
+    for ticker_id in zones:
+        scheduler.register_ticker(ticker_id, resolve)
+
+    assert scheduler.run_due(0.0) == ("ticker-1", "ticker-2")
+    assert scheduler.next_due() == 5.0
+    reads.clear()
+    assert scheduler.run_due(1.0) == ()
+    assert reads == []
+
+    zones["ticker-2"] = "Europe/London"
+    scheduler.invalidate_ticker("ticker-2")
+    assert scheduler.next_due() == 0.0
+    assert scheduler.run_due(2.0) == ("ticker-2",)
+    assert reads == ["ticker-2"]
+    assert fetched == ["America/New_York", "Europe/London"]
+    assert scheduler.next_due() == 5.0
+
+
+def test_unchanged_settings_version_skips_resolving_settings() -> None:
+    """Reuse normalized settings on due passes until the ticker version moves."""
+
+    reads = []
+    versions = {"ticker-1": 1}
+
+    def resolve(ticker_id):
+        reads.append(ticker_id)
+        return {"timezone": "America/New_York"}
+
+    scheduler = RefreshScheduler(
+        lambda ticker_id, settings, provider_data: True,
+        monotonic=lambda: 0.0,
+        wall_clock=lambda: datetime(2026, 8, 21, 18, 52, tzinfo=timezone.utc),
+    )
+    scores = iter(range(10))
+    scheduler.register_provider("espn", 5.0, lambda settings: {"scores": next(scores)})
+    scheduler.register_ticker("ticker-1", resolve, version=versions.__getitem__)
+
+    assert scheduler.run_due(0.0) == ("ticker-1",)
+    assert scheduler.run_due(5.0) == ("ticker-1",)
+    assert reads == ["ticker-1"]
+
+    versions["ticker-1"] = 2
+    assert scheduler.run_due(10.0) == ("ticker-1",)
+    assert reads == ["ticker-1", "ticker-1"]
+
+
+def test_unchanged_provider_content_does_not_republish_snapshot() -> None:
+    """Skip tickers whose provider content matches their last snapshot."""
+
+    published = []
+    score = ["1"]
+
+    def publish(ticker_id, settings, provider_data):
+        published.append(ticker_id)
+        return True
+
+    def provider(settings):
+        item = ContentItem(id="game-1", data={"state": "in", "home_score": score[0]})
+        return ProviderResult(content=(item,))
+
+    scheduler = RefreshScheduler(
+        publish,
+        monotonic=lambda: 0.0,
+        wall_clock=lambda: datetime(2026, 8, 21, 18, 52, tzinfo=timezone.utc),
+    )
+    scheduler.register_provider("espn", 5.0, provider)
+    scheduler.register_ticker("ticker-1", lambda ticker_id: {})
+
+    assert scheduler.run_due(0.0) == ("ticker-1",)
+    assert scheduler.run_due(5.0) == ()
+    assert published == ["ticker-1"]
+
+    score[0] = "2"
+    assert scheduler.run_due(10.0) == ("ticker-1",)
+    assert published == ["ticker-1", "ticker-1"]
+
+
+def test_per_ticker_setting_change_refinalizes_from_the_shared_value() -> None:
+    """Apply a score-alert toggle between due passes without refetching."""
+
+    fetches = []
+    published = []
+    alerts = [True]
+    scheduler = RefreshScheduler(
+        lambda ticker_id, settings, provider_data: published.append(
+            (settings.score_alerts, provider_data["espn"]["alerts"])
+        ),
+        monotonic=lambda: 0.0,
+        wall_clock=lambda: datetime(2026, 8, 21, 18, 0, tzinfo=timezone.utc),
+    )
+    scheduler.register_provider(
+        "espn",
+        300.0,
+        lambda settings: fetches.append(settings) or {"scores": 1},
+        settings_key=lambda settings: settings.timezone,
+        finalize=lambda ticker_id, settings, result: {**result, "alerts": settings.score_alerts},
+    )
+    scheduler.register_ticker("ticker-1", lambda ticker_id: {"score_alerts": alerts[0]})
+
+    assert scheduler.run_due(0.0) == ("ticker-1",)
+    alerts[0] = False
+    scheduler.invalidate_ticker("ticker-1")
+    assert scheduler.run_due(5.0) == ("ticker-1",)
+
+    assert len(fetches) == 1
+    assert published == [(True, True), (False, False)]
+
+
+def test_moved_settings_version_refreshes_a_mismatched_provider_without_invalidation() -> None:
+    """Detect a settings change from its version even when nobody invalidated it."""
+
+    fetches = []
+    published = []
+    settings = [{"timezone": "America/New_York"}]
+    version = [1]
+    scheduler = RefreshScheduler(
+        lambda ticker_id, settings, provider_data: published.append(provider_data["clock"]),
+        monotonic=lambda: 0.0,
+        wall_clock=lambda: datetime(2026, 8, 21, 18, 0, tzinfo=timezone.utc),
+    )
+    scheduler.register_provider(
+        "clock",
+        300.0,
+        lambda settings: fetches.append(settings.timezone) or {"zone": settings.timezone},
+        settings_key=lambda settings: settings.timezone,
+    )
+    scheduler.register_ticker(
+        "ticker-1", lambda ticker_id: settings[0], version=lambda ticker_id: version[0]
+    )
+
+    assert scheduler.run_due(0.0) == ("ticker-1",)
+    assert scheduler.run_due(5.0) == ()
+    settings[0] = {"timezone": "Europe/London"}
+    version[0] = 2
+    assert scheduler.run_due(10.0) == ("ticker-1",)
+
+    assert fetches == ["America/New_York", "Europe/London"]
+    assert published[-1]["zone"] == "Europe/London"
+
+
+def test_liveness_policy_backs_off_overnight_and_returns_for_live_games() -> None:
+    """Slow an idle provider down and restore live cadence from content state."""
+
+    now = datetime(2026, 8, 21, 6, 0, tzinfo=timezone.utc)
+    policy = LivenessIntervalPolicy(live=5.0, near=60.0, idle=300.0, clock=lambda: now)
+
+    def result(state, start):
+        item = ContentItem(id="g", family="sports", kind="scoreboard", data={"state": state, "startTimeUTC": start})
+        return ProviderResult(content=(item,), health=ProviderHealth(provider="espn"))
+
+    assert policy((result("post", "2026-08-21T01:00:00Z"),)) == 300.0
+    assert policy((result("pre", "2026-08-21T08:00:00Z"),)) == 60.0
+    assert policy((result("pre", "2026-08-21T06:10:30Z"),)) == 30.0
+    assert policy((result("pre", "2026-08-21T05:59:00Z"),)) == 5.0
+    assert policy((result("pre", "2026-08-20T18:00:00Z"),)) == 300.0
+    assert policy((result("in", "2026-08-21T05:00:00Z"),)) == 5.0
+
+    states = ["post"]
+    scheduler = RefreshScheduler(
+        lambda ticker_id, settings, provider_data: True,
+        monotonic=lambda: 0.0,
+        wall_clock=lambda: now,
+    )
+    scheduler.register_provider(
+        "espn",
+        5.0,
+        lambda settings: result(states[0], "2026-08-21T01:00:00Z"),
+        interval_policy=policy,
+    )
+    scheduler.register_ticker("ticker-1", lambda ticker_id: {})
+
+    scheduler.run_due(0.0)
+    assert scheduler.next_due() == 300.0
+    assert scheduler.run_due(5.0) == ()
+    states[0] = "in"
+    scheduler.run_due(300.0)
+    assert scheduler.next_due() == 305.0
+
+
+def test_expedited_provider_runs_on_the_next_pass_before_its_deadline() -> None:
+    """Refresh one pushed provider early without moving its regular deadline."""
+
+    calls = []
+    scheduler = RefreshScheduler(
+        lambda ticker_id, settings, provider_data: True,
+        monotonic=lambda: 0.0,
+        wall_clock=lambda: datetime(2026, 8, 21, 18, 52, tzinfo=timezone.utc),
+    )
+    scheduler.register_provider("racing", 15.0, lambda settings: calls.append(len(calls)) or {"pass": len(calls)})
+    scheduler.register_provider("espn", 5.0, lambda settings: {"scores": 1})
+    scheduler.register_ticker("ticker-1", lambda ticker_id: {})
+    scheduler.run_due(0.0)
+
+    scheduler.expedite_provider("racing")
+    assert scheduler.next_due() == 0.0
+    assert scheduler.run_due(3.0) == ("ticker-1",)
+    assert calls == [0, 1]
+    assert scheduler.run_due(4.0) == ()
+    scheduler.run_due(15.0)
+    assert calls == [0, 1, 2]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from dataclasses import replace
+from datetime import datetime, timedelta
+from threading import Event, Thread
 from typing import Any, Mapping
 from cryptography.fernet import Fernet
 from PIL import Image
@@ -12,6 +14,7 @@ from sports_ticker.fleet import SpotifyConnection, TickerRepository
 from sports_ticker.integrations.spotify import (
     SpotifyConfig,
     SpotifyHttpPort,
+    SpotifyIntegrationError,
     SpotifyIntegrationService,
     SpotifyMusicSource,
 )
@@ -28,17 +31,24 @@ class FakeSpotifyHttp(SpotifyHttpPort):
         self.playback_response: Mapping[str, Any] | None = None
         self.queue_response: Mapping[str, Any] | None = None
         self.queue_raises = False
+        self.refresh_calls = 0
+        self.refreshed = Event()
+        self.playback_errors: list[Exception] = []
 
     def exchange_code(self, code: str, config: SpotifyConfig, verifier: str) -> Mapping[str, Any]:
         return {"access_token": "fake-access", "refresh_token": "fake-refresh"}
 
     def refresh_access_token(self, refresh_token: str, config: SpotifyConfig) -> Mapping[str, Any]:
-        return {"access_token": "fake-access", "refresh_token": refresh_token}
+        self.refresh_calls += 1
+        self.refreshed.set()
+        return {"access_token": f"fake-access-{self.refresh_calls}", "refresh_token": refresh_token, "expires_in": 3600}
 
     def get_current_user(self, access_token: str) -> Mapping[str, Any]:
         return {"id": "user-1", "display_name": "Test User"}
 
     def get_playback(self, access_token: str) -> Mapping[str, Any] | None:
+        if self.playback_errors:
+            raise self.playback_errors.pop(0)
         return self.playback_response
 
     def get_queue(self, access_token: str) -> Mapping[str, Any] | None:
@@ -60,7 +70,9 @@ def _sample_track(track_id: str, title: str, artist: str, album: str, cover_url:
     }
 
 
-def _setup_service(tmp_path, http: FakeSpotifyHttp) -> tuple[SpotifyIntegrationService, TickerRepository]:
+def _setup_service(
+    tmp_path, http: FakeSpotifyHttp, clock=None, **options: Any
+) -> tuple[SpotifyIntegrationService, TickerRepository]:
     key = Fernet.generate_key().decode("ascii")
     config = SpotifyConfig(
         client_id="test_client",
@@ -80,7 +92,9 @@ def _setup_service(tmp_path, http: FakeSpotifyHttp) -> tuple[SpotifyIntegrationS
         priority=True,
     )
     repository.save_group_spotify_connection("ticker:ticker-1", connection)
-    service = SpotifyIntegrationService(repository, config, http=http)
+    if clock is not None:
+        options["clock"] = clock
+    service = SpotifyIntegrationService(repository, config, http=http, **options)
     return service, repository
 
 
@@ -216,6 +230,155 @@ def test_spotify_queue_error_does_not_crash_playback(tmp_path) -> None:
         repository.close()
 
 
+def test_spotify_access_token_is_reused_until_shortly_before_expiry(tmp_path) -> None:
+    """Refresh the access token ahead of expiry, after expiry, and after a 401."""
+    http = FakeSpotifyHttp()
+    now = [1000.0]
+    service, repository = _setup_service(tmp_path, http, clock=lambda: now[0])
+
+    try:
+        service.playback("ticker-1")
+        service.playback("ticker-1")
+        assert http.refresh_calls == 1
+
+        http.refreshed.clear()
+        now[0] += 3600 - 60 - 299
+        service.playback("ticker-1")
+        assert http.refreshed.wait(5)
+        assert http.refresh_calls == 2
+
+        now[0] += 3600
+        service.playback("ticker-1")
+        assert http.refresh_calls == 3
+
+        http.playback_errors.append(SpotifyIntegrationError("Spotify returned HTTP 401"))
+        record = service.playback("ticker-1")
+        assert http.refresh_calls == 4
+        assert record["status"] != "reauthorization_required"
+    finally:
+        repository.close()
+
+
+def test_spotify_token_refresh_for_one_account_does_not_block_another(tmp_path) -> None:
+    """Refresh two linked accounts concurrently instead of behind one lock."""
+    http = FakeSpotifyHttp()
+    entered, release = Event(), Event()
+    refresh = http.refresh_access_token
+
+    def slow_first_refresh(refresh_token: str, config: SpotifyConfig) -> Mapping[str, Any]:
+        if not entered.is_set():
+            entered.set()
+            release.wait(5)
+        return refresh(refresh_token, config)
+
+    http.refresh_access_token = slow_first_refresh
+    service, repository = _setup_service(tmp_path, http)
+    first = repository.get_group_spotify_connection("ticker:ticker-1")
+    repository.save_group_spotify_connection(
+        "ticker:ticker-2",
+        replace(first, ticker_id="ticker-2", spotify_account_id="user-2"),
+    )
+    blocked = Thread(target=service.playback, args=("ticker-1",))
+
+    try:
+        blocked.start()
+        assert entered.wait(5)
+        service.playback("ticker-2")
+        assert http.refresh_calls == 1
+    finally:
+        release.set()
+        blocked.join(5)
+        repository.close()
+    assert http.refresh_calls == 2
+
+
+def test_spotify_playback_is_shared_by_tickers_in_one_controller_group(tmp_path) -> None:
+    """Serve every ticker in a group from one playback fetch per freshness window."""
+    http = FakeSpotifyHttp()
+    http.playback_response = {
+        "is_playing": True,
+        "progress_ms": 1000,
+        "item": _sample_track("t1", "Track One", "Artist One", "Album One", "https://img.spotify.com/t1.jpg"),
+    }
+    fetches = []
+    get_playback = http.get_playback
+    http.get_playback = lambda access_token: fetches.append(access_token) or get_playback(access_token)
+    now = [0.0]
+    service, repository = _setup_service(
+        tmp_path, http, playback_share_seconds=0.6, monotonic_clock=lambda: now[0]
+    )
+    repository.controller_group_id_for_ticker = lambda ticker_id: "ticker:ticker-1"
+
+    try:
+        first = service.playback("ticker-1")
+        second = service.playback("ticker-2")
+        assert second == first and second is not first
+        assert len(fetches) == 1
+
+        now[0] = 0.6
+        service.playback("ticker-2")
+        assert len(fetches) == 2
+    finally:
+        repository.close()
+
+
+def test_spotify_music_source_polls_by_playback_state_and_reuses_the_last_record() -> None:
+    """Skip Spotify mid-track and while paused, and poll quickly near a track boundary."""
+
+    class FakeService:
+        def __init__(self) -> None:
+            self.calls = 0
+            self.record: dict[str, Any] = {}
+
+        def playback(self, ticker_id: str) -> Mapping[str, Any]:
+            self.calls += 1
+            return dict(self.record)
+
+    service = FakeService()
+    now = [0.0]
+    source = SpotifyMusicSource(service, clock=lambda: now[0])
+    settings = DisplaySettings()
+    fetched = datetime(2026, 8, 16, 12, 0, 0)
+    service.record = {
+        "id": "spotify:t1",
+        "status": "playing",
+        "is_playing": True,
+        "progress": 30.0,
+        "duration": 210.0,
+        "fetch_ts": fetched.timestamp(),
+    }
+
+    first = source.fetch_for_ticker("ticker-1", settings)["content"][0]
+    now[0] = 3.0
+    between = source.fetch_for_ticker("ticker-1", settings)["content"][0]
+    assert between is first
+    assert service.calls == 1
+    renderer = MusicRenderer(load_default_font_set())
+    image, _state = renderer.render_with_state(
+        RenderContext(fetched + timedelta(seconds=3)), dict(between), MusicAnimationState()
+    )
+    progress_pixels = sum(1 for x in range(image.width) if image.getpixel((x, 31))[:3] != (0, 0, 0))
+    assert progress_pixels == int(image.width * 33.0 / 210.0) + 1
+
+    now[0] = 5.0
+    service.record["progress"] = 207.0
+    source.fetch_for_ticker("ticker-1", settings)
+    now[0] = 6.0
+    service.record = {"id": "spotify:t2", "status": "paused", "is_playing": False, "progress": 0.0, "duration": 180.0}
+    source.fetch_for_ticker("ticker-1", settings)
+    assert service.calls == 3
+
+    now[0] = 7.0
+    source.fetch_for_ticker("ticker-1", settings)
+    now[0] = 12.0
+    assert source.fetch_for_ticker("ticker-1", settings)["content"][0]["progress"] == 0.0
+    assert service.calls == 4
+
+    now[0] = 400.0
+    source.fetch_for_ticker("ticker-2", settings)
+    assert set(source._plans) == {"ticker-2"}
+
+
 def test_asset_planner_plans_last_song_and_next_three_songs() -> None:
     """Ensure AssetPlanner extracts all cover URLs from music payloads."""
     planner = AssetPlanner()
@@ -1,10 +1,12 @@
 """Verify ESPN calendar reads and canonical scoreboard filtering."""
 
 from datetime import datetime, timezone
+from threading import Barrier
 from urllib.parse import parse_qs, urlsplit
 
 from sports_ticker.domain import DisplaySettings
 from sports_ticker.providers.espn import EspnScoreboardProvider, _scoreboard_url_for_dates
+from sports_ticker.providers.http import SingleFlightJsonHttpClient
 
 
 def _event(event_id: str, start: str, *, state: str = "pre") -> dict:
@@ -186,3 +188,147 @@ def test_espn_missing_event_id_is_unhealthy() -> None:
     assert result.health.healthy is False
     assert result.health.error is not None
     assert "nfl event: event id is missing" in result.health.error
+
+
+def test_espn_requests_active_leagues_concurrently_in_stable_order() -> None:
+    barrier = Barrier(2, timeout=5)
+
+    class ConcurrentClient:
+        def get_json(self, url: str, *, timeout: float):
+            del timeout
+            barrier.wait()
+            league = urlsplit(url).path.split("/")[2]
+            start = "2026-08-16T18:00:00Z" if league == "nfl" else "2026-08-16T15:00:00Z"
+            return {"events": [_event(f"{league}-game", start)]}
+
+    provider = EspnScoreboardProvider(
+        {
+            "nfl": "https://example.test/football/nfl/scoreboard",
+            "ncf": "https://example.test/football/ncf/scoreboard",
+        },
+        client=ConcurrentClient(),
+        now=lambda: datetime(2026, 8, 16, 7, tzinfo=timezone.utc),
+    )
+    try:
+        result = provider.fetch(_settings())
+    finally:
+        provider.close()
+
+    assert result.health.healthy is True
+    assert [item.id for item in result.content] == ["ncf-game", "nfl-game"]
+
+
+def test_espn_reprojects_only_events_whose_facts_changed() -> None:
+    first = _event("game-a", "2026-08-16T15:00:00Z")
+    second = _event("game-b", "2026-08-16T18:00:00Z")
+    client = RecordingClient({"20260816-20260817": {"events": [first, second]}})
+    provider = EspnScoreboardProvider(
+        {"nfl": "https://example.test/football/nfl/scoreboard"},
+        client=client,
+        now=lambda: datetime(2026, 8, 16, 7, tzinfo=timezone.utc),
+    )
+    projected = []
+    display = provider._display
+
+    class CountingProjector:
+        def project(self, item, event):
+            projected.append(item.id)
+            return display.project(item, event)
+
+    provider._display = CountingProjector()
+    try:
+        before = provider.fetch(_settings())
+        changed = _event("game-b", "2026-08-16T18:00:00Z")
+        changed["competitions"][0]["competitors"][0]["score"] = "7"
+        client.responses["20260816-20260817"] = {"events": [first, changed]}
+        after = provider.fetch(_settings())
+        client.responses["20260816-20260817"] = {"events": [changed]}
+        provider.fetch(_settings())
+    finally:
+        provider.close()
+
+    assert projected == ["game-a", "game-b", "game-b"]
+    assert after.content[0] is before.content[0]
+    assert after.content[1].data["home_score"] == "7"
+    assert list(provider._projections) == [("nfl", "game-b")]
+
+
+def test_espn_settings_variants_share_one_fresh_league_fetch() -> None:
+    client = RecordingClient(
+        {"20260816-20260817": {"events": [_event("game-current", "2026-08-16T15:00:00Z")]}}
+    )
+    clock = [0.0]
+    provider = EspnScoreboardProvider(
+        {
+            "nfl": "https://example.test/football/nfl/scoreboard",
+            "ncf": "https://example.test/football/ncf/scoreboard",
+        },
+        client=SingleFlightJsonHttpClient(client, ttl_seconds=3.0, clock=lambda: clock[0]),
+        now=lambda: datetime(2026, 8, 16, 7, tzinfo=timezone.utc),
+    )
+    nfl_only = DisplaySettings(timezone="America/New_York", active_sports={"ncf": False})
+    try:
+        provider.fetch(_settings())
+        provider.fetch(nfl_only)
+        assert len(client.urls) == 2
+        clock[0] = 3.0
+        provider.fetch(nfl_only)
+    finally:
+        provider.close()
+
+    assert len(client.urls) == 3
+    assert "/nfl/" in client.urls[-1]
+
+
+def test_espn_result_cache_counters_are_reported_in_http_health(tmp_path) -> None:
+    from sports_ticker.bootstrap_v2 import create_backend_application
+
+    provider = EspnScoreboardProvider(
+        {"nfl": "https://example.test/football/nfl/scoreboard"},
+        client=RecordingClient({}),
+        now=lambda: datetime(2026, 8, 16, 7, tzinfo=timezone.utc),
+    )
+    app = create_backend_application(tmp_path / "ticker.sqlite3", [], scheduler=None)
+    application = app.extensions["sports_ticker.backend_application"]
+    application.caches["espn_results"] = provider.result_cache
+    try:
+        provider.fetch(_settings())
+        body = app.test_client().get("/api/v2/health").get_json()
+    finally:
+        provider.close()
+        application.close()
+
+    assert body["http"]["espn_results"]["entries"] == 1
+
+
+def test_espn_time_zone_variants_keep_projections_their_slices_share() -> None:
+    shared = _event("game-a", "2026-08-16T15:00:00Z")
+    client = RecordingClient(
+        {
+            "20260816-20260817": {"events": [shared, _event("game-b", "2026-08-16T18:00:00Z")]},
+            "20260815-20260816": {"events": [_event("game-z", "2026-08-16T01:00:00Z"), shared]},
+        }
+    )
+    provider = EspnScoreboardProvider(
+        {"nfl": "https://example.test/football/nfl/scoreboard"},
+        client=client,
+        now=lambda: datetime(2026, 8, 16, 7, tzinfo=timezone.utc),
+    )
+    projected = []
+    display = provider._display
+
+    class CountingProjector:
+        def project(self, item, event):
+            projected.append(item.id)
+            return display.project(item, event)
+
+    provider._display = CountingProjector()
+    honolulu = DisplaySettings(timezone="Pacific/Honolulu")
+    try:
+        for settings in (_settings(), honolulu, _settings(), honolulu):
+            provider.fetch(settings)
+    finally:
+        provider.close()
+
+    assert projected.count("game-a") == 1
+    assert ("nfl", "game-b") in provider._projections
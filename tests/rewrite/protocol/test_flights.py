@@ -219,6 +219,32 @@ def test_flight_source_supplies_live_and_airport_contract_facts() -> None:
     assert airport["departures"][0]["delay_min"] == 30
 
 
+def test_airport_board_is_shared_per_airport() -> None:
+    calls = []
+    elapsed = [0.0]
+
+    class CountingFixture(FlightRadarFixture):
+        def get_airport_details(self, code: str, *, flight_limit: int) -> dict[str, object]:
+            calls.append(code)
+            return super().get_airport_details(code, flight_limit=flight_limit)
+
+    source = FlightRadarSource(
+        CountingFixture(), clock=lambda: NOW, monotonic_clock=lambda: elapsed[0]
+    )
+    first = source.fetch(_settings())["content"][1]
+    other = DisplaySettings(
+        mode="flights", airport_code_iata="EWR", airport_name="Newark Airport"
+    )
+    shared = source.fetch(other)["content"][0]
+
+    assert calls == ["EWR"]
+    assert shared["weather"]["airport_name"] == "Newark Liberty International"
+    elapsed[0] = 30.0
+    refreshed = source.fetch(other)["content"][0]
+    assert calls == ["EWR", "EWR"]
+    assert refreshed["arrivals"] == first["arrivals"]
+
+
 def test_flight_search_does_not_select_a_nearby_flight_number() -> None:
     source = FlightRadarSource(NearMissFlightRadarFixture(), clock=lambda: NOW)
     visitor = source.fetch(_settings())["content"][0]
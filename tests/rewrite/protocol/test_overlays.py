@@ -1,3 +1,6 @@
+import threading
+import time
+
 import pytest
 
 from sports_ticker.domain import DisplaySettings
@@ -76,3 +79,44 @@ def test_espn_news_source_produces_half_panel_payload_for_followed_team():
     assert records["news"][0]["domain"] == "sports"
     assert records["news"][0]["from_abbr"] == "NYG"
     assert records["news"][0]["text"] == "Giants prepare for Sunday matchup"
+
+
+def test_espn_news_source_shares_one_feed_request_and_indexes_teams():
+    calls = []
+    release = threading.Event()
+
+    class GatedNewsClient:
+        def get_json(self, url, *, timeout):
+            calls.append(url)
+            release.wait(timeout)
+            giants = {
+                "id": "article-1",
+                "headline": "Giants host Dallas",
+                "categories": [{"team": {"abbreviation": "NYG"}}, {"team": {"abbreviation": "DAL"}}],
+            }
+            return {
+                "articles": [
+                    giants,
+                    giants,
+                    {"id": "article-2", "headline": "Dallas injury report", "categories": [{"team": {"abbreviation": "DAL"}}]},
+                ]
+            }
+
+    source = EspnNewsSource({"nfl": "https://example.test/nfl/news"}, client=GatedNewsClient())
+    giants = DisplaySettings(my_teams=("nfl:NYG",))
+    dallas = DisplaySettings(my_teams=("nfl:DAL", "nfl:NYG"))
+    try:
+        assert source.fetch(giants) == {"news": []}
+        assert source.fetch(dallas) == {"news": []}
+        release.set()
+        deadline = time.monotonic() + 5
+        while not source.fetch(dallas)["news"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert calls == ["https://example.test/nfl/news"]
+        assert [record["text"] for record in source.fetch(giants)["news"]] == ["Giants host Dallas"]
+        both = source.fetch(dallas)["news"]
+        assert [record["text"] for record in both] == ["Giants host Dallas", "Dallas injury report"]
+        assert both[0]["teams"] == ["DAL", "NYG"]
+    finally:
+        source.close()
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from sports_ticker.domain import DisplaySettings
 from sports_ticker.providers.racing import RacingProvider
@@ -15,6 +15,8 @@ class JsonFixture:
         self.urls.append(url)
         for prefix, value in self.values.items():
             if url.startswith(prefix):
+                if isinstance(value, Exception):
+                    raise value
                 return value
         raise AssertionError(f"unexpected URL: {url}")
 
@@ -81,6 +83,64 @@ def test_f1_polls_openf1_positions_for_the_current_session() -> None:
     assert any("api.openf1.org/v1/position" in url for url in client.urls)
 
 
+def test_f1_reads_only_openf1_rows_newer_than_each_session_cursor() -> None:
+    now = datetime(2026, 8, 15, 15, 0, tzinfo=timezone.utc)
+    base = "https://api.openf1.org/v1"
+    client = JsonFixture(
+        {
+            "https://site.api.espn.com/apis/site/v2/sports/racing/f1/scoreboard": {
+                "events": [
+                    {
+                        "id": "f1-event",
+                        "name": "Canadian Grand Prix",
+                        "competitions": [{"type": {"abbreviation": "Race"}, "startDate": "2026-08-15T14:00:00Z"}],
+                    }
+                ]
+            },
+            f"{base}/sessions?session_key=latest": [
+                {"session_key": 99, "session_name": "Race", "date_start": "2026-08-15T14:00:00Z"}
+            ],
+            f"{base}/position?session_key=99&date>2026-08-15T15:00:00Z": [
+                {"driver_number": 2, "position": 1, "date": "2026-08-15T15:00:10Z"},
+                {"driver_number": 1, "position": 2, "date": "2026-08-15T15:00:10Z"},
+            ],
+            f"{base}/laps?session_key=99&date_start>2026-08-15T14:54:30%2B00:00": [
+                {"driver_number": 2, "lap_number": 13, "date_start": "2026-08-15T15:00:05Z"},
+            ],
+            f"{base}/intervals?session_key=99&date>2026-08-15T15:00:00Z": [],
+            f"{base}/race_control?session_key=99&date>2026-08-15T14:30:00Z": ConnectionError("race control down"),
+            f"{base}/drivers?session_key=99": [
+                {"driver_number": 1, "full_name": "Leader Driver", "name_acronym": "LED"},
+                {"driver_number": 2, "full_name": "Second Driver", "name_acronym": "SEC"},
+            ],
+            f"{base}/position?session_key=99": [
+                {"driver_number": 1, "position": 1, "date": "2026-08-15T15:00:00Z"},
+                {"driver_number": 2, "position": 2, "date": "2026-08-15T15:00:00Z"},
+            ],
+            f"{base}/laps?session_key=99": [
+                {"driver_number": 1, "lap_number": 12, "lap_duration": 80.0, "date_start": "2026-08-15T14:59:30Z"},
+            ],
+            f"{base}/intervals?session_key=99": [
+                {"driver_number": 2, "gap_to_leader": 1.5, "date": "2026-08-15T15:00:00Z"},
+            ],
+            f"{base}/race_control?session_key=99": [
+                {"message": "SAFETY CAR DEPLOYED", "date": "2026-08-15T14:30:00Z"},
+            ],
+        }
+    )
+    source = LiveRacingSource(client, now=lambda: now, clock=lambda: now.timestamp())
+
+    source.fetch(_settings(f1=True, indycar=False))
+    client.urls.clear()
+    game = source.fetch(_settings(f1=True, indycar=False))["content"][0]
+
+    assert [driver["abbr"] for driver in game["f1"]["drivers"]] == ["SEC", "LED"]
+    assert game["f1"]["lap"] == 13
+    assert game["f1"]["flag"] == "SAFETY CAR"
+    assert not any("/drivers?" in url for url in client.urls)
+    assert all("&date" in url for url in client.urls if "/sessions?" not in url and "espn" not in url)
+
+
 def test_indycar_polls_the_official_timing_blob_and_driver_feed() -> None:
     now = datetime(2026, 8, 15, 15, 0, tzinfo=timezone.utc)
     client = JsonFixture(
@@ -122,6 +182,8 @@ def test_indycar_polls_the_official_timing_blob_and_driver_feed() -> None:
     assert game["indycar"]["drivers"][0]["team_logo"] == "plate-1"
     assert game["indycar"]["drivers"][0]["gap"] == "Leader"
     assert game["indycar"]["drivers"][1]["gap"] == "+1.2"
+    timing_url = next(url for url in client.urls if "timingscoring-ris.json" in url)
+    assert timing_url.endswith(f"?_={int(now.timestamp() * 1000)}")
 
     normalized = RacingProvider(source).fetch(_settings(f1=False, indycar=True))
     assert normalized.content[0].family == "racing"
@@ -129,6 +191,54 @@ def test_indycar_polls_the_official_timing_blob_and_driver_feed() -> None:
     assert normalized.content[0].data["sport"] == "indycar"
 
 
+def test_indycar_refetch_rebuilds_only_drivers_whose_rows_changed(monkeypatch) -> None:
+    from sports_ticker.providers import racing_live
+
+    built = []
+    build = racing_live._indycar_driver
+
+    def counting_build(item, *args):
+        built.append(item["no"])
+        return build(item, *args)
+
+    monkeypatch.setattr(racing_live, "_indycar_driver", counting_build)
+    now = [datetime(2026, 8, 15, 15, 0, tzinfo=timezone.utc)]
+    items = [
+        {"no": "1", "firstName": "One", "lastName": "Driver", "rank": 1, "laps": 12, "diff": "0.000.00"},
+        {"no": "2", "firstName": "Two", "lastName": "Driver", "rank": 2, "laps": 12, "diff": "+1.2"},
+    ]
+    client = JsonFixture(
+        {
+            "https://indycar.blob.core.windows.net/racecontrol/timingscoring-ris.json": {
+                "timing_results": {
+                    "heartbeat": {
+                        "Series": "I",
+                        "EventID": "indy-event",
+                        "eventName": "Test Grand Prix at Road America",
+                        "SessionType": "R",
+                        "SessionName": "Race",
+                        "SessionStatus": "LIVE",
+                        "currentFlag": "GREEN",
+                    },
+                    "Item": items,
+                }
+            },
+            "https://indycar.blob.core.windows.net/racecontrol/driversfeed.json": {"drivers": {"driver": []}},
+            "https://api.open-meteo.com/v1/forecast": {"current": {}},
+        }
+    )
+    source = LiveRacingSource(client, now=lambda: now[0], clock=lambda: now[0].timestamp())
+
+    first = source.fetch(_settings(f1=False, indycar=True))["content"][0]["indycar"]["drivers"]
+    items[1] = {**items[1], "laps": 13, "diff": "+0.9"}
+    now[0] += timedelta(seconds=10)
+    second = source.fetch(_settings(f1=False, indycar=True))["content"][0]["indycar"]["drivers"]
+
+    assert built == ["1", "2", "2"]
+    assert second[0] == first[0]
+    assert second[1]["gap"] == "+0.9"
+
+
 def test_indycar_race_leader_sets_leader_gap_when_diff_is_present() -> None:
     item = {
         "rank": 1,
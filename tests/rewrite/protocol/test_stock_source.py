@@ -0,0 +1,66 @@
+"""Verify quota-paced, demand-ordered Finnhub quote refreshes."""
+
+import json
+import threading
+
+import pytest
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlsplit
+
+from sports_ticker.domain import DisplaySettings
+from sports_ticker.markets import MARKET_GROUPS
+from sports_ticker.providers.live_sources import FinnhubStockSource
+
+
+def test_stock_refresh_spends_key_quota_evenly_on_displayed_groups_first(
+    monkeypatch, tmp_path
+) -> None:
+    monkeypatch.setenv("FINNHUB_API_KEY", "key-a")
+    for index in range(1, 6):
+        monkeypatch.delenv(f"FINNHUB_KEY_{index}", raising=False)
+    wall = datetime(2026, 10, 14, 15, 0, tzinfo=timezone.utc).timestamp()
+    elapsed = [0.0]
+    calls = []
+
+    class QuoteClient:
+        def get_json(self, url, *, timeout):
+            del timeout
+            query = parse_qs(urlsplit(url).query)
+            calls.append((elapsed[0], query["symbol"][0], query["token"][0]))
+            return {"c": 100.0, "d": 1.0, "dp": 1.0, "pc": 99.0, "t": wall}
+
+    def sleeper(seconds):
+        elapsed[0] += seconds
+
+    source = FinnhubStockSource(
+        QuoteClient(),
+        cache_path=tmp_path / "stocks.json",
+        clock=lambda: wall,
+        monotonic_clock=lambda: elapsed[0],
+        sleeper=sleeper,
+        refresh_seconds=30.0,
+        calls_per_minute=6.0,
+    )
+    source.fetch(DisplaySettings(active_sports={"stock_energy": True}))
+    for thread in threading.enumerate():
+        if thread.name == "ticker-stock-refresh":
+            thread.join(5)
+
+    energy = next(group for group in MARKET_GROUPS if group.id == "stock_energy")
+    assert calls == [
+        (0.0, energy.symbols[0], "key-a"),
+        (10.0, energy.symbols[1], "key-a"),
+        (20.0, energy.symbols[2], "key-a"),
+        (30.0, energy.symbols[3], "key-a"),
+    ]
+    assert sorted(json.loads((tmp_path / "stocks.json").read_text())["quotes"]) == sorted(
+        energy.symbols[:4]
+    )
+
+
+def test_stock_quota_rejects_invalid_rates_by_name(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("FINNHUB_CALLS_PER_MINUTE", "fast")
+    with pytest.raises(ValueError, match="FINNHUB_CALLS_PER_MINUTE must be a finite positive rate"):
+        FinnhubStockSource(cache_path=tmp_path / "stocks.json")
+    with pytest.raises(ValueError, match="calls_per_minute must be a finite positive rate"):
+        FinnhubStockSource(cache_path=tmp_path / "stocks.json", calls_per_minute=0)
@@ -0,0 +1,57 @@
+"""Test bounded, state-aware, persistent match-detail caching."""
+
+from sports_ticker.providers.detail_cache import MatchDetailCache
+
+
+def test_detail_cache_expires_by_state_evicts_by_use_and_survives_restart(tmp_path) -> None:
+    clock = [1_000.0]
+    path = tmp_path / "details.sqlite3"
+    cache = MatchDetailCache(path, max_entries=2, clock=lambda: clock[0])
+    cache.set("final", "post", {"revision": 1})
+    cache.set("live", "in", {"revision": 2})
+
+    assert cache.get("live", "half") == {"revision": 2}
+    assert cache.get("final", "post") == {"revision": 1}
+    cache.set("scheduled", "pre", {"revision": 3})
+    assert cache.get("live", "in") is None
+
+    clock[0] += 1_800.0
+    assert cache.get("scheduled", "pre") is None
+    assert cache.latest("scheduled") == {"revision": 3}
+    assert cache.get("final", "post") == {"revision": 1}
+    assert cache.get("final", "in") is None
+    assert dict(cache.stats()) == {
+        "hits": 3,
+        "misses": 3,
+        "evictions": 1,
+        "restored": 0,
+        "entries": 2,
+    }
+    cache.close()
+
+    restarted = MatchDetailCache(path, max_entries=2, clock=lambda: clock[0])
+    assert restarted.get("final", "post") == {"revision": 1}
+    assert restarted.latest("scheduled") is None
+    assert restarted.stats()["restored"] == 1
+    restarted.close()
+
+
+def test_detail_cache_writes_live_details_only_to_clear_a_stored_entry(tmp_path) -> None:
+    path = tmp_path / "details.sqlite3"
+    cache = MatchDetailCache(path, clock=lambda: 1_000.0)
+    statements = []
+    cache._database.set_trace_callback(statements.append)
+
+    cache.set("live", "in", {"revision": 1})
+    cache.set("live", "half", {"revision": 2})
+    assert statements == []
+
+    cache.set("scheduled", "pre", {"revision": 3})
+    cache.set("scheduled", "in", {"revision": 4})
+    cache.set("scheduled", "in", {"revision": 5})
+    assert sum(statement.startswith("DELETE") for statement in statements) == 1
+    cache.close()
+
+    restarted = MatchDetailCache(path, clock=lambda: 1_000.0)
+    assert restarted.latest("scheduled") is None
+    restarted.close()
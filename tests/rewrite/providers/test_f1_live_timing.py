@@ -0,0 +1,131 @@
+"""Test the streamed F1 live timing session and its replay stand-in."""
+
+import json
+import time
+
+from sports_ticker.domain import DisplaySettings
+from sports_ticker.providers.f1_live_timing import ReplayTimingFeed, StreamingRacingSource
+
+
+class IndyCarOnly:
+    def __init__(self) -> None:
+        self.settings = []
+
+    def fetch(self, settings):
+        self.settings.append(settings)
+        return {"content": [{"id": "indy", "sport": "indycar"}]}
+
+
+def _feed(topic, data):
+    return {"C": "d-1", "M": [{"H": "Streaming", "M": "feed", "A": [topic, data, "2026-08-15T15:00:00Z"]}]}
+
+
+def test_streamed_session_applies_recorded_deltas_and_signals_headline_changes(tmp_path) -> None:
+    """Replay a recorded feed into one F1 record and wake on flag and lead changes."""
+
+    recording = [
+        {
+            "R": {
+                "SessionInfo": {"Key": 9999, "Name": "Race", "Meeting": {"Name": "Canadian Grand Prix"}},
+                "SessionStatus": {"Status": "Started"},
+                "TrackStatus": {"Status": "1", "Message": "AllClear"},
+                "LapCount": {"CurrentLap": 12, "TotalLaps": 70},
+                "DriverList": {
+                    "1": {"Tla": "VER", "FullName": "Max VERSTAPPEN", "TeamName": "Red Bull Racing"},
+                    "4": {"Tla": "NOR", "FullName": "Lando NORRIS", "TeamName": "McLaren"},
+                },
+                "TimingData": {
+                    "Lines": {
+                        "1": {"Position": "1", "IntervalToPositionAhead": {"Value": ""}},
+                        "4": {"Position": "2", "IntervalToPositionAhead": {"Value": "+1.234"}},
+                    }
+                },
+            },
+            "I": "1",
+        },
+        _feed("Heartbeat", {"Utc": "2026-08-15T15:00:01Z"}),
+        _feed("TrackStatus", {"Status": "4", "Message": "SCDeployed"}),
+        _feed("TimingData", {"Lines": {"4": {"Position": "1"}, "1": {"Position": "2", "IntervalToPositionAhead": {"Value": "+0.412"}}}}),
+        _feed("LapCount", {"CurrentLap": 13}),
+    ]
+    path = tmp_path / "race.jsonl"
+    path.write_text("\n".join(json.dumps(message) for message in recording), encoding="utf-8")
+    fallback = IndyCarOnly()
+    source = StreamingRacingSource(fallback, ReplayTimingFeed(path), reconnect_seconds=60.0)
+    changes = []
+
+    source.start(on_change=lambda: changes.append(source.session_record()["f1"]["flag"]))
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        record = source.session_record()
+        if record is not None and record["f1"]["lap"] == 13:
+            break
+        time.sleep(0.01)
+    source.close()
+
+    result = source.fetch(DisplaySettings(active_sports={"f1": True, "indycar": True}))
+    indy, f1 = result["content"]
+    assert indy["sport"] == "indycar"
+    assert fallback.settings[-1].active_sports["f1"] is False
+    assert f1["state"] == "in"
+    assert f1["status"] == "Lap 13/70"
+    assert f1["f1"]["flag"] == "SAFETY CAR"
+    assert [(driver["abbr"], driver["gap"]) for driver in f1["f1"]["drivers"]] == [
+        ("NOR", "Leader"),
+        ("VER", "+0.412s"),
+    ]
+    assert changes == ["GREEN", "SAFETY CAR", "SAFETY CAR"]
+    assert source.session_record() is f1
+
+
+def test_streamed_session_reports_pre_session_feed_failures_and_closes_the_feed() -> None:
+    """Show an inactive session as upcoming, surface a dropped feed, and close it."""
+
+    snapshot = {
+        "R": {
+            "SessionInfo": {"Key": 9998, "Name": "Qualifying", "Meeting": {"Name": "Canadian Grand Prix"}},
+            "SessionStatus": {"Status": "Inactive"},
+            "TrackStatus": {"Status": "1"},
+        }
+    }
+
+    class DroppingFeed:
+        def __init__(self) -> None:
+            self.closed = False
+
+        def messages(self):
+            yield json.dumps(snapshot)
+            raise ConnectionError("stream reset")
+
+        def close(self) -> None:
+            self.closed = True
+
+    feed = DroppingFeed()
+    source = StreamingRacingSource(IndyCarOnly(), feed, reconnect_seconds=60.0)
+    source.start()
+    deadline = time.monotonic() + 5
+    result = source.fetch(DisplaySettings())
+    while "health" not in result and time.monotonic() < deadline:
+        time.sleep(0.01)
+        result = source.fetch(DisplaySettings())
+    source.close()
+
+    f1 = result["content"][-1]
+    assert (f1["state"], f1["status"], f1["f1"]["flag"]) == ("pre", "Scheduled", "WHITE")
+    assert result["health"] == {"provider": "racing", "healthy": False, "error": "f1: stream reset"}
+    assert feed.closed is True
+
+
+def test_replay_feed_resumes_after_a_reconnect_and_stops_at_the_end(tmp_path) -> None:
+    """Never replay consumed frames when the stream reconnects."""
+
+    path = tmp_path / "race.jsonl"
+    path.write_text("first\n\nsecond\nthird\n", encoding="utf-8")
+    feed = ReplayTimingFeed(path)
+
+    dropped = feed.messages()
+    assert next(dropped) == "first"
+    dropped.close()
+
+    assert list(feed.messages()) == ["second", "third"]
+    assert list(feed.messages()) == []
@@ -0,0 +1,142 @@
+"""Regression tests for the pooled provider HTTP transport."""
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Event, Thread
+
+import pytest
+
+from sports_ticker.providers.http import (
+    DecodedResponseCache,
+    JsonHttpError,
+    PooledHttpTransport,
+    PooledJsonHttpClient,
+    SingleFlightJsonHttpClient,
+)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/etag" and self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/scores?league=nfl")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if self.path == "/etag":
+            self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        del format, args
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pooled_client_reuses_one_keep_alive_connection(server_url) -> None:
+    """Serve repeated requests to one host over a single handshake."""
+
+    transport = PooledHttpTransport(max_per_host=2)
+    client = PooledJsonHttpClient(transport)
+    try:
+        assert client.get_json(f"{server_url}/scores", timeout=5) == {"path": "/scores"}
+        assert client.get_json(f"{server_url}/moved", timeout=5) == {
+            "path": "/scores?league=nfl"
+        }
+        with pytest.raises(JsonHttpError, match="HTTP 404"):
+            client.get_json(f"{server_url}/missing", timeout=5)
+
+        stats = transport.stats()
+        assert stats["requests"] == 4
+        assert stats["handshakes"] == 1
+        assert stats["reused"] == 3
+        assert stats["idle"] == 1
+    finally:
+        transport.close()
+    assert transport.stats()["idle"] == 0
+
+
+def test_cached_client_reuses_decoded_value_for_unchanged_responses(server_url) -> None:
+    """Return the earlier decoded value on a 304 or a byte-identical body."""
+
+    transport = PooledHttpTransport()
+    cache = DecodedResponseCache(max_entries=1)
+    client = PooledJsonHttpClient(transport, cache=cache)
+    try:
+        first = client.get_json(f"{server_url}/etag", timeout=5)
+        assert client.get_json(f"{server_url}/etag", timeout=5) is first
+
+        other = client.get_json(f"{server_url}/static", timeout=5)
+        assert client.get_json(f"{server_url}/static", timeout=5) is other
+        assert client.get_json(f"{server_url}/etag", timeout=5) == first
+    finally:
+        transport.close()
+
+    assert dict(cache.stats()) == {
+        "hits": 1,
+        "not_modified": 1,
+        "misses": 3,
+        "evictions": 2,
+        "entries": 1,
+    }
+
+
+def test_single_flight_shares_concurrent_requests_and_recent_results() -> None:
+    """Send one upstream request for concurrent callers of one URL."""
+
+    calls = []
+    started = Event()
+    release = Event()
+    clock = [0.0]
+
+    class SlowClient:
+        def get_json(self, url, *, timeout):
+            calls.append(url)
+            started.set()
+            release.wait(timeout)
+            return {"calls": len(calls)}
+
+    client = SingleFlightJsonHttpClient(SlowClient(), ttl_seconds=1.0, clock=lambda: clock[0])
+    results = []
+    leader = Thread(target=lambda: results.append(client.get_json("https://x/a", timeout=5)))
+    leader.start()
+    assert started.wait(5)
+    follower = Thread(target=lambda: results.append(client.get_json("https://x/a", timeout=5)))
+    follower.start()
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert results == [{"calls": 1}, {"calls": 1}]
+    assert client.get_json("https://x/a", timeout=5) == {"calls": 1}
+    clock[0] = 1.0
+    assert client.get_json("https://x/a", timeout=5) == {"calls": 2}
+    assert calls == ["https://x/a", "https://x/a"]
@@ -1,7 +1,12 @@
 """Test score alert tracking, detail enrichment, and followed teams filtering."""
 
-from sports_ticker.domain.models import DisplaySettings
-from sports_ticker.providers.score_alerts import ScoreAlertTracker, alerts_for_settings
+from sports_ticker.domain.models import ContentItem, DisplaySettings
+from sports_ticker.providers.contracts import ProviderResult
+from sports_ticker.providers.score_alerts import (
+    ScoreAlertTracker,
+    alerts_for_settings,
+    with_score_alerts,
+)
 
 
 def test_score_alert_enrichment_details() -> None:
@@ -75,3 +80,42 @@ def test_score_alerts_filtering_and_team_matching() -> None:
     matched_mls = alerts_for_settings(raw_alerts, settings_mls)
     assert len(matched_mls) == 1
     assert matched_mls[0]["team_abbr"] == "SEA"
+
+
+def test_shared_tracker_detects_once_and_filters_per_ticker() -> None:
+    clock = [100.0]
+    tracker = ScoreAlertTracker(clock=lambda: clock[0])
+    nhl = {"kind": "scoreboard", "id": "g1", "sport": "nhl", "state": "in", "home_abbr": "NYR", "away_abbr": "BOS", "home_score": 0, "away_score": 0}
+    mls = {"kind": "scoreboard", "id": "soc-1", "sport": "soccer_mls", "state": "in", "home_abbr": "SEA", "away_abbr": "VAN", "home_score": 0, "away_score": 0}
+    tracker.ingest([nhl, mls])
+    tracker.ingest([mls])
+
+    clock[0] = 110.0
+    scored = {**nhl, "home_score": 1}
+    tracker.ingest([scored, mls])
+    tracker.ingest([scored])
+    assert [alert["id"] for alert in tracker.recent()] == ["g1:1-0:home"]
+
+    item = ContentItem(id="g1", data={key: value for key, value in scored.items() if key not in {"kind", "id"}})
+    live = DisplaySettings(mode="sports", my_teams=("nhl:nyr",))
+    delayed = DisplaySettings(mode="sports", my_teams=("nhl:nyr",), live_delay_mode=True, live_delay_seconds=30.0)
+    assert len(with_score_alerts(ProviderResult(content=(item,)), live, tracker).alerts) == 1
+    assert with_score_alerts(ProviderResult(content=(item,)), delayed, tracker).alerts == ()
+    assert with_score_alerts(ProviderResult(), live, tracker).alerts == ()
+
+    clock[0] = 145.0
+    assert len(with_score_alerts(ProviderResult(content=(item,)), delayed, tracker).alerts) == 1
+
+
+def test_out_of_order_scoreboard_slices_alert_each_score_once() -> None:
+    tracker = ScoreAlertTracker(clock=lambda: 100.0)
+    game = {"kind": "scoreboard", "id": "g1", "sport": "nhl", "state": "in", "home_abbr": "NYR", "away_abbr": "BOS", "home_score": 0, "away_score": 0}
+    newer = {**game, "home_score": 1}
+
+    tracker.ingest([game])
+    tracker.ingest([newer])
+    tracker.ingest([game])
+    tracker.ingest([newer])
+    tracker.ingest([{**newer, "away_score": 1}])
+
+    assert [alert["id"] for alert in tracker.recent()] == ["g1:1-0:home", "g1:1-1:away"]
@@ -0,0 +1,32 @@
+"""Test bounded, key-scoped stale provider results."""
+
+from sports_ticker.domain import DisplaySettings
+from sports_ticker.providers.contracts import ProviderResult
+from sports_ticker.providers.stale_cache import SettingsResultCache
+
+
+def test_stale_cache_shares_provider_keys_and_evicts_by_use_and_age() -> None:
+    clock = [0.0]
+    cache = SettingsResultCache(
+        lambda settings: settings.timezone,
+        max_entries=2,
+        max_age=60.0,
+        clock=lambda: clock[0],
+    )
+    new_york = ProviderResult()
+    cache.set(DisplaySettings(timezone="America/New_York"), new_york)
+    cache.set(DisplaySettings(timezone="Europe/London"), ProviderResult())
+
+    assert cache.get(DisplaySettings(timezone="America/New_York", my_teams=("nfl:dal",))) is new_york
+    cache.set(DisplaySettings(timezone="Asia/Tokyo"), ProviderResult())
+    assert cache.get(DisplaySettings(timezone="Europe/London")) is None
+
+    clock[0] = 60.0
+    assert cache.get(DisplaySettings(timezone="America/New_York")) is None
+    assert dict(cache.stats()) == {
+        "hits": 1,
+        "misses": 2,
+        "evictions": 1,
+        "expirations": 1,
+        "entries": 1,
+    }
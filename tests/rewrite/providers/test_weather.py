@@ -0,0 +1,44 @@
+"""Test shared, concurrent Open-Meteo weather fetches."""
+
+from threading import Event, Lock
+
+from sports_ticker.domain import DisplaySettings
+from sports_ticker.providers.weather import OpenMeteoWeatherProvider
+
+
+def test_nearby_tickers_share_one_concurrent_forecast_and_aqi_fetch() -> None:
+    calls = []
+    calls_lock = Lock()
+    aqi_started = Event()
+    clock = [0.0]
+
+    class WeatherClient:
+        def get_json(self, url, *, timeout):
+            with calls_lock:
+                calls.append(url)
+            if "air-quality" in url:
+                aqi_started.set()
+                return {"current": {"us_aqi": 42}}
+            assert aqi_started.wait(timeout)
+            return {"current": {"temperature_2m": 71.4, "weather_code": 0}, "daily": {}}
+
+    provider = OpenMeteoWeatherProvider(WeatherClient(), monotonic_clock=lambda: clock[0])
+    try:
+        downtown = provider.fetch(
+            DisplaySettings(weather_lat=40.7128, weather_lon=-74.0060, weather_city="NYC")
+        )
+        nearby = provider.fetch(
+            DisplaySettings(weather_lat=40.7150, weather_lon=-74.0030, weather_city="Tribeca")
+        )
+        assert len(calls) == 2
+        assert all("latitude=40.7&longitude=-74.0" in url for url in calls)
+        assert downtown.health.healthy and nearby.health.healthy
+        assert nearby.content[0].data["city"] == "Tribeca"
+        assert nearby.content[0].data["aqi"] == 42
+
+        clock[0] = 900.0
+        provider.fetch(DisplaySettings(weather_lat=40.7128, weather_lon=-74.0060))
+        assert len(calls) == 3
+        assert "air-quality" not in calls[-1]
+    finally:
+        provider.close()